@@ -0,0 +1,72 @@
+"""
+Compares flatten_dict & unflatten_dict with the previous recursive / regular-expression-based implementations on large
+machine-generated nested configurations.
+
+Usage: python -m benchmarks.benchmark_flatten [--branching N] [--depth N]
+"""
+import argparse
+import re
+import time
+
+from ext_argparse.argproc import flatten_dict, unflatten_dict
+
+
+def legacy_unflatten_dict(dictionary: dict):
+    dict_out = {}
+    path_word_pattern = re.compile(r'(?:^|[.])(\w+)')
+    for key, value in dictionary.items():
+        path_words = path_word_pattern.findall(key)
+        current_level_dict = dict_out
+        for word in path_words[:-1]:
+            if word not in current_level_dict:
+                current_level_dict[word] = {}
+            current_level_dict = current_level_dict[word]
+        current_level_dict[path_words[-1]] = value
+    return dict_out
+
+
+def legacy_flatten_dict(dictionary: dict):
+    dict_out = {}
+    for key, value in dictionary.items():
+        if type(value) == dict:
+            flattened_sub_dict = legacy_flatten_dict(value)
+            for sub_key, sub_value in flattened_sub_dict.items():
+                dict_out[key + "." + sub_key] = sub_value
+        else:
+            dict_out[key] = value
+    return dict_out
+
+
+def generate_nested_dict(branching: int, depth: int) -> dict:
+    if depth == 0:
+        return {f"parameter_{i_leaf:d}": i_leaf for i_leaf in range(branching)}
+    return {f"group_{i_group:d}": generate_nested_dict(branching, depth - 1) for i_group in range(branching)}
+
+
+def time_call(function, argument):
+    start = time.perf_counter()
+    result = function(argument)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--branching", type=int, default=10)
+    parser.add_argument("--depth", type=int, default=5, help="Nesting depth; key count is branching^(depth+1).")
+    args = parser.parse_args()
+
+    nested = generate_nested_dict(args.branching, args.depth)
+    legacy_flatten_time, legacy_flat = time_call(legacy_flatten_dict, nested)
+    flatten_time, flat = time_call(flatten_dict, nested)
+    assert flat == legacy_flat
+    legacy_unflatten_time, legacy_nested = time_call(legacy_unflatten_dict, flat)
+    unflatten_time, unflattened = time_call(unflatten_dict, flat)
+    assert unflattened == legacy_nested == nested
+
+    print(f"key count: {len(flat):d}")
+    print(f"flatten_dict:   {flatten_time:.3f} s (previous implementation: {legacy_flatten_time:.3f} s)")
+    print(f"unflatten_dict: {unflatten_time:.3f} s (previous implementation: {legacy_unflatten_time:.3f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Compares memory use & construction time of the slotted Parameter class, which builds its help string lazily, with
+the previous dict-based implementation that built the full help string in its constructor.
+
+Usage: python -m benchmarks.benchmark_parameter_memory [--parameter_count N]
+"""
+import argparse
+import enum
+import time
+import tracemalloc
+
+from ext_argparse.parameter import Parameter
+
+from benchmarks.synthetic_schema import SyntheticColor
+
+
+class DictBasedParameter(object):
+    """ Replica of the Parameter implementation preceding the switch to __slots__, for reference. """
+    setting_file_location_wildcard = '!settings_file_location'
+
+    def __init__(self, default=None, nargs='?', arg_type=str, action='store', arg_help="Documentation N/A",
+                 console_only=False, required=False, shorthand=None, setting_file_location=False, positional=False):
+        self.default = default
+        self.required = required
+        self.console_only = console_only
+        self.nargs = nargs
+        self.type = arg_type
+        self.action = action
+        self.argument = None
+        if setting_file_location:
+            self.help = arg_help + ("| If set to '" + Parameter.setting_file_location_wildcard + "' and a " +
+                                    " settings file is provided, will be set to the location of the settings file.")
+        else:
+            self.help = arg_help
+        self.setting_file_location = setting_file_location
+        self.shorthand = shorthand
+        self.value_map = None
+        if arg_type == "bool_flag" and positional:
+            raise ValueError("arg_type='bool_flag' and positional=True cannot be combined.")
+        self.positional = positional
+
+        if type(self.type) == enum.EnumMeta:
+            self.value_map = self.type._member_map_
+            self.help = arg_help + "| Can be set to one of: " + str(list(self.value_map.keys()))
+
+
+def create_parameters(parameter_class, parameter_count: int) -> list:
+    parameters = []
+    for i_parameter in range(parameter_count):
+        if i_parameter % 2 == 0:
+            parameters.append(parameter_class(default=SyntheticColor.RED, arg_type=SyntheticColor,
+                                              arg_help=f"Synthetic enum parameter number {i_parameter:d}."))
+        else:
+            parameters.append(parameter_class(default=i_parameter * 0.5, arg_type=float,
+                                              arg_help=f"Synthetic floating-point parameter number {i_parameter:d}."))
+    return parameters
+
+
+def measure(parameter_class, parameter_count: int):
+    tracemalloc.start()
+    start = time.perf_counter()
+    parameters = create_parameters(parameter_class, parameter_count)
+    duration = time.perf_counter() - start
+    allocated_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parameters
+    return allocated_bytes, duration
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--parameter_count", type=int, default=50000)
+    args = parser.parse_args()
+
+    dict_bytes, dict_duration = measure(DictBasedParameter, args.parameter_count)
+    slotted_bytes, slotted_duration = measure(Parameter, args.parameter_count)
+
+    print(f"parameter count:        {args.parameter_count:d}")
+    print(f"dict-based Parameter:   {dict_bytes / args.parameter_count:.0f} bytes/parameter, "
+          f"{dict_duration:.4f} s total")
+    print(f"slotted Parameter:      {slotted_bytes / args.parameter_count:.0f} bytes/parameter, "
+          f"{slotted_duration:.4f} s total")
+    print(f"memory saving:          {100.0 * (1.0 - slotted_bytes / dict_bytes):.1f}%")
+
+
+if __name__ == "__main__":
+    main()
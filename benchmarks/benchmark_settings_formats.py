@@ -0,0 +1,44 @@
+"""
+Compares loading times of large generated settings files across all registered settings file formats whose
+dependencies are available.
+
+Usage: python -m benchmarks.benchmark_settings_formats [--group_count N] [--parameters_per_group N] [--repeat_count N]
+"""
+import argparse
+import os
+import tempfile
+import timeit
+
+from ext_argparse.argproc import load_settings_file, write_file_atomically
+from ext_argparse.formats import get_settings_file_format
+
+from benchmarks.benchmark_yaml_loading import generate_settings
+
+EXTENSIONS = (".yaml", ".json", ".toml", ".marshal", ".msgpack")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--group_count", type=int, default=400)
+    parser.add_argument("--parameters_per_group", type=int, default=200)
+    parser.add_argument("--repeat_count", type=int, default=3)
+    args = parser.parse_args()
+
+    settings = generate_settings(args.group_count, args.parameters_per_group)
+    with tempfile.TemporaryDirectory() as directory:
+        for extension in EXTENSIONS:
+            settings_path = os.path.join(directory, "settings" + extension)
+            settings_file_format = get_settings_file_format(settings_path)
+            try:
+                write_file_atomically(settings_path, settings_file_format.dumps(settings))
+                load_time = min(timeit.repeat(lambda: load_settings_file(settings_path),
+                                              number=1, repeat=args.repeat_count))
+            except ImportError as error:
+                print(f"{settings_file_format.name:<12s} skipped ({error!s})")
+                continue
+            file_size_mb = os.path.getsize(settings_path) / (1024 * 1024)
+            print(f"{settings_file_format.name:<12s} {load_time:.4f} s, {file_size_mb:.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
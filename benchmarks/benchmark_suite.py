@@ -0,0 +1,125 @@
+"""
+Times individual phases of ext_argparse usage on synthetic ParameterEnum hierarchies & reports the results as JSON.
+
+Phases: enum class creation (NestedEnumMeta.__new__), ArgumentProcessor construction (first, i.e. including schema
+compilation, and repeated), save_defaults, process_settings_file, process_arguments (with and without a settings
+file, and with the fast parser) and dump.
+
+Usage: python -m benchmarks.benchmark_suite [--width N] [--branching N] [--depth N] [--repeat_count N]
+       [--output results.json]
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, List
+
+from ext_argparse.argproc import ArgumentProcessor, process_arguments, process_settings_file, save_defaults, dump
+from ext_argparse.schema import compile_schema
+
+from benchmarks.synthetic_schema import make_parameter_enum, count_parameters
+
+
+def summarize(durations: List[float]) -> dict:
+    return {
+        "min_seconds": min(durations),
+        "mean_seconds": statistics.mean(durations),
+        "max_seconds": max(durations),
+        "repeat_count": len(durations)
+    }
+
+
+def time_call(function: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def generate_argv(parameter_enum) -> List[str]:
+    # override every tenth parameter on the command line
+    argv = []
+    for i_entry, entry in enumerate(compile_schema(parameter_enum).entries):
+        if i_entry % 10 != 0:
+            continue
+        if entry.is_bool_flag:
+            argv.append("--" + entry.path)
+        elif entry.is_enum:
+            argv.append(f"--{entry.path}=GREEN")
+        else:
+            argv.append(f"--{entry.path}={entry.parameter.default!s}")
+    return argv
+
+
+def run_benchmarks(width: int, branching: int, depth: int, repeat_count: int) -> dict:
+    phase_durations = {phase: [] for phase in (
+        "class_creation", "argument_processor_first_construction", "argument_processor_construction",
+        "save_defaults", "process_settings_file", "process_arguments", "process_arguments_with_settings_file",
+        "process_arguments_fast_parse", "dump"
+    )}
+    with tempfile.TemporaryDirectory() as directory:
+        settings_path = os.path.join(directory, "settings.yaml")
+        for _ in range(repeat_count):
+            start = time.perf_counter()
+            parameter_enum = make_parameter_enum(width, branching, depth)
+            phase_durations["class_creation"].append(time.perf_counter() - start)
+
+            phase_durations["argument_processor_first_construction"].append(
+                time_call(lambda: ArgumentProcessor(parameter_enum)))
+            phase_durations["argument_processor_construction"].append(
+                time_call(lambda: ArgumentProcessor(parameter_enum)))
+            phase_durations["save_defaults"].append(
+                time_call(lambda: save_defaults(parameter_enum, settings_path)))
+            phase_durations["process_settings_file"].append(
+                time_call(lambda: process_settings_file(parameter_enum, settings_path)))
+            argv = generate_argv(parameter_enum)
+            phase_durations["process_arguments"].append(
+                time_call(lambda: process_arguments(parameter_enum, "Synthetic benchmark.", argv=argv)))
+            phase_durations["process_arguments_with_settings_file"].append(
+                time_call(lambda: process_arguments(parameter_enum, "Synthetic benchmark.",
+                                                    argv=argv + [f"--settings_file={settings_path}"])))
+            phase_durations["process_arguments_fast_parse"].append(
+                time_call(lambda: process_arguments(parameter_enum, "Synthetic benchmark.", argv=argv,
+                                                    fast_parse=True)))
+            phase_durations["dump"].append(time_call(lambda: dump(parameter_enum, io.StringIO())))
+
+    return {
+        "configuration": {
+            "width": width,
+            "branching": branching,
+            "depth": depth,
+            "parameter_count": count_parameters(width, branching, depth)
+        },
+        "environment": {
+            "python_version": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform()
+        },
+        "phases": {phase: summarize(durations) for phase, durations in phase_durations.items()}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--width", type=int, default=20, help="Number of parameters per group.")
+    parser.add_argument("--branching", type=int, default=4, help="Number of nested groups per group.")
+    parser.add_argument("--depth", type=int, default=3, help="Number of nesting levels below the root.")
+    parser.add_argument("--repeat_count", type=int, default=3)
+    parser.add_argument("--output", type=str, default=None, help="JSON file to write results to (default: stdout).")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.width, args.branching, args.depth, args.repeat_count)
+    if args.output is None:
+        json.dump(results, sys.stdout, indent=4)
+        sys.stdout.write("\n")
+    else:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
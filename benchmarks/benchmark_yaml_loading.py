@@ -0,0 +1,62 @@
+"""
+Compares the round-trip and the safe (C-accelerated if available) settings file loaders on large generated
+settings files.
+
+Usage: python -m benchmarks.benchmark_yaml_loading [--group_count N] [--parameters_per_group N] [--repeat_count N]
+"""
+import argparse
+import os
+import tempfile
+import timeit
+
+from ruamel.yaml import YAML
+
+from ext_argparse.argproc import load_settings_file
+
+
+def generate_settings(group_count: int, parameters_per_group: int) -> dict:
+    settings = {}
+    for i_group in range(group_count):
+        group = {}
+        for i_parameter in range(parameters_per_group):
+            kind = i_parameter % 4
+            name = f"parameter_{i_parameter:d}"
+            if kind == 0:
+                group[name] = i_parameter * 7
+            elif kind == 1:
+                group[name] = i_parameter * 0.125
+            elif kind == 2:
+                group[name] = f"value_{i_group:d}_{i_parameter:d}"
+            else:
+                group[name] = i_parameter % 2 == 0
+        settings[f"group_{i_group:d}"] = group
+    return settings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--group_count", type=int, default=400)
+    parser.add_argument("--parameters_per_group", type=int, default=200)
+    parser.add_argument("--repeat_count", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        settings_path = os.path.join(directory, "settings.yaml")
+        yaml = YAML(typ='safe')
+        yaml.default_flow_style = False
+        with open(settings_path, 'w') as file:
+            yaml.dump(generate_settings(args.group_count, args.parameters_per_group), file)
+        file_size_mb = os.path.getsize(settings_path) / (1024 * 1024)
+
+        round_trip_time = min(timeit.repeat(lambda: load_settings_file(settings_path, round_trip=True),
+                                            number=1, repeat=args.repeat_count))
+        safe_time = min(timeit.repeat(lambda: load_settings_file(settings_path, round_trip=False),
+                                      number=1, repeat=args.repeat_count))
+
+    print(f"settings file size: {file_size_mb:.2f} MB")
+    print(f"round-trip loader:  {round_trip_time:.4f} s")
+    print(f"safe loader:        {safe_time:.4f} s ({round_trip_time / safe_time:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
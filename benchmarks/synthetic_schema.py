@@ -0,0 +1,69 @@
+"""
+Generation of synthetic ParameterEnum hierarchies of configurable size for benchmarking.
+"""
+import itertools
+from enum import Enum
+from typing import Type, Union
+
+from ext_argparse.param_enum import ParameterEnum, NestedEnumMeta
+from ext_argparse.parameter import Parameter
+
+
+class SyntheticColor(Enum):
+    RED = 0
+    GREEN = 1
+    BLUE = 2
+    CYAN = 3
+    MAGENTA = 4
+    YELLOW = 5
+
+
+PARAMETER_KINDS = ("int", "float", "enum", "bool_flag")
+
+_class_counter = itertools.count()
+
+
+def make_parameter(kind: str, index: int, shorthand: str) -> Parameter:
+    # explicit shorthands avoid the collisions auto-generated acronyms would have for e.g. parameter_1 & parameter_10
+    if kind == "int":
+        return Parameter(default=index, arg_type=int, shorthand=shorthand,
+                         arg_help=f"Synthetic integer parameter number {index:d}.")
+    elif kind == "float":
+        return Parameter(default=index * 0.5, arg_type=float, shorthand=shorthand,
+                         arg_help=f"Synthetic floating-point parameter number {index:d}.")
+    elif kind == "enum":
+        return Parameter(default=SyntheticColor.RED, arg_type=SyntheticColor, shorthand=shorthand,
+                         arg_help=f"Synthetic enum parameter number {index:d}.")
+    elif kind == "bool_flag":
+        return Parameter(default=False, arg_type='bool_flag', action='store_true', shorthand=shorthand,
+                         arg_help=f"Synthetic boolean flag number {index:d}.")
+    raise ValueError("Unknown parameter kind: " + kind)
+
+
+def make_parameter_enum(width: int, branching: int, depth: int,
+                        shorthand_counter: Union[itertools.count, None] = None) -> Type[ParameterEnum]:
+    """
+    Generate a synthetic ParameterEnum hierarchy.
+    @param width: number of (leaf) parameters in each group, cycling through int, float, enum and bool_flag kinds
+    @param branching: number of nested groups within each group above the deepest level
+    @param depth: number of nesting levels below the root group
+    @param shorthand_counter: counter used to generate unique shorthands, a new one is started if None
+    @return: the root ParameterEnum class
+    """
+    if shorthand_counter is None:
+        shorthand_counter = itertools.count()
+    class_name = f"SyntheticParameters{next(_class_counter):d}"
+    bases = (ParameterEnum,)
+    class_dict = NestedEnumMeta.__prepare__(class_name, bases)
+    for i_parameter in range(width):
+        kind = PARAMETER_KINDS[i_parameter % len(PARAMETER_KINDS)]
+        class_dict[f"{kind}_parameter_{i_parameter:d}"] = \
+            make_parameter(kind, i_parameter, f"x{next(shorthand_counter):d}")
+    if depth > 0:
+        for i_group in range(branching):
+            class_dict[f"group_{i_group:d}"] = make_parameter_enum(width, branching, depth - 1, shorthand_counter)
+    return NestedEnumMeta(class_name, bases, class_dict)
+
+
+def count_parameters(width: int, branching: int, depth: int) -> int:
+    return width * sum(branching ** level for level in range(depth + 1))
@@ -19,6 +19,61 @@ __license__ = "Apache License Version 2.0"
 __js__ = None
 __js_url__ = None
 
-from ext_argparse.argproc import process_arguments, save_defaults, dump, add_comments_from_help, process_settings_file
+import importlib
+
 from ext_argparse.param_enum import ParameterEnum
 from ext_argparse.parameter import Parameter
+
+# Functionality relying on argparse & ruamel.yaml is imported lazily, on first attribute access, so that importing the
+# package just to define a ParameterEnum or to read parameter values stays cheap.
+_lazy_attribute_modules = {
+    "process_arguments": "ext_argparse.argproc",
+    "save_defaults": "ext_argparse.argproc",
+    "dump": "ext_argparse.argproc",
+    "add_comments_from_help": "ext_argparse.argproc",
+    "process_settings_file": "ext_argparse.argproc",
+    "SettingsFileCache": "ext_argparse.settings_cache",
+    "SettingsSnapshot": "ext_argparse.snapshot",
+    "create_settings_snapshot": "ext_argparse.snapshot",
+    "bind_settings": "ext_argparse.snapshot",
+    "get_bound_settings": "ext_argparse.snapshot",
+    "install_settings": "ext_argparse.snapshot",
+    "get_installed_settings": "ext_argparse.snapshot",
+    "process_settings_files": "ext_argparse.batch",
+    "SettingsFileResult": "ext_argparse.batch",
+    "SettingsFileWatcher": "ext_argparse.watcher",
+    "read_environment_values": "ext_argparse.environment",
+    "environment_variable_name": "ext_argparse.schema",
+    "SettingsValueError": "ext_argparse.conversion",
+    "generate_bash_completion": "ext_argparse.completion",
+    "generate_zsh_completion": "ext_argparse.completion",
+    "generate_completion_script": "ext_argparse.completion",
+    "SettingsFileFormat": "ext_argparse.formats",
+    "register_settings_file_format": "ext_argparse.formats",
+    "get_settings_file_format": "ext_argparse.formats",
+    "resolve_interpolations": "ext_argparse.interpolation",
+    "InterpolationError": "ext_argparse.interpolation",
+    "ProcessingStats": "ext_argparse.profiling",
+    "add_stats_callback": "ext_argparse.profiling",
+    "remove_stats_callback": "ext_argparse.profiling",
+    "expand_sweep": "ext_argparse.sweep",
+    "write_sweep": "ext_argparse.sweep",
+    "SettingsFingerprint": "ext_argparse.fingerprint",
+    "compute_settings_fingerprint": "ext_argparse.fingerprint",
+    "canonicalize_settings": "ext_argparse.fingerprint",
+}
+
+__all__ = ["ParameterEnum", "Parameter"] + list(_lazy_attribute_modules.keys())
+
+
+def __getattr__(name):
+    module_name = _lazy_attribute_modules.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attribute = getattr(importlib.import_module(module_name), name)
+    globals()[name] = attribute
+    return attribute
+
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(_lazy_attribute_modules.keys()))
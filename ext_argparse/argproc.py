@@ -15,63 +15,113 @@
 #  ================================================================
 import io
 import sys
-from typing import Type, List, Union
-from io import StringIO
-import textwrap
-
-from ruamel.yaml.comments import CommentedMap
+from typing import Type, List, Union, Tuple, Iterable, Iterator, Callable, TYPE_CHECKING
 
 from ext_argparse.parameter import Parameter
 from ext_argparse.param_enum import ParameterEnum
+from ext_argparse.schema import compile_schema, SchemaEntry, ParameterSchema, generate_lc_acronym_from_snake_case
+from ext_argparse.snapshot import create_settings_snapshot, RootSettingsSnapshot
+from ext_argparse.environment import read_environment_values
+from ext_argparse.formats import get_settings_file_format, YamlSettingsFileFormat
+from ext_argparse.interpolation import resolve_interpolations, is_template, DeferredTemplate
+from ext_argparse.arrays import load_array_values, prepare_array_values_for_saving, is_sidecar_reference, \
+    sidecar_reference_prefix
+from ext_argparse.profiling import ProcessingStats, PhaseRecorder, start_recording, null_recorder
 import argparse
 import os.path
-import re
 import enum
-from ruamel.yaml import YAML
+import shutil
+import tempfile
+from collections import OrderedDict
 from pathlib import Path
 
+# ruamel.yaml is comparatively expensive to import, so it's only imported where it's actually used
+if TYPE_CHECKING:
+    from ruamel.yaml.comments import CommentedMap
+    from ext_argparse.settings_cache import SettingsFileCache
+
 
-def generate_lc_acronym_from_snake_case(snake_case_string: str) -> str:
-    return "".join([word_match[1] for word_match in re.findall(r"(:?^|_)(\w)", snake_case_string)])
+def __get_or_create_group(groups: dict, group_path: str) -> dict:
+    parent_path, _, name = group_path.rpartition(".")
+    parent = groups.get(parent_path)
+    if parent is None:
+        parent = __get_or_create_group(groups, parent_path)
+    group = parent.get(name)
+    if group is None:
+        group = parent[name] = {}
+    groups[group_path] = group
+    return group
 
 
-def unflatten_dict(dictionary: dict):
+def unflatten_items(items: Iterable[Tuple[str, object]]) -> dict:
+    """
+    Build a nested dictionary from (dotted path, value) pairs in a single pass. Nested dictionaries are looked up by
+    their full path prefix, so the cost per item does not grow with the nesting depth beyond splitting off the last
+    path word.
+    @param items: iterable of (dotted path, value) pairs, e.g. dict.items() or a generator
+    @return: the nested dictionary
+    """
     dict_out = {}
-    path_word_pattern = re.compile(r'(?:^|[.])(\w+)')
-    for key, value in dictionary.items():
-        path_words = path_word_pattern.findall(key)
-        current_level_dict = dict_out
-        # create necessary nesting based on the key
-        for word in path_words[:-1]:
-            if word not in current_level_dict:
-                current_level_dict[word] = {}
-            current_level_dict = current_level_dict[word]
-        current_level_dict[path_words[-1]] = value
+    groups = {"": dict_out}
+    for key, value in items:
+        parent_path, _, name = key.rpartition(".")
+        parent = groups.get(parent_path)
+        if parent is None:
+            parent = __get_or_create_group(groups, parent_path)
+        parent[name] = value
     return dict_out
 
 
-def flatten_dict(dictionary: Union[CommentedMap, dict]):
-    dict_out = {}
-    for key, value in dictionary.items():
-        if type(value) == dict or type(value) == CommentedMap:
-            flattened_sub_dict = flatten_dict(value)
-            for sub_key, sub_value in flattened_sub_dict.items():
-                dict_out[key + "." + sub_key] = sub_value
+def unflatten_dict(dictionary: dict) -> dict:
+    return unflatten_items(dictionary.items())
+
+
+def iter_flatten_dict(dictionary: dict) -> Iterator[Tuple[str, object]]:
+    """
+    Iterate over all the non-dictionary values of a nested dictionary, depth-first in insertion order.
+    Each path prefix is only built once per nested dictionary.
+    @param dictionary: the nested dictionary
+    @return: generator of (dotted path, value) pairs
+    """
+    stack = [("", iter(dictionary.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            path = prefix + key if prefix else key
+            if isinstance(value, dict):
+                stack.append((path + ".", iter(value.items())))
+                break
+            yield path, value
         else:
-            dict_out[key] = value
-    return dict_out
+            stack.pop()
 
 
-def nested_update(target_map: dict, value_updates: dict):
+def flatten_dict(dictionary: Union["CommentedMap", dict]) -> dict:
+    return dict(iter_flatten_dict(dictionary))
+
+
+def nested_update(target_map: dict, value_updates: dict) -> bool:
+    """
+    Update values in target_map from value_updates, only for keys that are already present in target_map.
+    Values that are equal (and of the same type) are left untouched, so that, e.g., formatting and comments for them
+    are preserved in round-trip YAML structures.
+    @return: whether anything in target_map was changed
+    """
+    changed = False
     for key, value in target_map.items():
         if key in value_updates:
+            new_value = value_updates[key]
             if isinstance(value, dict):
-                nested_update(value, value_updates[key])
-            else:
-                target_map[key] = value_updates[key]
+                if isinstance(new_value, dict):
+                    changed = nested_update(value, new_value) or changed
+            elif value != new_value or not isinstance(value, type(new_value)):
+                target_map[key] = new_value
+                changed = True
+    return changed
 
 
-def nested_dict_to_commented_map(dictionary: dict) -> CommentedMap:
+def nested_dict_to_commented_map(dictionary: dict) -> "CommentedMap":
+    from ruamel.yaml.comments import CommentedMap
     commented_map = CommentedMap(dictionary)
     for key, value in commented_map.items():
         if type(value) is dict:
@@ -79,6 +129,114 @@ def nested_dict_to_commented_map(dictionary: dict) -> CommentedMap:
     return commented_map
 
 
+def load_settings_file(settings_file: Union[str, Path], round_trip: bool = False):
+    """
+    Load a settings file, in the format matching its extension (see get_settings_file_format).
+    @param settings_file: path to the settings file
+    @param round_trip: when set, for YAML files, use the (slower) round-trip loader, which preserves comments &
+    formatting and is required whenever the loaded structure is to be written back to the file. Otherwise, use the safe
+    loader (C-accelerated if ruamel.yaml.clib is available), which produces plain dicts & lists.
+    @return: the loaded settings
+    """
+    return get_settings_file_format(settings_file).load(settings_file, round_trip)
+
+
+# key of the (top-level) settings file entry listing other settings files to use as lower layers under the file
+include_directive_key = "include"
+
+
+def __make_sidecar_references_absolute(settings_file: str, flat_values: dict) -> dict:
+    # sidecar file references are relative to the file they are in, which isn't known anymore once layers are merged
+    for key, value in flat_values.items():
+        if is_sidecar_reference(value):
+            flat_values[key] = sidecar_reference_prefix + os.path.join(
+                os.path.dirname(os.path.abspath(settings_file)), value[len(sidecar_reference_prefix):])
+    return flat_values
+
+
+def __load_and_flatten_settings_file(settings_file: str) -> dict:
+    settings = load_settings_file(settings_file)
+    return __make_sidecar_references_absolute(settings_file, flatten_dict(settings) if settings else {})
+
+
+def __make_known_settings_loader(schema: ParameterSchema) -> Callable[[str], dict]:
+    leaf_paths = schema.parameter_path_set | {include_directive_key}
+
+    def load_known_settings(settings_file: str) -> dict:
+        return __make_sidecar_references_absolute(settings_file, get_settings_file_format(settings_file).load_filtered(
+            settings_file, leaf_paths, schema.group_path_set))
+
+    return load_known_settings
+
+
+def __load_settings_layer(settings_file: str, settings_cache: Union[None, "SettingsFileCache"],
+                          loader: Callable[[str], dict]) -> dict:
+    if settings_cache is None:
+        return loader(settings_file)
+    return settings_cache.load(settings_file, loader)
+
+
+def __expand_settings_layers(settings_file: str, settings_cache: Union[None, "SettingsFileCache"],
+                             loader: Callable[[str], dict], layer_values: "OrderedDict[str, dict]",
+                             including_files: List[str]) -> None:
+    path = os.path.abspath(settings_file)
+    if path in including_files:
+        raise ValueError("Settings files include each other: " + " -> ".join(including_files[including_files.index(
+            path):] + [path]))
+    if path in layer_values:
+        # already included further down the stack
+        return
+    values = __load_settings_layer(path, settings_cache, loader)
+    includes = values.get(include_directive_key)
+    if includes:
+        if isinstance(includes, str):
+            includes = [includes]
+        if not isinstance(includes, list) or not all(isinstance(include, str) for include in includes):
+            raise ValueError(f"The '{include_directive_key:s}' entry in settings file {path:s} has to be a path or a "
+                             f"list of paths, got: {includes!r}")
+        including_files.append(path)
+        for include in includes:
+            include_path = os.path.join(os.path.dirname(path), os.path.expanduser(include))
+            if not os.path.isfile(include_path):
+                raise ValueError(f"Settings file not found at: {include_path:s} (included from {path:s})")
+            __expand_settings_layers(include_path, settings_cache, loader, layer_values, including_files)
+        including_files.pop()
+    layer_values[path] = values
+
+
+def __load_flattened_settings(settings_files: Union[str, List[str]],
+                              settings_cache: Union[None, "SettingsFileCache"],
+                              recorder: PhaseRecorder = null_recorder,
+                              schema: Union[None, ParameterSchema] = None) -> dict:
+    if isinstance(settings_files, (str, Path)):
+        settings_files = [settings_files]
+    if schema is not None and settings_cache is None:
+        # only load entries for parameters in the schema (cached entries have to be complete, since a cache may be
+        # shared between different ParameterEnum classes)
+        load_file = __make_known_settings_loader(schema)
+    else:
+        load_file = __load_and_flatten_settings_file
+    if recorder is null_recorder:
+        loader = load_file
+    else:
+        def loader(path: str) -> dict:
+            recorder.record_file_read(path)
+            return load_file(path)
+    # settings files included by a file (see include_directive_key) go right below it in the layer stack
+    layer_values = OrderedDict()
+    for settings_file in settings_files:
+        __expand_settings_layers(settings_file, settings_cache, loader, layer_values, [])
+    if settings_cache is not None and len(layer_values) > 1:
+        merged_values = settings_cache.load_layers(list(layer_values.keys()), loader)
+    else:
+        merged_values = {}
+        for values in layer_values.values():
+            merged_values.update(values)
+    merged_values.pop(include_directive_key, None)
+    recorder.add_loaded_keys(len(merged_values))
+    return merged_values
+
+
 class ArgumentProcessor(object):
     """
     A class for processing command-line arguments to a program.
@@ -86,13 +244,14 @@ class ArgumentProcessor(object):
 
     def __init__(self, parameter_enum: Type[ParameterEnum]):
         self.parameter_enum = parameter_enum
-        self.__generate_missing_shorthands()
-        self.setting_file_location_args = self.__get_setting_file_location_args()
+        self.schema = compile_schema(parameter_enum)
+        self.setting_file_location_args = self.schema.setting_file_location_paths
 
     # ================= SETTING FILE STORAGE ==========================================================================#
     settings_file = Parameter(None, '?', str, 'store',
                               "File (absolute or relative-to-execution path) where to save and/or " +
-                              "load settings for the program in YAML format.",
+                              "load settings for the program in YAML format (or JSON, TOML, etc., depending on " +
+                              "the file extension).",
                               console_only=True, required=False)
     save_settings = Parameter(False, '?', 'bool_flag', 'store_true',
                               "Save (or update) setting file.",
@@ -102,125 +261,60 @@ class ArgumentProcessor(object):
     save_settings_parameter_name = "save_settings"
     save_settings_shorthand = "-ss"
 
-    @staticmethod
-    def __get_setting_file_location_args_from_item(enum_entry: ParameterEnum, sfl_arg_collection: set, base_name=""):
-        if enum_entry.parameter.type == 'parameter_enum':
-            for sub_item in enum_entry.parameter:
-                ArgumentProcessor.__get_setting_file_location_args_from_item(sub_item, sfl_arg_collection,
-                                                                             base_name + enum_entry.name + ".")
-        elif enum_entry.parameter.setting_file_location:
-            sfl_arg_collection.add(base_name + enum_entry.name)
-
-    def __get_setting_file_location_args(self):
-        sfl_arg_collection = set()
-        for item in self.parameter_enum:
-            ArgumentProcessor.__get_setting_file_location_args_from_item(item, sfl_arg_collection)
-        return sfl_arg_collection
-
-    @staticmethod
-    def __add_shorthand_for_param_enum_item(enum_entry: ParameterEnum, base_acronym: str = "") -> None:
-        if enum_entry.parameter.type == 'parameter_enum':
-            sub_enum_acronym = generate_lc_acronym_from_snake_case(enum_entry.name)
-            for sub_item in enum_entry.parameter:
-                ArgumentProcessor.__add_shorthand_for_param_enum_item(sub_item, base_acronym + sub_enum_acronym + ".")
-        elif enum_entry.parameter.shorthand is None:
-            enum_entry.parameter.shorthand = base_acronym + generate_lc_acronym_from_snake_case(enum_entry.name)
-
-    def __generate_missing_shorthands(self):
-        for item in self.parameter_enum:
-            ArgumentProcessor.__add_shorthand_for_param_enum_item(item)
-
-    @staticmethod
-    def __add_to_defaults_dict(enum_entry: ParameterEnum, defaults_dict: dict, convert_enums_to_strings,
-                               base_name: str = ""):
-        if enum_entry.parameter.type == 'parameter_enum':
-            for sub_enum_item in enum_entry.parameter:
-                ArgumentProcessor.__add_to_defaults_dict(sub_enum_item, defaults_dict, convert_enums_to_strings,
-                                                         base_name + enum_entry.name + ".")
-        else:
-            if convert_enums_to_strings and isinstance(enum_entry.parameter.type, enum.EnumMeta):
-                defaults_dict[base_name + enum_entry.name] = enum_entry.parameter.default.name
-            else:
-                defaults_dict[base_name + enum_entry.name] = enum_entry.parameter.default
-
     def generate_defaults_dict(self, convert_enums_to_strings: bool = False) -> dict:
-        defaults_dict = {}
-        for item in self.parameter_enum:
-            ArgumentProcessor.__add_to_defaults_dict(item, defaults_dict, convert_enums_to_strings)
+        defaults_dict = self.schema.generate_defaults_dict(convert_enums_to_strings)
         defaults_dict[ArgumentProcessor.settings_file_parameter_name] = ArgumentProcessor.settings_file.default
         defaults_dict[ArgumentProcessor.save_settings_parameter_name] = ArgumentProcessor.save_settings.default
         return defaults_dict
 
-    @staticmethod
-    def __add_to_value_dict(enum_entry: ParameterEnum, value_dict: dict, convert_enums_to_strings, base_name: str = ""):
-        if enum_entry.parameter.type == 'parameter_enum':
-            for sub_enum_item in enum_entry.parameter:
-                ArgumentProcessor.__add_to_value_dict(sub_enum_item, value_dict, convert_enums_to_strings,
-                                                      base_name + enum_entry.name + ".")
-        else:
-            if convert_enums_to_strings and isinstance(enum_entry.parameter.type, enum.EnumMeta):
-                value_dict[base_name + enum_entry.name] = enum_entry.value.name
-            else:
-                value_dict[base_name + enum_entry.name] = enum_entry.value
-
     def generate_value_dict(self, convert_enums_to_strings: bool = False) -> dict:
-        value_dict = {}
-        for item in self.parameter_enum:
-            ArgumentProcessor.__add_to_value_dict(item, value_dict, convert_enums_to_strings)
-        return value_dict
+        return self.schema.generate_value_dict(convert_enums_to_strings)
 
     @staticmethod
-    def __add_parameter_enum_entry_to_parser(enum_entry: ParameterEnum,
-                                             parser: argparse.ArgumentParser, defaults: dict, console_only: bool,
-                                             base_name: str = "") \
-            -> None:
-        if enum_entry.parameter.type == 'parameter_enum':
-            for sub_enum_entry in enum_entry.parameter:
-                ArgumentProcessor.__add_parameter_enum_entry_to_parser(
-                    sub_enum_entry, parser, defaults, console_only,
-                    base_name + enum_entry.name + "."
-                )
-        elif (enum_entry.parameter.console_only and console_only) or \
-                (not enum_entry.parameter.console_only and not console_only):
-            # TODO: transition to match statement here when the Python requirements is at or above 3.10
-            if enum_entry.parameter.type == 'bool_flag':
-                parser.add_argument('--' + base_name + enum_entry.name,
-                                    "-" + enum_entry.parameter.shorthand,
-                                    action='store_true',
-                                    default=defaults[base_name + enum_entry.name],
-                                    required=enum_entry.parameter.required,
-                                    help=enum_entry.parameter.help)
-                parser.add_argument('--' + base_name + "no-" + enum_entry.name,
-                                    "-n-" + enum_entry.parameter.shorthand,
-                                    action='store_false',
-                                    default=defaults[base_name + enum_entry.name],
-                                    required=enum_entry.parameter.required,
-                                    help=enum_entry.parameter.help)
-            elif isinstance(enum_entry.parameter.type, enum.EnumMeta):
-                parser.add_argument('--' + base_name + enum_entry.name,
-                                    "-" + enum_entry.parameter.shorthand,
-                                    action=enum_entry.parameter.action,
-                                    type=str, nargs=enum_entry.parameter.nargs,
-                                    required=enum_entry.parameter.required,
-                                    default=defaults[base_name + enum_entry.name],
-                                    help=enum_entry.parameter.help)
+    def __add_schema_entry_to_parser(entry: SchemaEntry, parser: argparse.ArgumentParser, defaults: dict,
+                                     include_help: bool = True) -> None:
+        parameter = entry.parameter
+        help_text = parameter.help if include_help else None
+        # TODO: transition to match statement here when the Python requirements is at or above 3.10
+        if entry.is_bool_flag:
+            parser.add_argument('--' + entry.path,
+                                "-" + parameter.shorthand,
+                                action='store_true',
+                                default=defaults[entry.path],
+                                required=parameter.required,
+                                help=help_text)
+            parser.add_argument('--' + entry.path[:-len(entry.name)] + "no-" + entry.name,
+                                "-n-" + parameter.shorthand,
+                                action='store_false',
+                                default=defaults[entry.path],
+                                required=parameter.required,
+                                help=help_text)
+        elif entry.is_enum:
+            parser.add_argument('--' + entry.path,
+                                "-" + parameter.shorthand,
+                                action=parameter.action,
+                                type=str, nargs=parameter.nargs,
+                                required=parameter.required,
+                                default=defaults[entry.path],
+                                help=help_text)
+        else:
+            if parameter.positional:
+                parser.add_argument(entry.path, action=parameter.action,
+                                    type=parameter.type, nargs=parameter.nargs,
+                                    default=defaults[entry.path],
+                                    help=help_text)
             else:
-                if enum_entry.parameter.positional:
-                    parser.add_argument(base_name + enum_entry.name, action=enum_entry.parameter.action,
-                                        type=enum_entry.parameter.type, nargs=enum_entry.parameter.nargs,
-                                        default=defaults[base_name + enum_entry.name],
-                                        help=enum_entry.parameter.help)
-                else:
-                    parser.add_argument('--' + base_name + enum_entry.name,
-                                        "-" + enum_entry.parameter.shorthand,
-                                        action=enum_entry.parameter.action,
-                                        type=enum_entry.parameter.type, nargs=enum_entry.parameter.nargs,
-                                        required=enum_entry.parameter.required,
-                                        default=defaults[base_name + enum_entry.name],
-                                        help=enum_entry.parameter.help)
+                parser.add_argument('--' + entry.path,
+                                    "-" + parameter.shorthand,
+                                    action=parameter.action,
+                                    type=parameter.type, nargs=parameter.nargs,
+                                    required=parameter.required,
+                                    default=defaults[entry.path],
+                                    help=help_text)
 
     def generate_parser(self, defaults: dict, console_only: bool = False, description: str = "Description N/A",
-                        parents: Union[List[argparse.ArgumentParser], None] = None) -> argparse.ArgumentParser:
+                        parents: Union[List[argparse.ArgumentParser], None] = None,
+                        include_help: bool = True) -> argparse.ArgumentParser:
         """
         @rtype: argparse.ArgumentParser
         @return: either a console-only or a config_file+console parser using the specified defaults and, optionally,
@@ -232,6 +326,7 @@ class ArgumentProcessor(object):
         @type description: str
         @param description: description of the program that uses the parser, to be used in the help file
         @type parents: list[argparse.ArgumentParser] | None
+        @param include_help: whether to pass parameter help to the parser, which is only needed to print the help
         """
         if console_only:
             parser = argparse.ArgumentParser(description=description,
@@ -242,41 +337,113 @@ class ArgumentProcessor(object):
                 raise ValueError("A conf-file+console parser requires at least a console-only parser as a parent.")
             parser = argparse.ArgumentParser(parents=parents)
 
-        for enum_entry in self.parameter_enum:
-            ArgumentProcessor.__add_parameter_enum_entry_to_parser(enum_entry, parser, defaults, console_only)
+        for entry in self.schema.entries:
+            if entry.parameter.console_only == console_only:
+                ArgumentProcessor.__add_schema_entry_to_parser(entry, parser, defaults, include_help)
 
         if console_only:
-            # add non-enum args
-            enum_entry = ArgumentProcessor.settings_file
-            parser.add_argument(ArgumentProcessor.settings_file_shorthand,
-                                '--' + ArgumentProcessor.settings_file_parameter_name,
-                                action=enum_entry.action, type=enum_entry.type, nargs=enum_entry.nargs,
-                                required=enum_entry.required,
-                                default=defaults[ArgumentProcessor.settings_file_parameter_name],
-                                help=enum_entry.help)
-            enum_entry = ArgumentProcessor.save_settings
-            parser.add_argument(ArgumentProcessor.save_settings_shorthand,
-                                '--' + ArgumentProcessor.save_settings_parameter_name,
-                                action=enum_entry.action,
-                                default=defaults[ArgumentProcessor.save_settings_parameter_name],
-                                required=enum_entry.required, help=enum_entry.help)
-
-        if not console_only:
+            ArgumentProcessor.__add_settings_file_arguments_to_parser(parser, defaults, include_help)
+        else:
             parser.set_defaults(**defaults)
         return parser
 
+    def generate_single_pass_parser(self, defaults: dict, description: str = "Description N/A",
+                                    include_help: bool = True) -> argparse.ArgumentParser:
+        """
+        @return: a single parser handling both console-only and config_file+console arguments, equivalent to a
+        config_file+console parser that has the console-only parser as its parent.
+        @param defaults: dictionary of default settings and their values, including values from the config file.
+        @param description: description of the program that uses the parser, to be used in the help file
+        @param include_help: whether to pass parameter help to the parser, which is only needed to print the help
+        """
+        parser = argparse.ArgumentParser(description=description,
+                                         formatter_class=argparse.RawDescriptionHelpFormatter)
+        for entry in self.schema.entries:
+            if entry.parameter.console_only:
+                ArgumentProcessor.__add_schema_entry_to_parser(entry, parser, defaults, include_help)
+        ArgumentProcessor.__add_settings_file_arguments_to_parser(parser, defaults, include_help)
+        for entry in self.schema.entries:
+            if not entry.parameter.console_only:
+                ArgumentProcessor.__add_schema_entry_to_parser(entry, parser, defaults, include_help)
+        parser.set_defaults(**defaults)
+        return parser
+
+    @staticmethod
+    def __add_settings_file_arguments_to_parser(parser: argparse.ArgumentParser, defaults: dict,
+                                                include_help: bool = True) -> None:
+        # add non-enum args
+        enum_entry = ArgumentProcessor.settings_file
+        parser.add_argument(ArgumentProcessor.settings_file_shorthand,
+                            '--' + ArgumentProcessor.settings_file_parameter_name,
+                            action=enum_entry.action, type=enum_entry.type, nargs=enum_entry.nargs,
+                            required=enum_entry.required,
+                            default=defaults[ArgumentProcessor.settings_file_parameter_name],
+                            help=enum_entry.help if include_help else None)
+        enum_entry = ArgumentProcessor.save_settings
+        parser.add_argument(ArgumentProcessor.save_settings_shorthand,
+                            '--' + ArgumentProcessor.save_settings_parameter_name,
+                            action=enum_entry.action,
+                            default=defaults[ArgumentProcessor.save_settings_parameter_name],
+                            required=enum_entry.required, help=enum_entry.help if include_help else None)
+
+    @staticmethod
+    def is_help_requested(argv: List[str]) -> bool:
+        """
+        @param argv: command-line arguments (without the program name)
+        @return: whether argv may contain a request for help, i.e. --help, an abbreviation of it, or -h, possibly
+        combined with other single-character flags (e.g. -vh)
+        """
+        for argument in argv:
+            if argument == "--":
+                break
+            if argument.startswith("--"):
+                if len(argument) > 2 and "--help".startswith(argument):
+                    return True
+            elif argument.startswith("-") and "h" in argument:
+                return True
+        return False
+
+    @staticmethod
+    def prescan_settings_file_arguments(argv: List[str]) -> Tuple[Union[str, None], bool]:
+        """
+        Cheaply extract the settings file & save-settings flag from the command line without building a parser.
+        Only exact (non-abbreviated) option strings are recognized.
+        @param argv: command-line arguments (without the program name)
+        @return: tuple of (settings file or None, whether to save settings)
+        """
+        settings_file_options = ('--' + ArgumentProcessor.settings_file_parameter_name,
+                                 ArgumentProcessor.settings_file_shorthand)
+        save_settings_options = ('--' + ArgumentProcessor.save_settings_parameter_name,
+                                 ArgumentProcessor.save_settings_shorthand)
+        settings_file = None
+        save_settings = False
+        i_argument = 0
+        while i_argument < len(argv):
+            argument = argv[i_argument]
+            if argument == "--":
+                break
+            if argument in settings_file_options:
+                if i_argument + 1 < len(argv) and not argv[i_argument + 1].startswith("-"):
+                    settings_file = argv[i_argument + 1]
+                    i_argument += 1
+                else:
+                    settings_file = None
+            elif argument in save_settings_options:
+                save_settings = True
+            elif "=" in argument:
+                option, value = argument.split("=", 1)
+                if option in settings_file_options:
+                    settings_file = value
+            i_argument += 1
+        return settings_file, save_settings
+
     @staticmethod
     def fill_parameter_enum_values_from_flat_dict(argument_flat_dictionary: dict, parameter_enum: Type[ParameterEnum],
                                                   base_name: str = ""):
-        for enum_entry in parameter_enum:
-            if enum_entry.parameter.type == 'parameter_enum':
-                ArgumentProcessor.fill_parameter_enum_values_from_flat_dict(argument_flat_dictionary,
-                                                                            enum_entry.parameter,
-                                                                            base_name + enum_entry.name + ".")
-            else:
-                full_param_path = base_name + enum_entry.name
-                if full_param_path in argument_flat_dictionary:
-                    enum_entry.__dict__["argument"] = argument_flat_dictionary[full_param_path]
+        for entry in compile_schema(parameter_enum).entries:
+            full_param_path = base_name + entry.path
+            if full_param_path in argument_flat_dictionary:
+                entry.member.__dict__["argument"] = argument_flat_dictionary[full_param_path]
 
     def set_values_from_flat_dict(self, argument_flat_dictionary: dict):
         ArgumentProcessor.fill_parameter_enum_values_from_flat_dict(argument_flat_dictionary, self.parameter_enum)
@@ -294,20 +461,27 @@ class ArgumentProcessor(object):
     def set_values_from_dict(self, argument_dictionary: dict):
         ArgumentProcessor.fill_parameters_enum_values_from_dict(argument_dictionary, self.parameter_enum)
 
-    @staticmethod
-    def __post_process_enum_arg(enum_entry):
-        if isinstance(enum_entry.parameter.type, enum.EnumMeta) and not isinstance(enum_entry.value, enum.Enum):
-            enum_entry.__dict__["argument"] = enum_entry.parameter.value_map[enum_entry.value]
-        elif enum_entry.parameter.type == 'parameter_enum':
-            for sub_enum_entry in enum_entry.parameter:
-                ArgumentProcessor.__post_process_enum_arg(sub_enum_entry)
+    def resolve_enum_values(self, argument_flat_dictionary: dict) -> dict:
+        """
+        @return: a copy of the provided flat dictionary with string values of Enum parameters replaced by the
+        corresponding Enum members (None is kept as is)
+        """
+        resolved_dictionary = dict(argument_flat_dictionary)
+        for entry in self.schema.enum_entries:
+            value = resolved_dictionary.get(entry.path)
+            if entry.path in resolved_dictionary and value is not None and not isinstance(value, enum.Enum):
+                resolved_dictionary[entry.path] = entry.parameter.value_map[value]
+        return resolved_dictionary
 
     def post_process_enum_args(self):
-        for enum_entry in self.parameter_enum:
-            ArgumentProcessor.__post_process_enum_arg(enum_entry)
+        # read the members' own arguments, since .value may resolve to a bound or installed snapshot instead
+        for entry in self.schema.enum_entries:
+            argument = entry.member.argument
+            if argument is not None and not isinstance(argument, enum.Enum):
+                entry.member.__dict__["argument"] = entry.parameter.value_map[argument]
 
     @staticmethod
-    def __add_parameter_help_to_commented_map(enum_entry: ParameterEnum, commented_map: CommentedMap, level: int,
+    def __add_parameter_help_to_commented_map(enum_entry: ParameterEnum, commented_map: "CommentedMap", level: int,
                                               tab_width: int, line_length_limit=None):
         if enum_entry.name in commented_map:
             if enum_entry.parameter.type == 'parameter_enum':
@@ -319,32 +493,96 @@ class ArgumentProcessor(object):
                                                                             commented_map[enum_entry.name],
                                                                             level + 1, tab_width, new_line_length_limit)
             else:
-                help_comment = enum_entry.parameter.help if line_length_limit is None else \
-                    "\n".join(textwrap.wrap(enum_entry.parameter.help, width=line_length_limit))
-                commented_map.yaml_set_comment_before_after_key(enum_entry.name, help_comment, indent=level * tab_width)
+                indent = level * tab_width
+                help_comment = enum_entry.parameter.get_help_comment(line_length_limit)
+                commented_map.yaml_set_comment_before_after_key(enum_entry.name, help_comment, indent=indent)
 
-    def add_help_as_comments_to_commented_map(self, commented_map: CommentedMap, tab_width=4, line_length_limit=120):
+    def add_help_as_comments_to_commented_map(self, commented_map: "CommentedMap", tab_width=4, line_length_limit=120):
         for enum_entry in self.parameter_enum:
             ArgumentProcessor.__add_parameter_help_to_commented_map(enum_entry, commented_map, 0, tab_width,
                                                                     line_length_limit)
 
 
-def __dump_argument_dict(arguments: Union[dict, CommentedMap],
+def __read_umask_by_setting_it() -> int:
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+# the umask at import time, for systems that don't report the current one in /proc (setting the umask on every write
+# to read it would race with other threads creating files)
+__import_time_umask = __read_umask_by_setting_it()
+
+
+def __get_umask() -> int:
+    try:
+        with open("/proc/self/status", 'r') as status_file:
+            for line in status_file:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    return __import_time_umask
+
+
+def write_file_atomically(path: Union[str, Path], contents: Union[str, bytes]) -> None:
+    """
+    Write text to a file such that concurrent readers see either the old or the new contents, never a partially-written
+    file: contents are written to a temporary file in the same directory, which then replaces the destination.
+    Symbolic links are followed, i.e. the file they point to is replaced rather than the links themselves.
+    """
+    path = os.path.realpath(path)
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path),
+                                                       prefix="." + os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        if isinstance(contents, bytes):
+            file = os.fdopen(file_descriptor, 'wb')
+        else:
+            file = os.fdopen(file_descriptor, 'w', encoding="utf-8")
+        with file:
+            file.write(contents)
+            file.flush()
+            os.fsync(file.fileno())
+        if os.path.exists(path):
+            shutil.copymode(path, temporary_path)
+        else:
+            # mkstemp creates files readable by the owner only, give new files the usual permissions instead
+            os.chmod(temporary_path, 0o666 & ~__get_umask())
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.unlink(temporary_path)
+        raise
+
+
+def __dump_argument_dict(arguments: Union[dict, "CommentedMap"],
                          stream: Union[io.StringIO, io.FileIO, io.TextIOWrapper, io.TextIOBase, Path],
-                         tab_width: int = 4):
-    yaml = YAML(typ='rt')
-    yaml.indent = tab_width
-    yaml.default_flow_style = False
-    yaml.dump(arguments, stream)
+                         tab_width: int = 4, recorder: PhaseRecorder = null_recorder):
+    if isinstance(stream, Path):
+        contents = get_settings_file_format(stream).dumps(arguments, tab_width)
+        recorder.record_contents_written(contents)
+        write_file_atomically(stream, contents)
+    else:
+        YamlSettingsFileFormat.dump(arguments, stream, tab_width)
+
+
+def __can_save_help_comments(stream: Union[io.StringIO, io.FileIO, io.TextIOWrapper, io.TextIOBase, Path]) -> bool:
+    return not isinstance(stream, Path) or get_settings_file_format(stream).supports_comments
 
 
 def save_defaults(program_arguments_enum: Type[ParameterEnum], destination_path: str, save_help_comments: bool = True,
                   tab_width: int = 4, line_length_limit: int = 120) -> None:
+    """
+    Save default parameter values to a settings file, in the format matching its extension.
+    Help comments are only saved to formats that support comments (i.e. YAML).
+    """
     processor = ArgumentProcessor(program_arguments_enum)
-    defaults = unflatten_dict(processor.generate_defaults_dict(convert_enums_to_strings=True))
+    flat_defaults = processor.generate_defaults_dict(convert_enums_to_strings=True)
+    flat_defaults.update(prepare_array_values_for_saving(processor.schema, flat_defaults, destination_path))
+    defaults = unflatten_dict(flat_defaults)
     del defaults[ArgumentProcessor.save_settings_parameter_name]
     del defaults[ArgumentProcessor.settings_file_parameter_name]
-    if save_help_comments:
+    if save_help_comments and __can_save_help_comments(Path(destination_path)):
         defaults = nested_dict_to_commented_map(defaults)
         processor.add_help_as_comments_to_commented_map(defaults, tab_width=tab_width,
                                                         line_length_limit=line_length_limit)
@@ -355,8 +593,11 @@ def dump(program_arguments_enum: Type[ParameterEnum],
          stream: Union[io.StringIO, io.FileIO, io.TextIOWrapper, io.TextIOBase, Path] = sys.stdout,
          save_help_comments: bool = False, tab_width: int = 4, line_length_limit: int = 120):
     processor = ArgumentProcessor(program_arguments_enum)
-    values = unflatten_dict(processor.generate_value_dict(convert_enums_to_strings=True))
-    if save_help_comments:
+    flat_values = processor.generate_value_dict(convert_enums_to_strings=True)
+    flat_values.update(prepare_array_values_for_saving(processor.schema, flat_values,
+                                                       stream if isinstance(stream, Path) else None))
+    values = unflatten_dict(flat_values)
+    if save_help_comments and __can_save_help_comments(stream):
         values = nested_dict_to_commented_map(values)
         processor.add_help_as_comments_to_commented_map(values, tab_width=tab_width,
                                                         line_length_limit=line_length_limit)
@@ -366,6 +607,7 @@ def dump(program_arguments_enum: Type[ParameterEnum],
 def add_comments_from_help(program_arguments_enum: Type[ParameterEnum],
                            stream: Union[io.StringIO, io.FileIO, io.TextIOWrapper, io.TextIOBase, Path] = sys.stdout,
                            tab_width: int = 4, line_length_limit: int = 120):
+    from ruamel.yaml import YAML
     yaml = YAML(typ='rt')
     yaml.indent = tab_width
     arguments = yaml.load(stream)
@@ -377,118 +619,243 @@ def add_comments_from_help(program_arguments_enum: Type[ParameterEnum],
 def process_arguments(program_arguments_enum: Type[ParameterEnum], program_help_description: str,
                       default_settings_file: Union[None, str] = None,
                       generate_default_settings_if_missing: bool = False,
-                      argv: Union[List[str], None] = None) \
-        -> argparse.Namespace:
+                      argv: Union[List[str], None] = None,
+                      single_pass: bool = False,
+                      settings_cache: Union[None, "SettingsFileCache"] = None,
+                      as_snapshot: bool = False,
+                      env_prefix: Union[None, str] = None,
+                      fast_parse: bool = False,
+                      stats: Union[None, ProcessingStats] = None) \
+        -> Union[argparse.Namespace, RootSettingsSnapshot]:
+    """
+    Parse the command-line arguments (and, if provided, the settings file) & store the resulting values in the
+    provided parameter enum.
+    @param program_arguments_enum: the ParameterEnum class holding program parameters
+    @param program_help_description: description of the program, to be used in the help output
+    @param default_settings_file: settings file to use if none is provided on the command line. Any settings file can
+    list lower settings layers under it via a top-level 'include' entry (see process_settings_file).
+    @param generate_default_settings_if_missing: whether to generate the default settings file if it doesn't exist
+    @param argv: command-line arguments to parse (sys.argv[1:] is used if None)
+    @param single_pass: when set, the settings file options are pre-scanned from argv and a single parser is built &
+    run once, instead of first running a separate console-only parser.
+    @param settings_cache: optional cache of parsed settings files to reuse parsing results from
+    @param as_snapshot: when set, return an immutable snapshot of the resulting values instead of the argparse
+    namespace & leave values stored in the parameter enum untouched
+    @param env_prefix: when provided, parameter values are also read from environment variables with this prefix
+    (see read_environment_values), overriding values from the settings file, but not values from the command line
+    @param fast_parse: when set, try parsing the command line via a dictionary lookup of option strings (see
+    FastArgumentParser) instead of argparse, falling back to argparse (as with single_pass) for help requests & any
+    command lines the fast parser can't handle. Implies pre-scanning the settings file options as with single_pass.
+    @param stats: when provided, gets filled in with durations of the processing phases & related counts (see also
+    add_stats_callback)
+    @return: the resulting argparse namespace or, if as_snapshot is set, settings snapshot
+    """
+    recorder = start_recording("process_arguments", stats)
     processor = ArgumentProcessor(program_arguments_enum)
+    recorder.set_parameter_count(len(processor.schema.entries))
     defaults = processor.generate_defaults_dict()
-
-    console_only_parser = \
-        processor.generate_parser(defaults, console_only=True, description=program_help_description)
-
-    yaml = YAML(typ='rt')
-    yaml.indent = 4
-    yaml.default_flow_style = False
+    if argv is None:
+        argv = sys.argv[1:]
+    # parameter help is only put together when it is going to be printed
+    include_help = ArgumentProcessor.is_help_requested(argv)
+    recorder.end_phase("schema")
 
     # first, parse any console-only arguments
-    args, remaining_argv = console_only_parser.parse_known_args(argv)
+    prescan = single_pass or fast_parse
+    if prescan:
+        console_only_parser = None
+        settings_file, save_settings = ArgumentProcessor.prescan_settings_file_arguments(argv)
+        remaining_argv = argv
+        recorder.end_phase("parse")
+    else:
+        console_only_parser = \
+            processor.generate_parser(defaults, console_only=True, description=program_help_description,
+                                      include_help=include_help)
+        recorder.end_phase("parser_build")
+        args, remaining_argv = console_only_parser.parse_known_args(argv)
+        settings_file, save_settings = args.settings_file, args.save_settings
+        recorder.end_phase("parse")
 
     # load the default settings file if need be, auto-generate it if such behavior is requested
-    if not args.settings_file and default_settings_file is not None:
-        args.settings_file = default_settings_file
+    if not settings_file and default_settings_file is not None:
+        settings_file = default_settings_file
         if generate_default_settings_if_missing and not Path(default_settings_file).exists():
             save_defaults(program_arguments_enum, default_settings_file)
 
-    defaults[ArgumentProcessor.save_settings_parameter_name] = args.save_settings
+    defaults[ArgumentProcessor.save_settings_parameter_name] = save_settings
 
     # update defaults from the settings/config file (if any)
-    if args.settings_file:
-        defaults[ArgumentProcessor.settings_file_parameter_name] = args.settings_file
-        if os.path.isfile(args.settings_file):
-            config_defaults = yaml.load(Path(args.settings_file))
-            if config_defaults:
-                config_defaults = flatten_dict(config_defaults)
-                for key, value in config_defaults.items():
-                    defaults[key] = value
+    if settings_file:
+        defaults[ArgumentProcessor.settings_file_parameter_name] = settings_file
+        if os.path.isfile(settings_file):
+            config_defaults = processor.schema.convert_values(
+                __load_flattened_settings(settings_file, settings_cache, recorder), source=settings_file)
+            for key, value in config_defaults.items():
+                defaults[key] = value
         else:
-            if not args.save_settings:
-                raise ValueError("Settings file not found at: {0:s}".format(args.settings_file))
+            if not save_settings:
+                raise ValueError("Settings file not found at: {0:s}".format(settings_file))
+    recorder.end_phase("settings_load")
+
+    # update defaults from environment variables (if requested)
+    if env_prefix is not None:
+        defaults.update(read_environment_values(program_arguments_enum, env_prefix))
+        recorder.end_phase("environment")
+
+    # references in values from the settings file & environment (including sidecar file references) are resolved
+    # after parsing, so that they can refer to values from the command line
+    for key, value in defaults.items():
+        if is_template(value) or is_sidecar_reference(value):
+            defaults[key] = DeferredTemplate(value)
 
     # parse the rest of the command-line arguments into a separate namespace
-    parser = processor.generate_parser(defaults, parents=[console_only_parser])
-    args = parser.parse_args(remaining_argv)
-
-    # TODO: improve wildcard handling to:
-    #  (1) provide generic wildcards for any string arguments
-    #  (2) replace a wildcard in substring with it's corresponding string argument
-    #  (3) handle wildcards in settings file arguments here as well, not just in process_settings
-    # process "special" setting values
-    keys_with_sfl_wildcard_set = set()
-    if args.settings_file and os.path.isfile(args.settings_file):
-        for key in args.__dict__.keys():
-            if key in processor.setting_file_location_args and args.__dict__[key] == \
-                    Parameter.setting_file_location_wildcard:
-                args.__dict__[key] = os.path.dirname(args.settings_file)
-                keys_with_sfl_wildcard_set.add(key)
+    args = None
+    if fast_parse and not include_help:
+        from ext_argparse.fast_parser import get_fast_parser
+        args = get_fast_parser(program_arguments_enum).parse_args(remaining_argv, defaults)
+        recorder.end_phase("parse")
+    if prescan:
+        if args is None:
+            parser = processor.generate_single_pass_parser(defaults, description=program_help_description,
+                                                           include_help=include_help)
+            recorder.end_phase("parser_build")
+            args = parser.parse_args(remaining_argv)
+            recorder.end_phase("parse")
+        if args.settings_file != settings_file or args.save_settings != save_settings:
+            # the pre-scan missed a settings file option (e.g. abbreviated by the user), fall back to two passes
+            recorder.discard_phases("single_pass_fallback")
+            return process_arguments(program_arguments_enum, program_help_description, default_settings_file,
+                                     generate_default_settings_if_missing, argv, single_pass=False,
+                                     settings_cache=settings_cache, as_snapshot=as_snapshot,
+                                     env_prefix=env_prefix, stats=stats)
+    else:
+        parser = processor.generate_parser(defaults, parents=[console_only_parser], include_help=include_help)
+        recorder.end_phase("parser_build")
+        args = parser.parse_args(remaining_argv)
+        recorder.end_phase("parse")
 
     argument_dict = vars(args)
-    processor.set_values_from_flat_dict(argument_dict)
-    processor.post_process_enum_args()
+    for key, value in argument_dict.items():
+        if isinstance(value, DeferredTemplate):
+            argument_dict[key] = value.text
+
+    # resolve references & wildcards (see resolve_interpolations), keeping the original values to save them back
+    resolved_values = resolve_interpolations(processor.schema, argument_dict, args.settings_file or None)
+    unresolved_values = {key: argument_dict[key] for key in resolved_values.keys()}
+    argument_dict.update(resolved_values)
+    argument_dict.update(load_array_values(processor.schema, argument_dict, args.settings_file or None))
+    recorder.end_phase("interpolation")
+
+    if as_snapshot:
+        snapshot = create_settings_snapshot(program_arguments_enum, processor.resolve_enum_values(argument_dict))
+    else:
+        processor.set_values_from_flat_dict(argument_dict)
+        processor.post_process_enum_args()
 
-    # reset paths where wildcards were used back to the wildcards
-    if args.settings_file and os.path.isfile(args.settings_file):
-        for key in argument_dict.keys():
-            if key in keys_with_sfl_wildcard_set:
-                argument_dict[key] = Parameter.setting_file_location_wildcard
-    unflattened_argument_dict = unflatten_dict(argument_dict)
+    argument_dict.update(unresolved_values)
+    recorder.end_phase("store_values")
 
-    # save settings if prompted to do so
+    # save settings if prompted to do so, rewriting the file only if some of the values in it have changed
     if args.save_settings and args.settings_file:
-        config_path = Path(unflattened_argument_dict[ArgumentProcessor.settings_file_parameter_name])
-        settings = yaml.load(config_path)
-
-        del unflattened_argument_dict[ArgumentProcessor.save_settings_parameter_name]
-        del unflattened_argument_dict[ArgumentProcessor.settings_file_parameter_name]
-
-        nested_update(settings, unflattened_argument_dict)
-
-        yaml.dump(settings, config_path)
-
-        unflattened_argument_dict[ArgumentProcessor.save_settings_parameter_name] = config_path
-        unflattened_argument_dict[ArgumentProcessor.settings_file_parameter_name] = True
-
+        config_path = Path(args.settings_file)
+        saved_values = argument_dict
+        if processor.schema.array_entries:
+            saved_values = dict(argument_dict)
+            saved_values.update(prepare_array_values_for_saving(processor.schema, argument_dict, config_path))
+        values_to_save = unflatten_dict({
+            key: (value.name if isinstance(value, enum.Enum) else value) for key, value in saved_values.items()
+            if key not in (ArgumentProcessor.save_settings_parameter_name,
+                           ArgumentProcessor.settings_file_parameter_name)
+        })
+        settings = load_settings_file(config_path, round_trip=True) if config_path.is_file() else None
+        if settings:
+            settings_changed = nested_update(settings, values_to_save)
+        else:
+            settings = values_to_save
+            settings_changed = True
+        if settings_changed:
+            __dump_argument_dict(settings, config_path, recorder=recorder)
+        recorder.end_phase("save")
+
+    recorder.finish()
+    if as_snapshot:
+        return snapshot
     return args
 
 
 def process_settings_file(program_arguments_enum: Type[ParameterEnum],
-                          settings_file: str, generate_default_settings_if_missing: bool = False) \
-        -> dict:
+                          settings_file: Union[str, List[str]], generate_default_settings_if_missing: bool = False,
+                          settings_cache: Union[None, "SettingsFileCache"] = None,
+                          as_snapshot: bool = False,
+                          env_prefix: Union[None, str] = None,
+                          stats: Union[None, ProcessingStats] = None) \
+        -> Union[dict, RootSettingsSnapshot]:
+    """
+    Load parameter values from the settings file & store them in the provided parameter enum.
+    @param program_arguments_enum: the ParameterEnum class holding program parameters
+    @param settings_file: path to the settings file, or a list of paths to settings files to use as layers, from the
+    lowest to the highest priority, i.e. values in later files override those in earlier ones. Any settings file can
+    also list lower layers under it via a top-level 'include' entry (see include_directive_key), with paths relative
+    to the file.
+    @param generate_default_settings_if_missing: whether to generate the default settings file (the last one, for a
+    list of layers) if it doesn't exist
+    @param settings_cache: optional cache of parsed settings files to reuse parsing (and layer merging) results from
+    @param as_snapshot: when set, return an immutable snapshot of the resulting values instead of a dictionary &
+    leave values stored in the parameter enum untouched
+    @param env_prefix: when provided, parameter values are also read from environment variables with this prefix
+    (see read_environment_values), overriding values from the settings file
+    @param stats: when provided, gets filled in with durations of the processing phases & related counts (see also
+    add_stats_callback)
+    @return: nested dictionary of resulting parameter values or, if as_snapshot is set, settings snapshot
+    """
+    recorder = start_recording("process_settings_file", stats)
     processor = ArgumentProcessor(program_arguments_enum)
-    parameter_values = unflatten_dict(processor.generate_defaults_dict())
-
-    yaml = YAML(typ='rt')
-    yaml.indent = 4
-    yaml.default_flow_style = False
+    recorder.set_parameter_count(len(processor.schema.entries))
+    flat_parameter_values = processor.generate_defaults_dict()
+    settings_files = [settings_file] if isinstance(settings_file, (str, Path)) else list(settings_file)
+    if not settings_files:
+        raise ValueError("At least one settings file is required.")
+    # the top layer determines the settings file location
+    settings_file = settings_files[-1]
+    recorder.end_phase("schema")
 
     # load the default settings file if need be, auto-generate it if such behavior is requested
     if generate_default_settings_if_missing and not Path(settings_file).exists():
         save_defaults(program_arguments_enum, settings_file)
 
-    # update values from the settings/config file
-    if os.path.isfile(settings_file):
-        loaded_values = yaml.load(Path(settings_file))
-        nested_update(parameter_values, loaded_values)
-    else:
-        raise ValueError("Settings file not found at: {0:s}".format(settings_file))
-
-    # process "special" setting values
-    keys_with_sfl_wildcard_set = set()
-    for key in parameter_values.keys():
-        if key in processor.setting_file_location_args and parameter_values[key] == \
-                Parameter.setting_file_location_wildcard:
-            parameter_values[key] = os.path.dirname(settings_file)
-            keys_with_sfl_wildcard_set.add(key)
-
-    processor.set_values_from_dict(parameter_values)
+    # update values from the settings/config file(s)
+    for layer_file in settings_files:
+        if not os.path.isfile(layer_file):
+            raise ValueError("Settings file not found at: {0:s}".format(str(layer_file)))
+    # unknown entries (e.g. data for other tools) are skipped while loading, since they would be discarded anyway
+    loaded_values = __load_flattened_settings(settings_files, settings_cache, recorder, processor.schema)
+    loaded_values = processor.schema.convert_values(
+        loaded_values, source=", ".join(str(layer_file) for layer_file in settings_files))
+    for key, value in loaded_values.items():
+        if key in flat_parameter_values:
+            flat_parameter_values[key] = value
+    recorder.end_phase("settings_load")
+
+    # update values from environment variables (if requested)
+    if env_prefix is not None:
+        flat_parameter_values.update(read_environment_values(program_arguments_enum, env_prefix))
+        recorder.end_phase("environment")
+
+    # resolve references & wildcards (see resolve_interpolations)
+    flat_parameter_values.update(resolve_interpolations(processor.schema, flat_parameter_values, settings_file))
+    flat_parameter_values.update(load_array_values(processor.schema, flat_parameter_values, settings_file))
+    recorder.end_phase("interpolation")
+
+    if as_snapshot:
+        snapshot = create_settings_snapshot(program_arguments_enum,
+                                            processor.resolve_enum_values(flat_parameter_values))
+        recorder.end_phase("store_values")
+        recorder.finish()
+        return snapshot
+
+    processor.set_values_from_flat_dict(flat_parameter_values)
     processor.post_process_enum_args()
-
-    return parameter_values
+    result = unflatten_dict(flat_parameter_values)
+    recorder.end_phase("store_values")
+    recorder.finish()
+    return result
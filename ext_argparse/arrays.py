@@ -0,0 +1,167 @@
+#  ================================================================
+#  Created by Gregory Kramida on 10/17/26.
+#  Copyright (c) 2026 Gregory Kramida
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  ================================================================
+import array
+import mmap
+import os
+import sys
+from pathlib import Path
+from typing import Union, TYPE_CHECKING
+
+from ext_argparse.parameter import Parameter
+
+if TYPE_CHECKING:
+    from ext_argparse.schema import ParameterSchema
+
+# prefix of string values that refer to a binary sidecar file (relative to the settings file) holding an array
+sidecar_reference_prefix = "!sidecar "
+
+# element types of sidecar files are 64-bit & little-endian regardless of the platform
+_typecodes = {int: "q", float: "d"}
+_numpy_dtypes = {int: "<i8", float: "<f8"}
+_sidecar_extensions = {int: ".i64", float: ".f64"}
+
+
+def is_array(value) -> bool:
+    """ @return: whether the value is an array.array or a NumPy array """
+    return isinstance(value, array.array) or hasattr(value, "__array_interface__")
+
+
+def is_sidecar_reference(value) -> bool:
+    return isinstance(value, str) and value.startswith(sidecar_reference_prefix)
+
+
+def values_equal(first_value, second_value) -> bool:
+    """ Compare two parameter values, including NumPy arrays (which don't compare to a single boolean). """
+    if hasattr(first_value, "__array_interface__") or hasattr(second_value, "__array_interface__"):
+        return type(first_value) is type(second_value) and first_value.shape == second_value.shape and \
+            bool((first_value == second_value).all())
+    return first_value == second_value
+
+
+def __import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Parameters with array_storage='numpy' require the 'numpy' package.")
+    return numpy
+
+
+def to_array_storage(value, parameter: Parameter):
+    """
+    @param value: a sequence of numbers, i.e. a list, an array.array, or a NumPy array (or None)
+    @param parameter: parameter with array storage (see the array_storage argument of Parameter)
+    @return: the value as an array.array or NumPy array, depending on the parameter's array storage
+    """
+    if value is None:
+        return None
+    if parameter.array_storage == "numpy":
+        numpy = __import_numpy()
+        return numpy.asarray(value, dtype=_numpy_dtypes[parameter.type])
+    typecode = _typecodes[parameter.type]
+    if isinstance(value, array.array) and value.typecode == typecode:
+        return value
+    if hasattr(value, "__array_interface__"):
+        # native byte order, copied as a whole instead of element by element
+        return array.array(typecode, value.astype(typecode).tobytes())
+    return array.array(typecode, value)
+
+
+def read_sidecar_file(path: Union[str, Path], parameter: Parameter):
+    """
+    Read an array from a binary sidecar file. Only for NumPy array storage, the file stays memory-mapped
+    (copy-on-write), so that only the parts actually accessed are read. An array.array has to own its memory, so for
+    array storage, the whole file is read: it is mapped & copied into the array once, without an intermediate bytes
+    object.
+    """
+    if parameter.array_storage == "numpy":
+        numpy = __import_numpy()
+        if os.path.getsize(path) == 0:
+            return numpy.zeros(0, dtype=_numpy_dtypes[parameter.type])
+        return numpy.memmap(path, dtype=_numpy_dtypes[parameter.type], mode='c')
+    values = array.array(_typecodes[parameter.type])
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size > 0:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                values.frombytes(mapped_file)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def write_sidecar_file(path: Union[str, Path], value, parameter: Parameter) -> None:
+    """ Write an array to a binary sidecar file, leaving the file untouched if it already holds the same data. """
+    if hasattr(value, "__array_interface__"):
+        contents = value.astype(_numpy_dtypes[parameter.type]).tobytes()
+    else:
+        values = to_array_storage(value, parameter)
+        if sys.byteorder == "big":
+            values = array.array(values.typecode, values)
+            values.byteswap()
+        contents = values.tobytes()
+    if os.path.isfile(path) and os.path.getsize(path) == len(contents):
+        with open(path, 'rb') as file:
+            if file.read() == contents:
+                return
+    from ext_argparse.argproc import write_file_atomically
+    write_file_atomically(path, contents)
+
+
+def load_array_values(schema: "ParameterSchema", flat_values: dict, settings_file: Union[str, Path, None]) -> dict:
+    """
+    Convert values of parameters with array storage to arrays, reading any sidecar files they refer to.
+    @param schema: compiled schema of the ParameterEnum the values are for
+    @param flat_values: dictionary mapping dotted parameter paths to values
+    @param settings_file: settings file the values came from, relative to which sidecar files are located
+    @return: a new dictionary mapping dotted paths of parameters with array storage to arrays
+    """
+    array_values = {}
+    for entry in schema.array_entries:
+        value = flat_values.get(entry.path)
+        if is_sidecar_reference(value):
+            if settings_file is None:
+                raise ValueError(f"Value of '{entry.path:s}' refers to a sidecar file, but there is no settings file.")
+            sidecar_path = os.path.join(os.path.dirname(settings_file), value[len(sidecar_reference_prefix):])
+            array_values[entry.path] = read_sidecar_file(sidecar_path, entry.parameter)
+        elif value is not None:
+            array_values[entry.path] = to_array_storage(value, entry.parameter)
+    return array_values
+
+
+def prepare_array_values_for_saving(schema: "ParameterSchema", flat_values: dict,
+                                    settings_file: Union[str, Path, None]) -> dict:
+    """
+    Convert array values to what gets written to a settings file: arrays with at least as many elements as the
+    sidecar threshold of their parameter are written to sidecar files next to the settings file & replaced with
+    references to them, other arrays are converted to lists.
+    @param schema: compiled schema of the ParameterEnum the values are for
+    @param flat_values: dictionary mapping dotted parameter paths to values
+    @param settings_file: the settings file to be written, or None if the values aren't written to a file
+    @return: a new dictionary mapping dotted paths of parameters with array values to values to save
+    """
+    saved_values = {}
+    for entry in schema.array_entries:
+        value = flat_values.get(entry.path)
+        if not is_array(value):
+            continue
+        sidecar_threshold = entry.parameter.sidecar_threshold
+        if settings_file is not None and sidecar_threshold is not None and len(value) >= sidecar_threshold:
+            settings_path = Path(settings_file)
+            sidecar_name = settings_path.stem + "." + entry.path + _sidecar_extensions[entry.parameter.type]
+            write_sidecar_file(settings_path.parent / sidecar_name, value, entry.parameter)
+            saved_values[entry.path] = sidecar_reference_prefix + sidecar_name
+        else:
+            saved_values[entry.path] = value.tolist()
+    return saved_values
@@ -0,0 +1,109 @@
+#  ================================================================
+#  Created by Gregory Kramida on 10/17/26.
+#  Copyright (c) 2026 Gregory Kramida
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  ================================================================
+import concurrent.futures
+import pickle
+from typing import Type, Iterable, Iterator, List, Tuple, Union
+
+from ext_argparse.argproc import process_settings_file
+from ext_argparse.param_enum import ParameterEnum
+from ext_argparse.snapshot import RootSettingsSnapshot
+
+
+class SettingsFileResult(object):
+    """
+    Outcome of processing a single settings file in a batch: either a settings snapshot or the error that occurred.
+    """
+    __slots__ = ("index", "path", "settings", "error")
+
+    def __init__(self, index: int, path: str, settings: Union[RootSettingsSnapshot, None] = None,
+                 error: Union[Exception, None] = None):
+        """
+        @param index: index of the settings file in the input sequence
+        @param path: path to the settings file
+        @param settings: resulting settings snapshot, None if processing failed
+        @param error: exception raised while processing the file, None if processing succeeded
+        """
+        self.index = index
+        self.path = path
+        self.settings = settings
+        self.error = error
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+    def __reduce__(self):
+        return SettingsFileResult, (self.index, self.path, self.settings, self.error)
+
+    def __repr__(self):
+        if self.error is None:
+            return f"SettingsFileResult(index={self.index:d}, path={self.path!r})"
+        return f"SettingsFileResult(index={self.index:d}, path={self.path!r}, error={self.error!r})"
+
+
+def _process_settings_file_chunk(program_arguments_enum: Type[ParameterEnum], indexed_paths: List[Tuple[int, str]]) \
+        -> List[SettingsFileResult]:
+    results = []
+    for index, path in indexed_paths:
+        try:
+            settings = process_settings_file(program_arguments_enum, path, as_snapshot=True)
+            results.append(SettingsFileResult(index, path, settings=settings))
+        except Exception as error:
+            try:
+                pickle.dumps(error)
+            except Exception:
+                error = RuntimeError(f"{type(error).__name__:s}: {error!s}")
+            results.append(SettingsFileResult(index, path, error=error))
+    return results
+
+
+def process_settings_files(program_arguments_enum: Type[ParameterEnum], settings_files: Iterable[str],
+                           workers: Union[int, None] = None, ordered: bool = True, chunk_size: int = 16) \
+        -> Iterator[SettingsFileResult]:
+    """
+    Process many settings files (as process_settings_file would, but without altering values stored in the enum),
+    spreading the work across a pool of processes.
+
+    Errors are collected per file instead of aborting the whole batch. Note that, for process start methods other than
+    'fork', the ParameterEnum class (and any Enum types it uses) needs to be importable by the worker processes.
+
+    @param program_arguments_enum: the ParameterEnum class holding program parameters
+    @param settings_files: paths to the settings files
+    @param workers: number of worker processes. If None or 1, files are processed serially in the current process.
+    @param ordered: whether to yield results in input order (otherwise, they are yielded as they are completed)
+    @param chunk_size: number of files to hand to a worker process at a time
+    @return: generator of results, one per settings file
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size has to be at least 1, got: " + str(chunk_size))
+    indexed_paths = [(index, str(path)) for index, path in enumerate(settings_files)]
+    chunks = [indexed_paths[i_start:i_start + chunk_size] for i_start in range(0, len(indexed_paths), chunk_size)]
+
+    if workers is None or workers <= 1:
+        for chunk in chunks:
+            yield from _process_settings_file_chunk(program_arguments_enum, chunk)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        if ordered:
+            for chunk_results in executor.map(_process_settings_file_chunk,
+                                              [program_arguments_enum] * len(chunks), chunks):
+                yield from chunk_results
+        else:
+            futures = [executor.submit(_process_settings_file_chunk, program_arguments_enum, chunk)
+                       for chunk in chunks]
+            for future in concurrent.futures.as_completed(futures):
+                yield from future.result()
@@ -0,0 +1,204 @@
+#  ================================================================
+#  Created by Gregory Kramida on 10/17/26.
+#  Copyright (c) 2026 Gregory Kramida
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  ================================================================
+import re
+from typing import Type, List, Union
+
+from ext_argparse.argproc import ArgumentProcessor
+from ext_argparse.param_enum import ParameterEnum
+from ext_argparse.schema import compile_schema
+
+_non_identifier_character_pattern = re.compile(r"\W")
+_whitespace_pattern = re.compile(r"\s+")
+
+
+class _CompletionOption(object):
+    """ A single command-line option, along with its alternative spellings & possible values. """
+    __slots__ = ("option_strings", "takes_value", "choices", "completes_files", "help")
+
+    def __init__(self, option_strings: List[str], takes_value: bool, choices: Union[List[str], None] = None,
+                 completes_files: bool = False, help_text: str = ""):
+        self.option_strings = option_strings
+        self.takes_value = takes_value
+        self.choices = choices
+        self.completes_files = completes_files
+        self.help = help_text
+
+
+def __collect_options(parameter_enum: Type[ParameterEnum]) -> List[_CompletionOption]:
+    options = []
+    for entry in compile_schema(parameter_enum).entries:
+        parameter = entry.parameter
+        if parameter.positional:
+            continue
+        if entry.is_bool_flag:
+            options.append(_CompletionOption(["--" + entry.path, "-" + parameter.shorthand], False,
+                                             help_text=parameter.raw_help))
+            options.append(_CompletionOption(["--" + entry.path[:-len(entry.name)] + "no-" + entry.name,
+                                              "-n-" + parameter.shorthand], False, help_text=parameter.raw_help))
+        else:
+            choices = list(parameter.value_map.keys()) if parameter.value_map is not None else None
+            options.append(_CompletionOption(["--" + entry.path, "-" + parameter.shorthand], True, choices,
+                                             completes_files=parameter.setting_file_location,
+                                             help_text=parameter.raw_help))
+    options.append(_CompletionOption(["--" + ArgumentProcessor.settings_file_parameter_name,
+                                      ArgumentProcessor.settings_file_shorthand], True, completes_files=True,
+                                     help_text=ArgumentProcessor.settings_file.raw_help))
+    options.append(_CompletionOption(["--" + ArgumentProcessor.save_settings_parameter_name,
+                                      ArgumentProcessor.save_settings_shorthand], False,
+                                     help_text=ArgumentProcessor.save_settings.raw_help))
+    options.append(_CompletionOption(["--help", "-h"], False, help_text="show this help message and exit"))
+    return options
+
+
+def __get_function_name(program_name: str) -> str:
+    return "_" + _non_identifier_character_pattern.sub("_", program_name) + "_completion"
+
+
+def generate_bash_completion(parameter_enum: Type[ParameterEnum], program_name: str) -> str:
+    """
+    Generate a standalone bash completion script for a program that uses process_arguments with the provided
+    ParameterEnum. The script completes all option names and, where possible, option values (enum choices & paths),
+    without starting Python. Source it from ~/.bashrc or put it in the bash-completion directory.
+    @param parameter_enum: the (root) ParameterEnum class holding program parameters
+    @param program_name: name of the program (command) to complete, as typed in the shell
+    @return: contents of the completion script
+    """
+    options = __collect_options(parameter_enum)
+    function_name = __get_function_name(program_name)
+    all_option_strings = " ".join(option_string for option in options for option_string in option.option_strings)
+
+    value_cases = []
+    for option in options:
+        if option.choices is not None:
+            value_cases.append(f"        {'|'.join(option.option_strings)})\n"
+                               f"            COMPREPLY=($(compgen -W \"{' '.join(option.choices)}\" -- \"$current\"))\n"
+                               f"            return 0\n"
+                               f"            ;;")
+        elif option.completes_files:
+            value_cases.append(f"        {'|'.join(option.option_strings)})\n"
+                               f"            COMPREPLY=($(compgen -f -- \"$current\"))\n"
+                               f"            return 0\n"
+                               f"            ;;")
+    options_taking_values = [option_string for option in options if option.takes_value and option.choices is None
+                             and not option.completes_files for option_string in option.option_strings]
+    if options_taking_values:
+        # complete nothing specific (i.e. fall back to the default completion) for other options' values
+        value_cases.append(f"        {'|'.join(options_taking_values)})\n"
+                           f"            return 0\n"
+                           f"            ;;")
+
+    return f"""# bash completion for {program_name:s}, generated by ext_argparse
+{function_name:s}() {{
+    local current previous option
+    current="${{COMP_WORDS[COMP_CWORD]}}"
+    previous="${{COMP_WORDS[COMP_CWORD-1]}}"
+    option=""
+    # '=' is a word break, so '--option=value' arrives as '--option' '=' 'value'
+    if [[ "$current" == "=" ]]; then
+        option="$previous"
+        current=""
+    elif [[ "$previous" == "=" && $COMP_CWORD -ge 2 ]]; then
+        option="${{COMP_WORDS[COMP_CWORD-2]}}"
+    elif [[ "$current" != -* ]]; then
+        option="$previous"
+    fi
+
+    case "$option" in
+{chr(10).join(value_cases)}
+    esac
+
+    if [[ "$current" == -* ]]; then
+        COMPREPLY=($(compgen -W "{all_option_strings:s}" -- "$current"))
+    fi
+    return 0
+}}
+complete -o default -F {function_name:s} {program_name:s}
+"""
+
+
+def __escape_zsh_description(text: str) -> str:
+    text = _whitespace_pattern.sub(" ", text).strip()
+    for character in ("\\", "[", "]", ":"):
+        text = text.replace(character, "\\" + character)
+    return text.replace("'", "'\\''")
+
+
+def generate_zsh_completion(parameter_enum: Type[ParameterEnum], program_name: str) -> str:
+    """
+    Generate a standalone zsh completion script for a program that uses process_arguments with the provided
+    ParameterEnum. The script completes all option names (with their help) and, where possible, option values
+    (enum choices & paths), without starting Python. Save it as '_<program name>' in a directory on $fpath, or source
+    it.
+    @param parameter_enum: the (root) ParameterEnum class holding program parameters
+    @param program_name: name of the program (command) to complete, as typed in the shell
+    @return: contents of the completion script
+    """
+    options = __collect_options(parameter_enum)
+    function_name = __get_function_name(program_name)
+
+    specifications = []
+    for option in options:
+        description = __escape_zsh_description(option.help)
+        if option.takes_value:
+            if option.choices is not None:
+                action = "(" + " ".join(option.choices) + ")"
+            elif option.completes_files:
+                action = "_files"
+            else:
+                action = " "
+            message = option.option_strings[0].lstrip("-")
+            for option_string in option.option_strings:
+                specifications.append(f"'{option_string:s}=[{description:s}]:{message:s}:{action:s}'")
+        else:
+            for option_string in option.option_strings:
+                specifications.append(f"'{option_string:s}[{description:s}]'")
+
+    i_positional = 0
+    for entry in compile_schema(parameter_enum).entries:
+        if entry.parameter.positional:
+            i_positional += 1
+            action = "(" + " ".join(entry.parameter.value_map.keys()) + ")" \
+                if entry.parameter.value_map is not None else " "
+            specifications.append(f"'{i_positional:d}:{entry.path:s}:{action:s}'")
+
+    arguments = " \\\n        ".join(specifications)
+    return f"""#compdef {program_name:s}
+# zsh completion for {program_name:s}, generated by ext_argparse
+{function_name:s}() {{
+    _arguments \\
+        {arguments:s}
+}}
+
+if [[ "${{funcstack[1]}}" == "{function_name:s}" ]]; then
+    {function_name:s} "$@"
+else
+    compdef {function_name:s} {program_name:s}
+fi
+"""
+
+
+def generate_completion_script(parameter_enum: Type[ParameterEnum], program_name: str, shell: str = "bash") -> str:
+    """
+    @param parameter_enum: the (root) ParameterEnum class holding program parameters
+    @param program_name: name of the program (command) to complete, as typed in the shell
+    @param shell: either 'bash' or 'zsh'
+    @return: contents of the completion script for the provided shell
+    """
+    if shell == "bash":
+        return generate_bash_completion(parameter_enum, program_name)
+    elif shell == "zsh":
+        return generate_zsh_completion(parameter_enum, program_name)
+    raise ValueError("Unsupported shell for completion: " + str(shell) + ". Supported shells are 'bash' and 'zsh'.")
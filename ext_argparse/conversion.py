@@ -0,0 +1,163 @@
+#  ================================================================
+#  Created by Gregory Kramida on 10/17/26.
+#  Copyright (c) 2026 Gregory Kramida
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  ================================================================
+import enum
+from typing import Callable, List, Tuple, Union
+
+from ext_argparse.arrays import is_array, is_sidecar_reference
+from ext_argparse.parameter import Parameter
+
+true_strings = frozenset(("1", "true", "yes", "on"))
+false_strings = frozenset(("0", "false", "no", "off"))
+
+
+class SettingsValueError(ValueError):
+    """
+    Raised when one or more parameter values (e.g. from a settings file) cannot be converted to the types of the
+    corresponding parameters. All offending values are reported at once.
+    """
+
+    def __init__(self, errors: List[Tuple[str, str]], source: Union[str, None] = None):
+        """
+        @param errors: list of (dotted parameter path, error message) pairs
+        @param source: where the values came from, e.g. the path to the settings file
+        """
+        self.errors = errors
+        self.source = source
+        header = f"Invalid parameter values in {source:s}:" if source else "Invalid parameter values:"
+        super().__init__("\n".join([header] + [f"  {path:s}: {message:s}" for path, message in errors]))
+
+    def __reduce__(self):
+        return SettingsValueError, (self.errors, self.source)
+
+
+def __convert_bool_flag(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        lowercase_value = value.strip().lower()
+        if lowercase_value in true_strings:
+            return True
+        if lowercase_value in false_strings:
+            return False
+    raise ValueError(f"expected a boolean value (e.g. true or false), got {value!r}")
+
+
+def __convert_int(value) -> int:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        return int(value)
+    raise ValueError(f"expected an integer, got {value!r}")
+
+
+def __convert_float(value) -> float:
+    if isinstance(value, float):
+        return value
+    if isinstance(value, (int, str)) and not isinstance(value, bool):
+        return float(value)
+    raise ValueError(f"expected a number, got {value!r}")
+
+
+def __convert_str(value) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise ValueError(f"expected a string, got {value!r}")
+
+
+def __compile_enum_converter(enum_type: enum.EnumMeta) -> Callable:
+    value_map = enum_type._member_map_
+
+    def convert_enum(value):
+        # names are resolved to enum members later, the same way as for values from the command line
+        if isinstance(value, enum_type) or (isinstance(value, str) and value in value_map):
+            return value
+        raise ValueError(f"expected one of {list(value_map.keys())}, got {value!r}")
+
+    return convert_enum
+
+
+def __compile_generic_converter(value_type: Callable) -> Callable:
+    def convert_generic(value):
+        # mirror argparse, which only applies the type to string values
+        if isinstance(value, str):
+            return value_type(value)
+        if isinstance(value_type, type) and not isinstance(value, value_type):
+            raise ValueError(f"expected a value of type {value_type.__name__:s}, got {value!r}")
+        return value
+
+    return convert_generic
+
+
+def __compile_item_converter(parameter: Parameter) -> Callable:
+    if parameter.type == 'bool_flag':
+        return __convert_bool_flag
+    if parameter.value_map is not None:
+        return __compile_enum_converter(parameter.type)
+    if parameter.type is int:
+        return __convert_int
+    if parameter.type is float:
+        return __convert_float
+    if parameter.type is str:
+        return __convert_str
+    if callable(parameter.type):
+        return __compile_generic_converter(parameter.type)
+    return lambda value: value
+
+
+def compile_converter(parameter: Parameter) -> Callable:
+    """
+    Build a function that checks a single parameter value (as it would come from a settings file) & converts it to the
+    type of the parameter, raising ValueError or TypeError if that's not possible. Enum values are checked against
+    the enum names, but are left as names. Parameters accepting multiple arguments (see nargs) require a list, which a
+    single value is wrapped into (parameters with array storage also accept arrays & sidecar file references). None
+    (e.g. null in YAML) is accepted for any parameter & taken as is.
+    @param parameter: the parameter
+    @return: the converter
+    """
+    convert_item = __compile_item_converter(parameter)
+    nargs = parameter.nargs
+
+    if nargs in ('?', None) or parameter.type == 'bool_flag':
+        def convert(value):
+            if value is None:
+                return value
+            return convert_item(value)
+        return convert
+
+    def convert_list(value):
+        if value is None:
+            return value
+        if not isinstance(value, (list, tuple)):
+            value = [value]
+        if nargs == '+' and len(value) == 0:
+            raise ValueError("expected at least one value, got an empty list")
+        if isinstance(nargs, int) and len(value) != nargs:
+            raise ValueError(f"expected {nargs:d} values, got {len(value):d}")
+        return [convert_item(item) for item in value]
+
+    if parameter.array_storage is not None:
+        def convert_array(value):
+            # sidecar file references & arrays are resolved or taken as they are later, see load_array_values
+            if is_sidecar_reference(value) or is_array(value):
+                return value
+            return convert_list(value)
+        return convert_array
+
+    return convert_list
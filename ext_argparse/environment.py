@@ -0,0 +1,60 @@
+#  ================================================================
+#  Created by Gregory Kramida on 10/17/26.
+#  Copyright (c) 2026 Gregory Kramida
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  ================================================================
+import os
+from typing import Type, Mapping, Union
+
+from ext_argparse.param_enum import ParameterEnum
+from ext_argparse.conversion import SettingsValueError
+from ext_argparse.schema import compile_schema
+
+
+def read_environment_values(parameter_enum: Type[ParameterEnum], prefix: str,
+                            environment: Union[Mapping[str, str], None] = None) -> dict:
+    """
+    Read parameter values from environment variables. The variable name for each parameter is derived from its dotted
+    path, e.g. the value of Parameters.group_a.int_param is read from APP_GROUP_A__INT_PARAM for the prefix 'APP'.
+    Console-only parameters are read as well. Values are converted to the parameter type, with whitespace-separated
+    lists for parameters that accept multiple arguments, and 1/0, true/false, yes/no, or on/off for boolean flags.
+    @param parameter_enum: the (root) ParameterEnum class
+    @param prefix: prefix of the environment variable names, without the trailing underscore (may be empty)
+    @param environment: mapping of environment variables to read from (os.environ is used if None)
+    @return: a new flat dictionary mapping dotted parameter paths to values, for the variables that are set
+    @raise SettingsValueError: if any of the values cannot be converted, listing all such values
+    """
+    if environment is None:
+        environment = os.environ
+    schema = compile_schema(parameter_enum)
+    index = schema.environment_variable_index(prefix)
+    name_start = prefix + "_" if prefix else ""
+    values = {}
+    # a single pass over the environment, with a dictionary lookup for each candidate variable
+    for variable_name, string_value in environment.items():
+        if not variable_name.startswith(name_start):
+            continue
+        entry = index.get(variable_name)
+        if entry is not None:
+            if entry.parameter.nargs not in ('?', None) and not entry.is_bool_flag:
+                # multiple values are separated by whitespace, as they would be on the command line
+                values[entry.path] = string_value.split()
+            else:
+                values[entry.path] = string_value
+    try:
+        return schema.convert_values(values, source="environment variables")
+    except SettingsValueError as error:
+        # report variable names rather than parameter paths
+        names_by_path = {entry.path: variable_name for variable_name, entry in index.items()}
+        raise SettingsValueError([(names_by_path[path], message) for path, message in error.errors],
+                                 error.source) from None
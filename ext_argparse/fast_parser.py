@@ -0,0 +1,287 @@
+#  ================================================================
+#  Created by Gregory Kramida on 10/17/26.
+#  Copyright (c) 2026 Gregory Kramida
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  ================================================================
+import argparse
+import re
+import weakref
+from typing import Type, List, Dict, Union, Callable
+
+from ext_argparse.argproc import ArgumentProcessor
+from ext_argparse.param_enum import ParameterEnum
+from ext_argparse.parameter import Parameter
+from ext_argparse.schema import compile_schema, ParameterSchema
+
+# regular expressions argparse uses to allocate arguments to positionals, for chunks without '--'
+_positional_nargs_patterns = {None: "(A)", '?': "(A?)", '*': "(A*)", '+': "(A+)"}
+_supported_option_nargs = (None, '?', '*', '+')
+
+
+def _identity(value):
+    return value
+
+
+class _FastAction(object):
+    """ Counterpart of a single argparse action, i.e. of a single destination in the resulting namespace. """
+    __slots__ = ("dest", "default_key", "const", "nargs", "type", "required", "supported")
+
+    def __init__(self, dest: str, default_key: str, nargs=None, value_type: Callable = _identity,
+                 const=None, required: bool = False, supported: bool = True):
+        self.dest = dest
+        # key of the default value in the defaults dictionary
+        self.default_key = default_key
+        # value to store for store_true/store_false actions, None for store actions
+        self.const = const
+        self.nargs = nargs
+        self.type = value_type
+        self.required = required
+        self.supported = supported
+
+
+class _FallBack(Exception):
+    pass
+
+
+class FastArgumentParser(object):
+    """
+    Parser for the command line of process_arguments that uses a dictionary lookup of exact option strings instead of
+    argparse. Handles the common cases only, i.e. 'store' actions with nargs None, '?', '*' or '+', boolean flags,
+    and positionals, producing the same namespace argparse would. For anything else (e.g. help requests, abbreviated
+    or unknown options, '--', negative numbers, or invalid values), parse_args returns None, in which case argparse
+    should be used instead, e.g. to report the errors.
+    """
+
+    def __init__(self, schema: ParameterSchema):
+        # actions in the order argparse would add them, which determines the order of keys in the namespace
+        self.actions: List[_FastAction] = []
+        self.option_actions: Dict[str, _FastAction] = {}
+        self.positional_actions: List[_FastAction] = []
+        self.positional_pattern = None
+        # whether argparse would accept the parameter definitions in the first place
+        self.supported = True
+        try:
+            for entry in schema.entries:
+                if entry.parameter.console_only:
+                    self.__add_entry(entry)
+            self.__add_settings_file_actions()
+            for entry in schema.entries:
+                if not entry.parameter.console_only:
+                    self.__add_entry(entry)
+            for reserved_option_string in ("-h", "--help"):
+                if reserved_option_string in self.option_actions:
+                    raise _FallBack()
+        except _FallBack:
+            self.supported = False
+        if self.positional_actions:
+            self.positional_pattern = re.compile(
+                "".join(_positional_nargs_patterns[action.nargs] for action in self.positional_actions))
+
+    def __add_option(self, option_strings: List[str], action: _FastAction) -> None:
+        for option_string in option_strings:
+            if option_string in self.option_actions:
+                # argparse raises an error on conflicting option strings
+                raise _FallBack()
+            self.option_actions[option_string] = action
+        self.actions.append(action)
+
+    def __add_entry(self, entry) -> None:
+        parameter: Parameter = entry.parameter
+        if entry.is_bool_flag:
+            self.__add_option(["--" + entry.path, "-" + parameter.shorthand],
+                              _FastAction(entry.path, entry.path, const=True, required=parameter.required))
+            # argparse derives the destination of the negated flag from its option string
+            negated_option = "--" + entry.path[:-len(entry.name)] + "no-" + entry.name
+            self.__add_option([negated_option, "-n-" + parameter.shorthand],
+                              _FastAction(negated_option[2:].replace("-", "_"), entry.path, const=False,
+                                          required=parameter.required))
+            return
+        if parameter.action != 'store':
+            raise _FallBack()
+        value_type = str if entry.is_enum else parameter.type
+        if value_type is None:
+            value_type = _identity
+        if not callable(value_type) or parameter.nargs == 0:
+            raise _FallBack()
+        if parameter.positional:
+            action = _FastAction(entry.path, entry.path, parameter.nargs, value_type)
+            if parameter.nargs not in _positional_nargs_patterns:
+                raise _FallBack()
+            self.positional_actions.append(action)
+            self.actions.append(action)
+        else:
+            self.__add_option(["--" + entry.path, "-" + parameter.shorthand],
+                              _FastAction(entry.path, entry.path, parameter.nargs, value_type,
+                                          required=parameter.required,
+                                          supported=parameter.nargs in _supported_option_nargs))
+
+    def __add_settings_file_actions(self) -> None:
+        settings_file = ArgumentProcessor.settings_file
+        self.__add_option([ArgumentProcessor.settings_file_shorthand,
+                           "--" + ArgumentProcessor.settings_file_parameter_name],
+                          _FastAction(ArgumentProcessor.settings_file_parameter_name,
+                                      ArgumentProcessor.settings_file_parameter_name, settings_file.nargs,
+                                      settings_file.type, required=settings_file.required))
+        self.__add_option([ArgumentProcessor.save_settings_shorthand,
+                           "--" + ArgumentProcessor.save_settings_parameter_name],
+                          _FastAction(ArgumentProcessor.save_settings_parameter_name,
+                                      ArgumentProcessor.save_settings_parameter_name, const=True,
+                                      required=ArgumentProcessor.save_settings.required))
+
+    @staticmethod
+    def __convert(action: _FastAction, value: str):
+        try:
+            return action.type(value)
+        except (TypeError, ValueError, argparse.ArgumentTypeError):
+            # let argparse report the error
+            raise _FallBack()
+
+    def __parse_positionals(self, arguments: List[str], parsed_values: dict) -> None:
+        if not self.positional_actions:
+            if arguments:
+                raise _FallBack()
+            return
+        match = self.positional_pattern.match("A" * len(arguments))
+        if match is None or match.end() != len(arguments):
+            raise _FallBack()
+        i_argument = 0
+        for action, group in zip(self.positional_actions, match.groups()):
+            action_arguments = arguments[i_argument:i_argument + len(group)]
+            i_argument += len(group)
+            if action.nargs is None:
+                parsed_values[action.dest] = self.__convert(action, action_arguments[0])
+            elif action.nargs == '?':
+                if action_arguments:
+                    parsed_values[action.dest] = self.__convert(action, action_arguments[0])
+                else:
+                    # resolved from the default later on
+                    parsed_values[action.dest] = _positional_default
+            elif not action_arguments and action.nargs == '*':
+                parsed_values[action.dest] = _positional_default
+            else:
+                parsed_values[action.dest] = [self.__convert(action, argument) for argument in action_arguments]
+
+    def __parse(self, argv: List[str]) -> dict:
+        option_actions = self.option_actions
+        parsed_values = {}
+        positional_arguments = None
+        argument_count = len(argv)
+        i_argument = 0
+        while i_argument < argument_count:
+            argument = argv[i_argument]
+            if not argument.startswith("-"):
+                # a chunk of positional arguments
+                if positional_arguments is not None:
+                    # argparse allocates several chunks to positionals in a way not worth replicating here
+                    raise _FallBack()
+                i_chunk_start = i_argument
+                while i_argument < argument_count and not argv[i_argument].startswith("-"):
+                    i_argument += 1
+                positional_arguments = argv[i_chunk_start:i_argument]
+                continue
+
+            explicit_argument = None
+            action = option_actions.get(argument)
+            if action is None:
+                option_string, separator, explicit_argument = argument.partition("=")
+                action = option_actions.get(option_string) if separator else None
+                if action is None:
+                    # abbreviations, unknown options, '--', negative numbers, etc.
+                    raise _FallBack()
+            if not action.supported:
+                raise _FallBack()
+            i_argument += 1
+
+            if action.const is not None:
+                if explicit_argument is not None:
+                    raise _FallBack()
+                parsed_values[action.dest] = action.const
+                continue
+
+            if explicit_argument is not None:
+                action_arguments = [explicit_argument]
+            else:
+                i_end = i_argument
+                if action.nargs in ('*', '+'):
+                    while i_end < argument_count and not argv[i_end].startswith("-"):
+                        i_end += 1
+                elif i_argument < argument_count and not argv[i_argument].startswith("-"):
+                    i_end += 1
+                action_arguments = argv[i_argument:i_end]
+                i_argument = i_end
+
+            if action.nargs == '?':
+                parsed_values[action.dest] = self.__convert(action, action_arguments[0]) if action_arguments else None
+            elif action.nargs is None:
+                if not action_arguments:
+                    raise _FallBack()
+                parsed_values[action.dest] = self.__convert(action, action_arguments[0])
+            else:
+                if action.nargs == '+' and not action_arguments:
+                    raise _FallBack()
+                parsed_values[action.dest] = [self.__convert(action, value) for value in action_arguments]
+
+        self.__parse_positionals(positional_arguments or [], parsed_values)
+        return parsed_values
+
+    def parse_args(self, argv: List[str], defaults: dict) -> Union[argparse.Namespace, None]:
+        """
+        @param argv: command-line arguments (without the program name)
+        @param defaults: defaults dictionary, as passed to ArgumentProcessor.generate_parser
+        @return: the resulting namespace, identical to what the argparse-based parser would produce, or None if argv
+        has to be handled by argparse instead
+        """
+        if not self.supported:
+            return None
+        try:
+            parsed_values = self.__parse(argv)
+            namespace = argparse.Namespace()
+            namespace_dict = namespace.__dict__
+            for action in self.actions:
+                default = defaults[action.default_key]
+                if action.dest in parsed_values:
+                    value = parsed_values[action.dest]
+                    if value is _positional_default:
+                        value = default
+                        if action.nargs == '*' and value is None:
+                            value = []
+                        elif isinstance(value, str) and action.nargs == '?':
+                            value = self.__convert(action, value)
+                elif action.required:
+                    raise _FallBack()
+                elif isinstance(default, str) and action.const is None:
+                    # argparse applies the type to string defaults
+                    value = self.__convert(action, default)
+                else:
+                    value = default
+                namespace_dict.setdefault(action.dest, value)
+            for key, value in defaults.items():
+                namespace_dict.setdefault(key, value)
+        except _FallBack:
+            return None
+        return namespace
+
+
+_positional_default = object()
+
+# fast parsers, keyed by ParameterEnum class
+_fast_parser_cache = weakref.WeakKeyDictionary()
+
+
+def get_fast_parser(parameter_enum: Type[ParameterEnum]) -> FastArgumentParser:
+    """ @return: the fast command-line parser for the provided ParameterEnum class, built on first use """
+    fast_parser = _fast_parser_cache.get(parameter_enum)
+    if fast_parser is None:
+        fast_parser = FastArgumentParser(compile_schema(parameter_enum))
+        _fast_parser_cache[parameter_enum] = fast_parser
+    return fast_parser
@@ -0,0 +1,218 @@
+#  ================================================================
+#  Created by Gregory Kramida on 10/17/26.
+#  Copyright (c) 2026 Gregory Kramida
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  ================================================================
+import enum
+import functools
+import hashlib
+import json
+from typing import Type, Dict, FrozenSet, Iterable, List, Tuple, Union
+
+from ext_argparse.param_enum import ParameterEnum
+from ext_argparse.schema import compile_schema
+from ext_argparse.snapshot import RootSettingsSnapshot
+
+_digest_size = 32
+
+
+def _encode_value(value) -> str:
+    """
+    @return: canonical text form of a parameter value, independent of e.g. container or NumPy types, enum member
+    identity, and dictionary key order
+    """
+    if isinstance(value, enum.Enum):
+        value = value.name
+    elif hasattr(value, "tolist"):
+        # array.array, NumPy arrays & NumPy scalars
+        value = value.tolist()
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        # shortest representation that round-trips, regardless of float subclasses
+        return float.__repr__(value)
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(_encode_value(item) for item in value) + "]"
+    if isinstance(value, dict):
+        return "{" + ",".join(json.dumps(str(key), ensure_ascii=False) + ":" + _encode_value(value[key])
+                              for key in sorted(value.keys(), key=str)) + "}"
+    raise TypeError(f"Cannot encode a value of type {type(value).__name__:s} canonically: {value!r}")
+
+
+def _hash_leaf(value) -> bytes:
+    return hashlib.blake2b(_encode_value(value).encode("utf-8"), digest_size=_digest_size).digest()
+
+
+class _FingerprintLayout(object):
+    """ Parameters included in fingerprints of a ParameterEnum & the structure of its hash tree. """
+    __slots__ = ("included_paths", "group_children", "group_paths_deepest_first", "ancestor_group_paths")
+
+    def __init__(self, parameter_enum: Type[ParameterEnum], exclude_console_only: bool,
+                 exclude_setting_file_locations: bool, excluded_paths: FrozenSet[str]):
+        schema = compile_schema(parameter_enum)
+
+        def is_excluded(path: str) -> bool:
+            return any(path == excluded_path or path.startswith(excluded_path + ".")
+                       for excluded_path in excluded_paths)
+
+        self.included_paths: List[str] = [
+            entry.path for entry in schema.entries
+            if not ((exclude_console_only and entry.parameter.console_only) or
+                    (exclude_setting_file_locations and entry.parameter.setting_file_location) or
+                    is_excluded(entry.path))
+        ]
+        included_path_set = set(self.included_paths)
+        # children of each group, sorted by name: (name prefix for the hash input, dotted path, whether it's a group)
+        self.group_children: Dict[str, List[Tuple[bytes, str, bool]]] = {}
+        for group_path, member_names in schema.group_member_names.items():
+            children = []
+            for name in sorted(member_names):
+                path = group_path + "." + name if group_path else name
+                is_group = path in schema.group_path_set
+                if is_group or path in included_path_set:
+                    children.append((name.encode("utf-8") + b"\0", path, is_group))
+            self.group_children[group_path] = children
+        self.group_paths_deepest_first: List[str] = \
+            sorted(schema.group_member_names.keys(), key=lambda path: -(path.count(".") + 1 if path else 0))
+        self.ancestor_group_paths: Dict[str, Tuple[str, ...]] = {
+            path: tuple(".".join(path.split(".")[:depth]) for depth in range(path.count("."), -1, -1))
+            for path in self.included_paths
+        }
+
+    def hash_group(self, group_path: str, leaf_digests: Dict[str, bytes], group_digests: Dict[str, bytes]) -> bytes:
+        hasher = hashlib.blake2b(digest_size=_digest_size)
+        for name_prefix, path, is_group in self.group_children[group_path]:
+            hasher.update(name_prefix)
+            hasher.update(group_digests[path] if is_group else leaf_digests[path])
+        return hasher.digest()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_layout(parameter_enum: Type[ParameterEnum], exclude_console_only: bool,
+                exclude_setting_file_locations: bool, excluded_paths: FrozenSet[str]) -> _FingerprintLayout:
+    return _FingerprintLayout(parameter_enum, exclude_console_only, exclude_setting_file_locations, excluded_paths)
+
+
+def _get_flat_values(settings: Union[RootSettingsSnapshot, Type[ParameterEnum]]) -> Tuple[Type[ParameterEnum], dict]:
+    if isinstance(settings, RootSettingsSnapshot):
+        return settings._parameter_enum, settings._flat_values_
+    return settings, compile_schema(settings).generate_value_dict()
+
+
+class SettingsFingerprint(object):
+    """
+    Stable fingerprint of settings (BLAKE2b hash of their canonical encoding), e.g. to key caches of results computed
+    from them. The fingerprint is a hash tree following the parameter groups: each parameter value is hashed on its
+    own, and each group is hashed from the names & hashes of its members. Hence, the hash of any group only changes
+    when something within it does (see group_hexdigest), and a fingerprint can be updated for a few changed
+    parameters without re-hashing all others (see update). Fingerprints are immutable.
+    """
+    __slots__ = ("_layout", "_leaf_digests", "_group_digests")
+
+    def __init__(self, layout: _FingerprintLayout, leaf_digests: Dict[str, bytes], group_digests: Dict[str, bytes]):
+        self._layout = layout
+        self._leaf_digests = leaf_digests
+        self._group_digests = group_digests
+
+    @property
+    def digest(self) -> bytes:
+        return self._group_digests[""]
+
+    @property
+    def hexdigest(self) -> str:
+        return self._group_digests[""].hex()
+
+    def group_hexdigest(self, group_path: str) -> str:
+        """
+        @param group_path: dotted path of a group of parameters, or "" for the root group
+        @return: hash of the values of all (included) parameters within the group
+        """
+        if group_path not in self._group_digests:
+            raise KeyError(f"No parameter group at path '{group_path:s}'.")
+        return self._group_digests[group_path].hex()
+
+    def update(self, settings: Union[RootSettingsSnapshot, dict], changed_paths: Iterable[str]) -> \
+            "SettingsFingerprint":
+        """
+        Compute the fingerprint of settings that differ from the fingerprinted ones only in the provided parameters,
+        re-hashing just those parameters & the groups containing them. Fits e.g. callbacks of SettingsFileWatcher.
+        @param settings: the new settings, either a snapshot or a flat dictionary mapping dotted parameter paths to
+        values (which only needs to hold the changed ones)
+        @param changed_paths: dotted paths of parameters that changed
+        @return: the new fingerprint
+        """
+        flat_values = settings._flat_values_ if isinstance(settings, RootSettingsSnapshot) else settings
+        layout = self._layout
+        leaf_digests = dict(self._leaf_digests)
+        stale_group_paths = set()
+        for path in changed_paths:
+            if path in leaf_digests:
+                leaf_digests[path] = _hash_leaf(flat_values[path])
+                stale_group_paths.update(layout.ancestor_group_paths[path])
+        if not stale_group_paths:
+            return self
+        group_digests = dict(self._group_digests)
+        for group_path in layout.group_paths_deepest_first:
+            if group_path in stale_group_paths:
+                group_digests[group_path] = layout.hash_group(group_path, leaf_digests, group_digests)
+        return SettingsFingerprint(layout, leaf_digests, group_digests)
+
+    def __eq__(self, other):
+        return isinstance(other, SettingsFingerprint) and self.digest == other.digest
+
+    def __hash__(self):
+        return hash(self.digest)
+
+    def __repr__(self):
+        return f"SettingsFingerprint({self.hexdigest:s})"
+
+
+def compute_settings_fingerprint(settings: Union[RootSettingsSnapshot, Type[ParameterEnum]],
+                                 exclude_console_only: bool = False, exclude_setting_file_locations: bool = False,
+                                 excluded_paths: Iterable[str] = ()) -> SettingsFingerprint:
+    """
+    @param settings: a settings snapshot, or a ParameterEnum class to fingerprint the current values of
+    @param exclude_console_only: whether to leave out parameters that can only be set from the command line
+    @param exclude_setting_file_locations: whether to leave out parameters marked as setting_file_location (paths that
+    usually don't affect results)
+    @param excluded_paths: dotted paths of further parameters or whole groups of parameters to leave out
+    @return: fingerprint of the settings
+    """
+    parameter_enum, flat_values = _get_flat_values(settings)
+    layout = _get_layout(parameter_enum, exclude_console_only, exclude_setting_file_locations,
+                         frozenset(excluded_paths))
+    leaf_digests = {path: _hash_leaf(flat_values[path]) for path in layout.included_paths}
+    group_digests = {}
+    for group_path in layout.group_paths_deepest_first:
+        group_digests[group_path] = layout.hash_group(group_path, leaf_digests, group_digests)
+    return SettingsFingerprint(layout, leaf_digests, group_digests)
+
+
+def canonicalize_settings(settings: Union[RootSettingsSnapshot, Type[ParameterEnum]],
+                          exclude_console_only: bool = False, exclude_setting_file_locations: bool = False,
+                          excluded_paths: Iterable[str] = ()) -> str:
+    """
+    Encode settings canonically: one "dotted.path=value" line per parameter, sorted by path, with enum values given by
+    name, floats in their shortest round-trip form, and strings, lists & arrays in JSON-like notation.
+    See compute_settings_fingerprint for the arguments.
+    """
+    parameter_enum, flat_values = _get_flat_values(settings)
+    layout = _get_layout(parameter_enum, exclude_console_only, exclude_setting_file_locations,
+                         frozenset(excluded_paths))
+    return "\n".join(path + "=" + _encode_value(flat_values[path]) for path in sorted(layout.included_paths))
@@ -0,0 +1,413 @@
+#  ================================================================
+#  Created by Gregory Kramida on 10/17/26.
+#  Copyright (c) 2026 Gregory Kramida
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  ================================================================
+import abc
+import json
+import marshal
+import math
+import os
+import re
+from io import StringIO
+from pathlib import Path
+from typing import Dict, Tuple, Union, List, Collection
+
+
+class SettingsFileFormat(abc.ABC):
+    """
+    Backend for reading & writing settings files in a particular format. Subclass this (implementing load & dumps) &
+    pass an instance to register_settings_file_format to add support for another format.
+    """
+    # name of the format, for error messages
+    name = "N/A"
+    # lowercase file extensions (including the leading dot) of files in this format
+    extensions: Tuple[str, ...] = ()
+    # whether help comments can be written to files in this format
+    supports_comments = False
+
+    @abc.abstractmethod
+    def load(self, settings_file: Union[str, Path], round_trip: bool = False):
+        """
+        @param settings_file: path to the settings file
+        @param round_trip: whether to preserve comments & formatting for writing back (if the format supports it)
+        @return: the loaded (nested) settings dictionary, or None if the file is empty
+        """
+
+    def load_filtered(self, settings_file: Union[str, Path], leaf_paths: Collection[str],
+                      group_paths: Collection[str]) -> dict:
+        """
+        Load only the entries of a settings file at the provided dotted paths. Formats that can skip other entries
+        without fully parsing them override this, the default implementation loads the whole file.
+        @param settings_file: path to the settings file
+        @param leaf_paths: dotted paths of the entries to load, e.g. of parameters
+        @param group_paths: dotted paths of nested dictionaries holding entries to load (including nested groups)
+        @return: flat dictionary mapping dotted paths (out of leaf_paths) to values
+        """
+        filtered_values = {}
+        settings = self.load(settings_file)
+        if isinstance(settings, dict):
+            _filter_nested_settings(settings, "", leaf_paths, group_paths, filtered_values)
+        return filtered_values
+
+    @abc.abstractmethod
+    def dumps(self, settings: dict, tab_width: int = 4) -> Union[str, bytes]:
+        """
+        @param settings: the (nested) settings dictionary
+        @param tab_width: indentation width, for text formats that nest via indentation
+        @return: contents of the settings file, bytes for binary formats
+        """
+
+
+def _filter_nested_settings(settings: dict, prefix: str, leaf_paths: Collection[str], group_paths: Collection[str],
+                            filtered_values: dict) -> None:
+    for key, value in settings.items():
+        path = prefix + str(key)
+        if path in group_paths:
+            if isinstance(value, dict):
+                _filter_nested_settings(value, path + ".", leaf_paths, group_paths, filtered_values)
+        elif path in leaf_paths and not isinstance(value, dict):
+            filtered_values[path] = value
+
+
+class _UnsupportedYamlStructure(Exception):
+    pass
+
+
+class _YamlEventFilter(object):
+    """
+    Walks the parser events of a YAML document, building nodes (and, from them, values) only for entries at known
+    paths & skipping over the events of all other entries.
+    """
+
+    def __init__(self, yaml, events, leaf_paths: Collection[str], group_paths: Collection[str]):
+        from ruamel.yaml import events as yaml_events
+        from ruamel.yaml import nodes as yaml_nodes
+        self.yaml_events = yaml_events
+        self.yaml_nodes = yaml_nodes
+        self.resolver = yaml.resolver
+        self.constructor = yaml.constructor
+        self.events = events
+        self.leaf_paths = leaf_paths
+        self.group_paths = group_paths
+
+    def filter(self) -> dict:
+        yaml_events = self.yaml_events
+        filtered_values = {}
+        event = next(self.events)  # stream start
+        event = next(self.events)
+        if isinstance(event, yaml_events.StreamEndEvent):
+            return filtered_values
+        root_event = next(self.events)
+        if isinstance(root_event, yaml_events.MappingStartEvent):
+            self.__walk_mapping("", filtered_values)
+        elif not isinstance(root_event, yaml_events.ScalarEvent):
+            raise _UnsupportedYamlStructure()
+        next(self.events)  # document end
+        if not isinstance(next(self.events), yaml_events.StreamEndEvent):
+            # multiple documents, which the full loader rejects
+            raise _UnsupportedYamlStructure()
+        return filtered_values
+
+    def __check_key(self, seen_keys: set, key_event) -> None:
+        # keys are compared by their constructed values, as in the full loader, e.g. a & "a" are the same key, as are
+        # ~ & null or 1 & 0x1, but 1 & "1" aren't
+        tag = key_event.tag
+        if tag is None or tag == "!":
+            tag = self.resolver.resolve(self.yaml_nodes.ScalarNode, key_event.value, key_event.implicit)
+        if tag == "tag:yaml.org,2002:str":
+            key = key_event.value
+        else:
+            construct = self.constructor.yaml_constructors.get(tag)
+            if construct is None or not tag.startswith("tag:yaml.org,2002:"):
+                # tags the full loader may not be able to construct
+                raise _UnsupportedYamlStructure()
+            try:
+                key = construct(self.constructor, self.yaml_nodes.ScalarNode(tag, key_event.value))
+                hash(key)
+            except Exception:
+                raise _UnsupportedYamlStructure()
+        if key in seen_keys:
+            # duplicate keys, which the full loader rejects
+            raise _UnsupportedYamlStructure()
+        seen_keys.add(key)
+
+    def __walk_mapping(self, prefix: str, filtered_values: dict) -> None:
+        yaml_events = self.yaml_events
+        seen_keys = set()
+        for key_event in self.events:
+            if isinstance(key_event, yaml_events.MappingEndEvent):
+                return
+            if not isinstance(key_event, yaml_events.ScalarEvent) or key_event.value == "<<":
+                # complex keys, aliases as keys & merge keys
+                raise _UnsupportedYamlStructure()
+            self.__check_key(seen_keys, key_event)
+            path = prefix + key_event.value
+            value_event = next(self.events)
+            if isinstance(value_event, yaml_events.AliasEvent) and (path in self.group_paths or
+                                                                    path in self.leaf_paths):
+                raise _UnsupportedYamlStructure()
+            is_mapping = isinstance(value_event, yaml_events.MappingStartEvent)
+            if path in self.group_paths and is_mapping:
+                self.__walk_mapping(path + ".", filtered_values)
+            elif path in self.leaf_paths and not is_mapping:
+                filtered_values[path] = self.constructor.construct_object(self.__compose(value_event), deep=True)
+            else:
+                self.__skip(value_event)
+
+    def __skip(self, event) -> None:
+        yaml_events = self.yaml_events
+        start_events = (yaml_events.MappingStartEvent, yaml_events.SequenceStartEvent)
+        if not isinstance(event, start_events):
+            return
+        # for each open collection: the keys seen so far (None for sequences) & the number of nodes within it, in
+        # order to still detect duplicate keys
+        open_collections = [[set() if isinstance(event, yaml_events.MappingStartEvent) else None, 0]]
+        for event in self.events:
+            if isinstance(event, (yaml_events.MappingEndEvent, yaml_events.SequenceEndEvent)):
+                open_collections.pop()
+                if not open_collections:
+                    return
+                open_collections[-1][1] += 1
+                continue
+            seen_keys, node_count = open_collections[-1]
+            if seen_keys is not None and node_count % 2 == 0 and isinstance(event, yaml_events.ScalarEvent):
+                self.__check_key(seen_keys, event)
+            if isinstance(event, start_events):
+                open_collections.append([set() if isinstance(event, yaml_events.MappingStartEvent) else None, 0])
+            else:
+                open_collections[-1][1] += 1
+
+    def __compose(self, event):
+        # mirrors the composer, minus anchor handling
+        yaml_events = self.yaml_events
+        yaml_nodes = self.yaml_nodes
+        if isinstance(event, yaml_events.ScalarEvent):
+            tag = event.tag
+            if tag is None or tag == "!":
+                tag = self.resolver.resolve(yaml_nodes.ScalarNode, event.value, event.implicit)
+            return yaml_nodes.ScalarNode(tag, event.value, style=event.style)
+        if isinstance(event, yaml_events.SequenceStartEvent):
+            tag = event.tag
+            if tag is None or tag == "!":
+                tag = self.resolver.resolve(yaml_nodes.SequenceNode, None, event.implicit)
+            items = []
+            for item_event in self.events:
+                if isinstance(item_event, yaml_events.SequenceEndEvent):
+                    break
+                items.append(self.__compose(item_event))
+            return yaml_nodes.SequenceNode(tag, items, flow_style=event.flow_style)
+        if isinstance(event, yaml_events.MappingStartEvent):
+            tag = event.tag
+            if tag is None or tag == "!":
+                tag = self.resolver.resolve(yaml_nodes.MappingNode, None, event.implicit)
+            pairs = []
+            seen_keys = set()
+            for key_event in self.events:
+                if isinstance(key_event, yaml_events.MappingEndEvent):
+                    break
+                if isinstance(key_event, yaml_events.ScalarEvent):
+                    if key_event.value == "<<":
+                        raise _UnsupportedYamlStructure()
+                    self.__check_key(seen_keys, key_event)
+                pairs.append((self.__compose(key_event), self.__compose(next(self.events))))
+            return yaml_nodes.MappingNode(tag, pairs, flow_style=event.flow_style)
+        # aliases
+        raise _UnsupportedYamlStructure()
+
+
+class YamlSettingsFileFormat(SettingsFileFormat):
+    name = "YAML"
+    extensions = (".yaml", ".yml")
+    supports_comments = True
+
+    def load(self, settings_file: Union[str, Path], round_trip: bool = False):
+        from ruamel.yaml import YAML
+        # the safe loader is C-accelerated if ruamel.yaml.clib is available & produces plain dicts & lists, the
+        # round-trip loader is needed whenever the loaded structure is to be written back to the file
+        yaml = YAML(typ='rt' if round_trip else 'safe')
+        return yaml.load(Path(settings_file))
+
+    def load_filtered(self, settings_file: Union[str, Path], leaf_paths: Collection[str],
+                      group_paths: Collection[str]) -> dict:
+        """
+        Load only the entries of a settings file at the provided dotted paths (see SettingsFileFormat.load_filtered),
+        driven by parser events: nodes are only built for the entries that are loaded, other entries are skipped
+        event by event. Falls back to loading the whole file (and hence raises the same errors) for documents with
+        aliases, merge keys, or complex keys in relevant places, as well as for duplicate keys & multiple documents.
+        """
+        from ruamel.yaml import YAML
+        yaml = YAML(typ='safe')
+        with open(settings_file, 'r', encoding="utf-8") as file:
+            try:
+                return _YamlEventFilter(yaml, iter(yaml.parse(file)), leaf_paths, group_paths).filter()
+            except _UnsupportedYamlStructure:
+                pass
+        return super().load_filtered(settings_file, leaf_paths, group_paths)
+
+    def dumps(self, settings: dict, tab_width: int = 4) -> str:
+        string_stream = StringIO()
+        self.dump(settings, string_stream, tab_width)
+        return string_stream.getvalue()
+
+    @staticmethod
+    def dump(settings: dict, stream, tab_width: int = 4) -> None:
+        from ruamel.yaml import YAML
+        yaml = YAML(typ='rt')
+        yaml.indent = tab_width
+        yaml.default_flow_style = False
+        yaml.dump(settings, stream)
+
+
+class JsonSettingsFileFormat(SettingsFileFormat):
+    name = "JSON"
+    extensions = (".json",)
+
+    def load(self, settings_file: Union[str, Path], round_trip: bool = False):
+        with open(settings_file, 'r', encoding="utf-8") as file:
+            contents = file.read()
+        return json.loads(contents) if contents.strip() else None
+
+    def dumps(self, settings: dict, tab_width: int = 4) -> str:
+        return json.dumps(settings, indent=tab_width) + "\n"
+
+
+_bare_toml_key_pattern = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+class TomlSettingsFileFormat(SettingsFileFormat):
+    """
+    TOML, read via tomllib (Python 3.11+) or the tomli package. Since TOML has no null value, parameters set to None
+    are left out when writing (and hence take on their default values when read back). Consequently, a parameter can
+    only be stored as None in a TOML settings file if None is its default value.
+    """
+    name = "TOML"
+    extensions = (".toml",)
+
+    def load(self, settings_file: Union[str, Path], round_trip: bool = False):
+        try:
+            import tomllib
+        except ImportError:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ImportError("Reading TOML settings files requires Python 3.11+ or the 'tomli' package.")
+        with open(settings_file, 'rb') as file:
+            return tomllib.load(file)
+
+    @staticmethod
+    def __format_key(key: str) -> str:
+        return key if _bare_toml_key_pattern.match(key) else json.dumps(key, ensure_ascii=False)
+
+    @staticmethod
+    def __format_value(value) -> str:
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, float):
+            if math.isnan(value):
+                return "nan"
+            if math.isinf(value):
+                return "inf" if value > 0 else "-inf"
+            return repr(value)
+        if isinstance(value, int):
+            return str(value)
+        if isinstance(value, str):
+            # JSON string escapes are a subset of those in TOML basic strings
+            return json.dumps(value, ensure_ascii=False)
+        if isinstance(value, (list, tuple)):
+            return "[" + ", ".join(TomlSettingsFileFormat.__format_value(item) for item in value) + "]"
+        raise ValueError(f"Cannot write value {value!r} of type {type(value).__name__:s} to a TOML settings file.")
+
+    def __write_table(self, table: dict, table_path: List[str], lines: List[str]) -> None:
+        # key/value pairs have to precede any sub-tables
+        if table_path:
+            lines.append("[" + ".".join(self.__format_key(key) for key in table_path) + "]")
+        for key, value in table.items():
+            if not isinstance(value, dict) and value is not None:
+                lines.append(self.__format_key(key) + " = " + self.__format_value(value))
+        for key, value in table.items():
+            if isinstance(value, dict):
+                lines.append("")
+                self.__write_table(value, table_path + [key], lines)
+
+    def dumps(self, settings: dict, tab_width: int = 4) -> str:
+        lines = []
+        self.__write_table(settings, [], lines)
+        return "\n".join(lines).lstrip("\n") + "\n"
+
+
+class MarshalSettingsFileFormat(SettingsFileFormat):
+    """
+    Python's built-in binary serialization, which is very fast to read & write. Intended for machine-generated settings
+    files: the format is not human-readable and may change between Python versions.
+    """
+    name = "marshal"
+    extensions = (".marshal",)
+
+    def load(self, settings_file: Union[str, Path], round_trip: bool = False):
+        with open(settings_file, 'rb') as file:
+            contents = file.read()
+        return marshal.loads(contents) if contents else None
+
+    def dumps(self, settings: dict, tab_width: int = 4) -> bytes:
+        return marshal.dumps(settings)
+
+
+class MessagePackSettingsFileFormat(SettingsFileFormat):
+    """ Compact binary format, requires the 'msgpack' package. Intended for machine-generated settings files. """
+    name = "MessagePack"
+    extensions = (".msgpack", ".mpk")
+
+    @staticmethod
+    def __import_msgpack():
+        try:
+            import msgpack
+        except ImportError:
+            raise ImportError("MessagePack settings files require the 'msgpack' package.")
+        return msgpack
+
+    def load(self, settings_file: Union[str, Path], round_trip: bool = False):
+        msgpack = self.__import_msgpack()
+        with open(settings_file, 'rb') as file:
+            contents = file.read()
+        return msgpack.unpackb(contents) if contents else None
+
+    def dumps(self, settings: dict, tab_width: int = 4) -> bytes:
+        return self.__import_msgpack().packb(settings)
+
+
+_default_settings_file_format = YamlSettingsFileFormat()
+_settings_file_formats_by_extension: Dict[str, SettingsFileFormat] = {}
+
+
+def register_settings_file_format(settings_file_format: SettingsFileFormat) -> None:
+    """
+    Use the provided format for all settings files with any of its extensions (replacing the formats previously
+    registered for these extensions).
+    """
+    for extension in settings_file_format.extensions:
+        _settings_file_formats_by_extension[extension.lower()] = settings_file_format
+
+
+def get_settings_file_format(settings_file: Union[str, Path]) -> SettingsFileFormat:
+    """
+    @param settings_file: path to the settings file
+    @return: format for the settings file, chosen by its extension. YAML is used for unknown extensions.
+    """
+    extension = os.path.splitext(settings_file)[1].lower()
+    return _settings_file_formats_by_extension.get(extension, _default_settings_file_format)
+
+
+for _settings_file_format in (_default_settings_file_format, JsonSettingsFileFormat(), TomlSettingsFileFormat(),
+                              MarshalSettingsFileFormat(), MessagePackSettingsFileFormat()):
+    register_settings_file_format(_settings_file_format)
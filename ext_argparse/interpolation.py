@@ -0,0 +1,221 @@
+#  ================================================================
+#  Created by Gregory Kramida on 10/17/26.
+#  Copyright (c) 2026 Gregory Kramida
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  ================================================================
+import enum
+import functools
+import os
+import re
+from typing import List, Tuple, Union, Mapping, Dict
+
+from ext_argparse.conversion import SettingsValueError
+from ext_argparse.parameter import Parameter
+from ext_argparse.schema import ParameterSchema
+
+# '$${' stands for a literal '${'
+_reference_pattern = re.compile(r"\$(\$\{)|\$\{([^}]*)\}")
+_environment_prefix = "env:"
+settings_file_location_reference = "settings_file_location"
+
+
+class InterpolationError(ValueError):
+    """ Raised when a reference in a parameter value cannot be resolved, e.g. because of a reference cycle. """
+    pass
+
+
+class _Reference(object):
+    __slots__ = ("kind", "name", "text")
+    PARAMETER = 0
+    ENVIRONMENT_VARIABLE = 1
+    SETTINGS_FILE_LOCATION = 2
+
+    def __init__(self, kind: int, name: str, text: str = ""):
+        self.kind = kind
+        self.name = name
+        # the reference as written, e.g. ${name}
+        self.text = text
+
+
+class _Template(object):
+    """ A string value split into literal parts & references. """
+    __slots__ = ("parts", "is_single_reference")
+
+    def __init__(self, parts: List[Union[str, _Reference]]):
+        self.parts = parts
+        # a value consisting of a single reference takes on the referenced value as is, i.e. keeps its type
+        self.is_single_reference = len(parts) == 1 and isinstance(parts[0], _Reference)
+
+
+_settings_file_location_template = _Template([_Reference(_Reference.SETTINGS_FILE_LOCATION, "")])
+
+
+@functools.lru_cache(maxsize=4096)
+def compile_template(text: str) -> _Template:
+    """
+    Split a string value into literals and ${...} references: ${group.parameter} refers to another parameter,
+    ${env:NAME} to an environment variable, and ${settings_file_location} to the directory of the settings file.
+    Use $${ for a literal ${. References to names that aren't parameters are left as they are, so that values like
+    "echo ${HOME}" keep working. Compiled templates are cached.
+    """
+    parts = []
+    position = 0
+    for match in _reference_pattern.finditer(text):
+        if match.start() > position:
+            parts.append(text[position:match.start()])
+        if match.group(1) is not None:
+            parts.append(match.group(1))
+        else:
+            name = match.group(2).strip()
+            if name.startswith(_environment_prefix):
+                parts.append(_Reference(_Reference.ENVIRONMENT_VARIABLE, name[len(_environment_prefix):],
+                                        match.group(0)))
+            elif name == settings_file_location_reference:
+                parts.append(_Reference(_Reference.SETTINGS_FILE_LOCATION, name, match.group(0)))
+            else:
+                parts.append(_Reference(_Reference.PARAMETER, name, match.group(0)))
+        position = match.end()
+    if position < len(text):
+        parts.append(text[position:])
+    # merge adjacent literals (e.g. around escapes)
+    merged_parts = []
+    for part in parts:
+        if isinstance(part, str) and merged_parts and isinstance(merged_parts[-1], str):
+            merged_parts[-1] += part
+        else:
+            merged_parts.append(part)
+    return _Template(merged_parts)
+
+
+def is_template(value) -> bool:
+    """ @return: whether the value is a string that needs interpolation """
+    return isinstance(value, str) and "${" in value
+
+
+class DeferredTemplate(object):
+    """
+    Stands in for a string with references (or another string value resolved after parsing) among parser defaults, so
+    that argparse doesn't try to apply the type of the parameter to it before it is resolved.
+    """
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+def _format_value(value) -> str:
+    if isinstance(value, enum.Enum):
+        return value.name
+    if isinstance(value, (list, tuple)):
+        return " ".join(_format_value(item) for item in value)
+    return str(value)
+
+
+class _Resolver(object):
+    """ Evaluates templates in dependency order, memoizing results & detecting reference cycles. """
+
+    def __init__(self, schema: ParameterSchema, flat_values: dict, templates: Dict[str, object],
+                 settings_file: Union[str, None], environment: Mapping[str, str]):
+        self.schema = schema
+        self.flat_values = flat_values
+        self.templates = templates
+        self.settings_file = settings_file
+        self.environment = environment
+        self.resolved_values = {}
+        self.visiting_paths: List[str] = []
+
+    def resolve(self, path: str):
+        if path in self.resolved_values:
+            return self.resolved_values[path]
+        if path not in self.templates:
+            return self.flat_values[path]
+        if path in self.visiting_paths:
+            cycle = self.visiting_paths[self.visiting_paths.index(path):] + [path]
+            raise InterpolationError("Reference cycle in parameter values: " + " -> ".join(cycle))
+        self.visiting_paths.append(path)
+        template = self.templates[path]
+        if isinstance(template, list):
+            value = [self.evaluate(path, item) if isinstance(item, _Template) else item for item in template]
+        else:
+            value = self.evaluate(path, template)
+        self.visiting_paths.pop()
+        self.resolved_values[path] = value
+        return value
+
+    def evaluate_reference(self, path: str, reference: _Reference):
+        if reference.kind == _Reference.PARAMETER:
+            if reference.name not in self.schema.entries_by_path:
+                # not meant as a reference, e.g. a shell variable in a command
+                return reference.text
+            return self.resolve(reference.name)
+        if reference.kind == _Reference.ENVIRONMENT_VARIABLE:
+            if reference.name not in self.environment:
+                raise InterpolationError(f"Value of '{path:s}' refers to environment variable '{reference.name:s}', "
+                                         f"which is not set.")
+            return self.environment[reference.name]
+        if self.settings_file is None:
+            raise InterpolationError(f"Value of '{path:s}' refers to the settings file location, but there is no "
+                                     f"settings file.")
+        return os.path.dirname(self.settings_file)
+
+    def evaluate(self, path: str, template: _Template):
+        if template.is_single_reference:
+            return self.evaluate_reference(path, template.parts[0])
+        return "".join(part if isinstance(part, str) else _format_value(self.evaluate_reference(path, part))
+                       for part in template.parts)
+
+
+def resolve_interpolations(schema: ParameterSchema, flat_values: dict, settings_file: Union[str, None] = None,
+                           environment: Union[Mapping[str, str], None] = None) -> dict:
+    """
+    Resolve ${...} references (see compile_template) in string values, as well as the setting file location wildcard
+    (see Parameter.setting_file_location_wildcard) in values of parameters that allow it. References between
+    parameters are evaluated in dependency order, each at most once. Resolved values are converted to the types of
+    their parameters.
+    @param schema: compiled schema of the ParameterEnum the values are for
+    @param flat_values: dictionary mapping dotted parameter paths to values
+    @param settings_file: path to the settings file (if any)
+    @param environment: mapping of environment variables to use (os.environ is used if None)
+    @return: a new dictionary mapping dotted paths of the parameters whose values had references to resolved values
+    @raise InterpolationError: if a reference cannot be resolved or references form a cycle
+    @raise SettingsValueError: if resolved values cannot be converted to the types of their parameters
+    """
+    templates = {}
+    for entry in schema.entries:
+        value = flat_values.get(entry.path)
+        if isinstance(value, str):
+            if entry.parameter.setting_file_location and value == Parameter.setting_file_location_wildcard:
+                if settings_file is not None:
+                    templates[entry.path] = _settings_file_location_template
+            elif "${" in value:
+                templates[entry.path] = compile_template(value)
+        elif isinstance(value, list) and any(is_template(item) for item in value):
+            templates[entry.path] = [compile_template(item) if is_template(item) else item for item in value]
+    if not templates:
+        return {}
+
+    resolver = _Resolver(schema, flat_values, templates, settings_file,
+                         os.environ if environment is None else environment)
+    for path in templates.keys():
+        resolver.resolve(path)
+
+    resolved_values = {}
+    errors: List[Tuple[str, str]] = []
+    for path, value in resolver.resolved_values.items():
+        try:
+            resolved_values[path] = schema.converters[path](value)
+        except (ValueError, TypeError) as error:
+            errors.append((path, str(error)))
+    if errors:
+        raise SettingsValueError(errors, "interpolated parameter values")
+    return resolved_values
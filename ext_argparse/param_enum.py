@@ -1,5 +1,18 @@
+import contextvars
 from enum import Enum, EnumMeta, _EnumDict
 
+# settings snapshot bound to the current thread / asynchronous task, if any (see ext_argparse.snapshot.bind_settings)
+_bound_settings = contextvars.ContextVar("ext_argparse_bound_settings", default=None)
+# settings snapshot installed for the whole process, if any (see ext_argparse.snapshot.install_settings), consulted when
+# there is no snapshot bound to the current context
+_installed_settings = None
+_missing = object()
+
+
+def _set_installed_settings(snapshot):
+    global _installed_settings
+    _installed_settings = snapshot
+
 
 class NestedEnumMeta(EnumMeta):
     @classmethod
@@ -64,4 +77,11 @@ class ParameterEnum(Enum, metaclass=NestedEnumMeta):
 
     @property
     def value(self):
+        bound_settings = _bound_settings.get()
+        if bound_settings is None:
+            bound_settings = _installed_settings
+        if bound_settings is not None:
+            value = bound_settings._values_by_member_.get(self, _missing)
+            if value is not _missing:
+                return value
         return self.argument
@@ -19,6 +19,9 @@ from typing import Union
 
 class Parameter(object):
     setting_file_location_wildcard = '!settings_file_location'
+    __slots__ = ("default", "required", "console_only", "nargs", "type", "action", "argument", "raw_help",
+                 "setting_file_location", "shorthand", "value_map", "positional", "array_storage",
+                 "sidecar_threshold", "_help", "_help_comments")
 
     def __init__(self,
                  default=None,
@@ -30,7 +33,9 @@ class Parameter(object):
                  required: bool = False,
                  shorthand: Union[None, str] = None,
                  setting_file_location: bool = False,
-                 positional: bool = False):
+                 positional: bool = False,
+                 array_storage: Union[None, str] = None,
+                 sidecar_threshold: Union[None, int] = None):
         """
         @param default: the default value
         @param nargs: number of arguments. See Python documentation for argparse.ArgumentParser.add_argument.
@@ -43,6 +48,11 @@ class Parameter(object):
         @param setting_file_location: whether this parameter can use the setting file location wildcard
         (in which case, when set to the wildcard, the parameter value resolves to the full path to the settings
         file instead.)
+        @param positional: whether the argument is positional on the command line
+        @param array_storage: for int or float parameters accepting multiple arguments (see nargs), store values as
+        'array' (array.array) or 'numpy' (NumPy array) instead of lists
+        @param sidecar_threshold: for parameters with array storage, minimum number of elements for a value to be saved
+        to a binary sidecar file next to the settings file instead of inline (None to always save values inline)
         """
         self.default = default
         self.required = required
@@ -51,21 +61,65 @@ class Parameter(object):
         self.type = arg_type
         self.action = action
         self.argument = None
-        if setting_file_location:
-            self.help = arg_help + ("| If set to '" + Parameter.setting_file_location_wildcard + "' and a " +
-                                    " settings file is provided, will be set to the location of the settings file.")
-        else:
-            self.help = arg_help
+        # the full help string is only put together when needed, see the help property
+        self.raw_help = arg_help
+        self._help = None
+        self._help_comments = None
         self.setting_file_location = setting_file_location
         self.shorthand = shorthand
         self.value_map = None
         if arg_type == "bool_flag" and positional:
             raise ValueError("arg_type='bool_flag' and positional=True cannot be combined.")
         self.positional = positional
+        if array_storage is not None:
+            if array_storage not in ("array", "numpy"):
+                raise ValueError(f"array_storage has to be 'array', 'numpy', or None, got: {array_storage!r}")
+            if arg_type not in (int, float) or nargs in (None, '?') or positional:
+                raise ValueError("array_storage requires arg_type=int or arg_type=float, nargs='+', nargs='*', or "
+                                 "an integer nargs, and positional=False.")
+        elif sidecar_threshold is not None:
+            raise ValueError("sidecar_threshold requires array_storage to be set.")
+        self.array_storage = array_storage
+        self.sidecar_threshold = sidecar_threshold
 
         if type(self.type) == enum.EnumMeta:
             self.value_map = self.type._member_map_
-            self.help = arg_help + "| Can be set to one of: " + str(list(self.value_map.keys()))
+
+    @property
+    def help(self) -> str:
+        """ Documentation for this parameter, including notes on enum choices or the setting file location wildcard. """
+        if self._help is None:
+            if self.value_map is not None:
+                self._help = self.raw_help + "| Can be set to one of: " + str(list(self.value_map.keys()))
+            elif self.setting_file_location:
+                self._help = self.raw_help + ("| If set to '" + Parameter.setting_file_location_wildcard + "' and a " +
+                                              " settings file is provided, will be set to the location of the " +
+                                              "settings file.")
+            else:
+                self._help = self.raw_help
+        return self._help
+
+    @help.setter
+    def help(self, value: str):
+        self._help = value
+        self._help_comments = None
+
+    def get_help_comment(self, line_length_limit: Union[int, None]) -> str:
+        """
+        @param line_length_limit: maximum length of comment lines (excluding indentation), or None to not wrap the help
+        @return: the help wrapped for use as a settings file comment, memoized per line length limit
+        """
+        if self._help_comments is None:
+            self._help_comments = {}
+        help_comment = self._help_comments.get(line_length_limit)
+        if help_comment is None:
+            if line_length_limit is None:
+                help_comment = self.help
+            else:
+                import textwrap
+                help_comment = "\n".join(textwrap.wrap(self.help, width=line_length_limit))
+            self._help_comments[line_length_limit] = help_comment
+        return help_comment
 
     def get_type(self):
         return self.type
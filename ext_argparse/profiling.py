@@ -0,0 +1,151 @@
+#  ================================================================
+#  Created by Gregory Kramida on 10/17/26.
+#  Copyright (c) 2026 Gregory Kramida
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  ================================================================
+import os
+import time
+from typing import Callable, Dict, List, Union
+
+
+class ProcessingStats(object):
+    """
+    Durations of the phases of a single process_arguments or process_settings_file call (in seconds, in the order the
+    phases were first entered), along with counts of what was processed. Pass an instance via the stats argument of
+    either function to have it filled in, or register a callback via add_stats_callback to receive stats for every call.
+    """
+    __slots__ = ("operation", "phase_durations", "parameter_count", "loaded_key_count", "bytes_read", "bytes_written")
+
+    def __init__(self):
+        # name of the function that produced the stats
+        self.operation: Union[str, None] = None
+        self.phase_durations: Dict[str, float] = {}
+        # number of parameters in the ParameterEnum (including nested ones)
+        self.parameter_count = 0
+        # number of (flattened) entries loaded from settings files
+        self.loaded_key_count = 0
+        # sizes of settings files parsed (files served from a settings cache are not read) & written
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    @property
+    def total_duration(self) -> float:
+        return sum(self.phase_durations.values())
+
+    def __repr__(self):
+        phases = ", ".join(f"{phase:s}={duration * 1000:.3f}ms" for phase, duration in self.phase_durations.items())
+        return (f"ProcessingStats(operation={self.operation!r}, {phases:s}, parameter_count={self.parameter_count:d}, "
+                f"loaded_key_count={self.loaded_key_count:d}, bytes_read={self.bytes_read:d}, "
+                f"bytes_written={self.bytes_written:d})")
+
+
+_stats_callbacks: List[Callable[[ProcessingStats], None]] = []
+
+
+def add_stats_callback(callback: Callable[[ProcessingStats], None]) -> None:
+    """ Register a function to call with the stats of every subsequent process_arguments/process_settings_file call. """
+    _stats_callbacks.append(callback)
+
+
+def remove_stats_callback(callback: Callable[[ProcessingStats], None]) -> None:
+    _stats_callbacks.remove(callback)
+
+
+class PhaseRecorder(object):
+    """
+    Records stats of a single call. This base class does nothing, and is used when stats aren't requested, so that
+    recording costs a no-op method call per phase.
+    """
+    __slots__ = ()
+
+    def end_phase(self, phase: str) -> None:
+        pass
+
+    def set_parameter_count(self, count: int) -> None:
+        pass
+
+    def add_loaded_keys(self, count: int) -> None:
+        pass
+
+    def record_file_read(self, path: str) -> None:
+        pass
+
+    def record_contents_written(self, contents: Union[str, bytes]) -> None:
+        pass
+
+    def discard_phases(self, phase: str) -> None:
+        pass
+
+    def finish(self) -> None:
+        pass
+
+
+class _StatsRecorder(PhaseRecorder):
+    __slots__ = ("stats", "phase_start_time")
+
+    def __init__(self, stats: ProcessingStats):
+        self.stats = stats
+        self.phase_start_time = time.perf_counter()
+
+    def end_phase(self, phase: str) -> None:
+        """ Attribute the time since the end of the previous phase to the provided phase. """
+        now = time.perf_counter()
+        phase_durations = self.stats.phase_durations
+        phase_durations[phase] = phase_durations.get(phase, 0.0) + (now - self.phase_start_time)
+        self.phase_start_time = now
+
+    def set_parameter_count(self, count: int) -> None:
+        self.stats.parameter_count = count
+
+    def add_loaded_keys(self, count: int) -> None:
+        self.stats.loaded_key_count += count
+
+    def record_file_read(self, path: str) -> None:
+        self.stats.bytes_read += os.path.getsize(path)
+
+    def record_contents_written(self, contents: Union[str, bytes]) -> None:
+        self.stats.bytes_written += len(contents if isinstance(contents, bytes) else contents.encode("utf-8"))
+
+    def discard_phases(self, phase: str) -> None:
+        """
+        Fold the durations of all phases so far into the provided phase & reset the counts, for work that is abandoned
+        & redone from scratch (so that the redone phases aren't counted twice).
+        """
+        self.end_phase(phase)
+        stats = self.stats
+        stats.phase_durations = {phase: sum(stats.phase_durations.values())}
+        stats.loaded_key_count = 0
+        stats.bytes_read = 0
+        stats.bytes_written = 0
+
+    def finish(self) -> None:
+        for callback in list(_stats_callbacks):
+            callback(self.stats)
+
+
+null_recorder = PhaseRecorder()
+
+
+def start_recording(operation: str, stats: Union[ProcessingStats, None]) -> PhaseRecorder:
+    """
+    @param operation: name of the function to record stats for
+    @param stats: stats object to fill in, if any
+    @return: a recorder filling in the provided stats (or new stats, if there are callbacks registered), or a no-op
+    recorder if stats aren't requested at all
+    """
+    if stats is None:
+        if not _stats_callbacks:
+            return null_recorder
+        stats = ProcessingStats()
+    stats.operation = operation
+    return _StatsRecorder(stats)
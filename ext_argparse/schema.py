@@ -0,0 +1,173 @@
+#  ================================================================
+#  Created by Gregory Kramida on 10/17/26.
+#  Copyright (c) 2026 Gregory Kramida
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  ================================================================
+import enum
+import re
+from typing import Type, List, Dict, Tuple, Set, FrozenSet, Callable, Union
+
+from ext_argparse.conversion import compile_converter, SettingsValueError
+from ext_argparse.parameter import Parameter
+from ext_argparse.param_enum import ParameterEnum
+
+_acronym_pattern = re.compile(r"(:?^|_)(\w)")
+
+
+def generate_lc_acronym_from_snake_case(snake_case_string: str) -> str:
+    return "".join([word_match[1] for word_match in _acronym_pattern.findall(snake_case_string)])
+
+
+def environment_variable_name(path: str, prefix: str = "") -> str:
+    """
+    @return: name of the environment variable for the parameter at the provided dotted path, e.g.
+    APP_GROUP_A__INT_PARAM for path 'group_a.int_param' and prefix 'APP'
+    """
+    name = path.upper().replace(".", "__")
+    return prefix + "_" + name if prefix else name
+
+
+class SchemaEntry(object):
+    """
+    A single (leaf) parameter of a compiled parameter schema, i.e. a parameter that is not itself a nested
+    ParameterEnum.
+    """
+    __slots__ = ("path", "path_parts", "name", "member", "parameter", "shorthand", "is_enum", "is_bool_flag")
+
+    def __init__(self, path_parts: Tuple[str, ...], member: ParameterEnum):
+        self.path_parts = path_parts
+        self.path = ".".join(path_parts)
+        self.name = path_parts[-1]
+        self.member = member
+        self.parameter: Parameter = member.parameter
+        self.shorthand = self.parameter.shorthand
+        self.is_enum = isinstance(self.parameter.type, enum.EnumMeta)
+        self.is_bool_flag = self.parameter.type == 'bool_flag'
+
+
+class ParameterSchema(object):
+    """
+    Flat, pre-computed representation of a (possibly nested) ParameterEnum class. Built once per class (see
+    compile_schema) and shared by all routines that need to traverse the parameter tree.
+    """
+
+    def __init__(self, parameter_enum: Type[ParameterEnum]):
+        self.parameter_enum = parameter_enum
+        self.entries: List[SchemaEntry] = []
+        # dotted paths of nested ParameterEnum groups, in definition order
+        self.group_paths: List[str] = []
+        # names of immediate members (both parameters and nested groups) of each group, keyed by group path,
+        # with the root group at the empty path
+        self.group_member_names: Dict[str, List[str]] = {"": []}
+        self.__add_entries(parameter_enum, (), "")
+        self.entries_by_path: Dict[str, SchemaEntry] = {entry.path: entry for entry in self.entries}
+        self.parameter_path_set: FrozenSet[str] = frozenset(self.entries_by_path.keys())
+        self.group_path_set: FrozenSet[str] = frozenset(self.group_paths)
+        self.enum_entries: List[SchemaEntry] = [entry for entry in self.entries if entry.is_enum]
+        self.array_entries: List[SchemaEntry] = \
+            [entry for entry in self.entries if entry.parameter.array_storage is not None]
+        self.setting_file_location_paths: Set[str] = \
+            {entry.path for entry in self.entries if entry.parameter.setting_file_location}
+        self.converters: Dict[str, Callable] = \
+            {entry.path: compile_converter(entry.parameter) for entry in self.entries}
+        self.__environment_variable_indices: Dict[str, Dict[str, SchemaEntry]] = {}
+        self.__defaults = {entry.path: entry.parameter.default for entry in self.entries}
+        self.__defaults_with_enum_strings = {
+            entry.path: (entry.parameter.default.name if isinstance(entry.parameter.default, enum.Enum)
+                         else entry.parameter.default)
+            for entry in self.entries
+        }
+
+    def __add_entries(self, parameter_enum: Type[ParameterEnum], base_path: Tuple[str, ...], base_acronym: str):
+        member_names = self.group_member_names[".".join(base_path)]
+        for enum_entry in parameter_enum:
+            member_names.append(enum_entry.name)
+            if enum_entry.parameter.type == 'parameter_enum':
+                group_path = ".".join(base_path + (enum_entry.name,))
+                self.group_paths.append(group_path)
+                self.group_member_names[group_path] = []
+                self.__add_entries(enum_entry.parameter, base_path + (enum_entry.name,),
+                                   base_acronym + generate_lc_acronym_from_snake_case(enum_entry.name) + ".")
+            else:
+                # generate missing shorthands
+                if enum_entry.parameter.shorthand is None:
+                    enum_entry.parameter.shorthand = \
+                        base_acronym + generate_lc_acronym_from_snake_case(enum_entry.name)
+                self.entries.append(SchemaEntry(base_path + (enum_entry.name,), enum_entry))
+
+    def environment_variable_index(self, prefix: str) -> Dict[str, SchemaEntry]:
+        """
+        @param prefix: prefix of the environment variable names (see environment_variable_name)
+        @return: dictionary mapping environment variable names to schema entries, built once per prefix
+        """
+        index = self.__environment_variable_indices.get(prefix)
+        if index is None:
+            index = {environment_variable_name(entry.path, prefix): entry for entry in self.entries}
+            self.__environment_variable_indices[prefix] = index
+        return index
+
+    def convert_values(self, flat_values: dict, source: Union[str, None] = None) -> dict:
+        """
+        Check & convert values (e.g. loaded from a settings file) to the types of the corresponding parameters in a
+        single pass, collecting all errors. Strings with ${...} references are left as is, to be converted once resolved
+        (see resolve_interpolations).
+        @param flat_values: dictionary mapping dotted parameter paths to values. Unknown paths are passed through.
+        @param source: where the values came from, for the error message
+        @return: a new flat dictionary with converted values
+        @raise SettingsValueError: if any of the values cannot be converted, listing all such values
+        """
+        converted_values = {}
+        errors = []
+        converters = self.converters
+        for path, value in flat_values.items():
+            converter = converters.get(path)
+            if converter is not None and not (isinstance(value, str) and "${" in value):
+                try:
+                    value = converter(value)
+                except (ValueError, TypeError) as error:
+                    errors.append((path, str(error)))
+            converted_values[path] = value
+        if errors:
+            raise SettingsValueError(errors, source)
+        return converted_values
+
+    def generate_defaults_dict(self, convert_enums_to_strings: bool = False) -> dict:
+        """
+        @return: a new flat dictionary mapping full dotted parameter paths to parameter defaults.
+        """
+        return dict(self.__defaults_with_enum_strings if convert_enums_to_strings else self.__defaults)
+
+    def generate_value_dict(self, convert_enums_to_strings: bool = False) -> dict:
+        """
+        @return: a new flat dictionary mapping full dotted parameter paths to the values currently stored in the
+        parameters (regardless of any bound or installed settings snapshot).
+        """
+        if convert_enums_to_strings:
+            return {entry.path: (entry.member.argument.name if entry.is_enum and entry.member.argument is not None
+                                 else entry.member.argument)
+                    for entry in self.entries}
+        return {entry.path: entry.member.argument for entry in self.entries}
+
+
+def compile_schema(parameter_enum: Type[ParameterEnum]) -> ParameterSchema:
+    """
+    Retrieve the compiled schema for the provided ParameterEnum class, building it on first use.
+    @param parameter_enum: the (root) ParameterEnum class
+    @return: compiled schema, cached on the class itself
+    """
+    # look at the class's own dict, since compiled schemas of nested groups must not be shared with their parents
+    schema = parameter_enum.__dict__.get("_compiled_schema_")
+    if schema is None:
+        schema = ParameterSchema(parameter_enum)
+        setattr(parameter_enum, "_compiled_schema_", schema)
+    return schema
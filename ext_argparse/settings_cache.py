@@ -0,0 +1,215 @@
+#  ================================================================
+#  Created by Gregory Kramida on 10/17/26.
+#  Copyright (c) 2026 Gregory Kramida
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  ================================================================
+import hashlib
+import marshal
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Union, List
+
+
+class _CacheEntry(object):
+    __slots__ = ("mtime_ns", "size", "content_hash", "values")
+
+    def __init__(self, mtime_ns: int, size: int, content_hash: Union[str, None], values: dict):
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.content_hash = content_hash
+        self.values = values
+
+
+def _compute_file_hash(path: str) -> str:
+    with open(path, 'rb') as file:
+        return hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+
+
+def _is_plain_data(value) -> bool:
+    # unlike pickle, marshal can't run code when loading, but it can still produce e.g. code objects
+    if value is None or type(value) in (bool, int, float, str, bytes):
+        return True
+    if type(value) in (list, tuple):
+        return all(_is_plain_data(item) for item in value)
+    if type(value) is dict:
+        return all(type(key) is str and _is_plain_data(item) for key, item in value.items())
+    return False
+
+
+def _copy_values(values: dict) -> dict:
+    # shield cached containers from modification by the caller
+    return {key: (list(value) if isinstance(value, list) else value) for key, value in values.items()}
+
+
+class SettingsFileCache(object):
+    """
+    Bounded LRU cache of parsed & flattened settings files, keyed by absolute file path and validated by file
+    modification time & size (and, optionally, by a hash of the file contents). Can optionally persist parsed
+    settings in a cache directory, so that fresh processes can also skip parsing unchanged files. Persisted settings are
+    stored with marshal rather than pickle, so that loading them from a shared directory can't run arbitrary code.
+    Also caches the merged settings of layer stacks (see load_layers), keyed by the versions of the layers, so that
+    only the layers above the longest unchanged prefix of a stack are merged again.
+    Pass an instance via the settings_cache argument of process_arguments or process_settings_file.
+    """
+
+    def __init__(self, max_entry_count: int = 128, verify_content_hash: bool = False,
+                 cache_directory: Union[None, str] = None):
+        """
+        @param max_entry_count: maximum number of settings files held in memory
+        @param verify_content_hash: whether to also compare a hash of file contents before reusing a cached result,
+        which guards against modifications that preserve both mtime & size at the cost of reading the file.
+        @param cache_directory: optional directory where to persist parsed settings across processes
+        """
+        if max_entry_count < 1:
+            raise ValueError("max_entry_count has to be at least 1, got: " + str(max_entry_count))
+        self.max_entry_count = max_entry_count
+        self.verify_content_hash = verify_content_hash
+        self.cache_directory = cache_directory
+        if cache_directory is not None:
+            os.makedirs(cache_directory, exist_ok=True)
+        self.hit_count = 0
+        self.miss_count = 0
+        self.disk_hit_count = 0
+        self.merged_prefix_hit_count = 0
+        self.__entries = OrderedDict()
+        self.__merged_prefixes = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def clear(self):
+        """ Drop all in-memory entries and reset the counters. Does not touch the cache directory. """
+        with self.__lock:
+            self.__entries.clear()
+            self.__merged_prefixes.clear()
+            self.hit_count = 0
+            self.miss_count = 0
+            self.disk_hit_count = 0
+            self.merged_prefix_hit_count = 0
+
+    def __is_valid(self, entry: _CacheEntry, stat: os.stat_result, content_hash: Union[str, None]) -> bool:
+        if self.verify_content_hash:
+            return entry.content_hash == content_hash
+        return entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size
+
+    def __get_disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_directory,
+                            hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest() + ".marshal")
+
+    def __load_from_disk(self, key: str) -> Union[_CacheEntry, None]:
+        try:
+            with open(self.__get_disk_path(key), 'rb') as file:
+                stored_key, mtime_ns, size, content_hash, values = marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if stored_key != key or type(mtime_ns) is not int or type(size) is not int or \
+                not (content_hash is None or type(content_hash) is str) or \
+                type(values) is not dict or not _is_plain_data(values):
+            return None
+        return _CacheEntry(mtime_ns, size, content_hash, values)
+
+    def __save_to_disk(self, key: str, entry: _CacheEntry):
+        try:
+            contents = marshal.dumps((key, entry.mtime_ns, entry.size, entry.content_hash, entry.values))
+        except ValueError:
+            # values of types marshal doesn't support (e.g. YAML timestamps) are only cached in memory
+            return
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.cache_directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, 'wb') as file:
+                file.write(contents)
+            os.replace(temporary_path, self.__get_disk_path(key))
+        except OSError:
+            if os.path.exists(temporary_path):
+                os.unlink(temporary_path)
+
+    def __get_entry(self, settings_file: Union[str, Path], loader: Callable[[str], dict]) -> _CacheEntry:
+        key = os.path.abspath(settings_file)
+        stat = os.stat(key)
+        content_hash = _compute_file_hash(key) if self.verify_content_hash else None
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and self.__is_valid(entry, stat, content_hash):
+                self.__entries.move_to_end(key)
+                self.hit_count += 1
+                return entry
+
+        entry = None
+        if self.cache_directory is not None:
+            entry = self.__load_from_disk(key)
+            if entry is not None and not self.__is_valid(entry, stat, content_hash):
+                entry = None
+        if entry is not None:
+            with self.__lock:
+                self.disk_hit_count += 1
+        else:
+            entry = _CacheEntry(stat.st_mtime_ns, stat.st_size, content_hash, loader(key))
+            with self.__lock:
+                self.miss_count += 1
+            if self.cache_directory is not None:
+                self.__save_to_disk(key, entry)
+
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_entry_count:
+                self.__entries.popitem(last=False)
+        return entry
+
+    def load(self, settings_file: Union[str, Path], loader: Callable[[str], dict]) -> dict:
+        """
+        Retrieve flattened settings for the provided file, parsing it only if there is no valid cached result.
+        @param settings_file: path to the settings file
+        @param loader: function that parses the file at the given path & returns the flattened settings
+        @return: a new flat dictionary of settings
+        """
+        return _copy_values(self.__get_entry(settings_file, loader).values)
+
+    def load_layers(self, settings_files: List[Union[str, Path]], loader: Callable[[str], dict]) -> dict:
+        """
+        Retrieve the merged flattened settings of a stack of settings files, where values in later files override
+        those in earlier ones. Only changed files are parsed again, and merging starts from the merged settings of the
+        longest prefix of the stack that is unchanged since it was last merged.
+        @param settings_files: paths to the settings files, from the lowest to the highest priority
+        @param loader: function that parses the file at the given path & returns the flattened settings
+        @return: a new flat dictionary of merged settings
+        """
+        entries = [self.__get_entry(settings_file, loader) for settings_file in settings_files]
+        versions = tuple((os.path.abspath(settings_file), entry.mtime_ns, entry.size, entry.content_hash)
+                         for settings_file, entry in zip(settings_files, entries))
+
+        merged_values = {}
+        merged_layer_count = 0
+        with self.__lock:
+            for layer_count in range(len(versions), 0, -1):
+                prefix_values = self.__merged_prefixes.get(versions[:layer_count])
+                if prefix_values is not None:
+                    self.__merged_prefixes.move_to_end(versions[:layer_count])
+                    self.merged_prefix_hit_count += 1
+                    merged_values = dict(prefix_values)
+                    merged_layer_count = layer_count
+                    break
+
+        for layer_count in range(merged_layer_count + 1, len(entries) + 1):
+            merged_values.update(entries[layer_count - 1].values)
+            if layer_count > 1:
+                with self.__lock:
+                    self.__merged_prefixes[versions[:layer_count]] = dict(merged_values)
+                    while len(self.__merged_prefixes) > self.max_entry_count:
+                        self.__merged_prefixes.popitem(last=False)
+        return _copy_values(merged_values)
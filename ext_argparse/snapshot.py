@@ -0,0 +1,184 @@
+#  ================================================================
+#  Created by Gregory Kramida on 10/17/26.
+#  Copyright (c) 2026 Gregory Kramida
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  ================================================================
+import contextlib
+import weakref
+from typing import Type, Union, Dict
+
+from ext_argparse import param_enum as _param_enum_module
+from ext_argparse.param_enum import ParameterEnum, _bound_settings, _set_installed_settings
+from ext_argparse.schema import compile_schema, ParameterSchema
+
+
+class SettingsSnapshot(object):
+    """
+    Immutable set of parameter values, mirroring the attribute paths of the ParameterEnum it was created for, i.e.
+    the value of Parameters.group.parameter is available via snapshot.group.parameter. Like in namedtuple, method
+    names start with an underscore to avoid conflicts with parameter names.
+
+    Snapshots are independent of the values stored in the ParameterEnum members, so any number of them can coexist
+    in one process. A snapshot can also be bound to the current thread or asynchronous task via bind_settings, in which
+    case Parameters.group.parameter.value resolves to the value in the bound snapshot.
+    """
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Cannot set '{name:s}': settings snapshots are immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Cannot delete '{name:s}': settings snapshots are immutable.")
+
+    def __iter__(self):
+        """ Yields (name, value) pairs in definition order, with nested groups as (name, snapshot) pairs. """
+        return ((name, getattr(self, name)) for name in self.__slots__)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and all(getattr(self, name) == getattr(other, name)
+                                                  for name in self.__slots__)
+
+    def __repr__(self):
+        return type(self).__name__ + "(" + ", ".join(f"{name:s}={getattr(self, name)!r}"
+                                                     for name in self.__slots__) + ")"
+
+    def _to_dict(self) -> dict:
+        """ @return: nested dictionary of values """
+        return {name: (value._to_dict() if isinstance(value, SettingsSnapshot) else value) for name, value in self}
+
+
+class RootSettingsSnapshot(SettingsSnapshot):
+    """
+    Snapshot of the root ParameterEnum, which additionally provides lookup by dotted path & by enum member.
+    """
+    __slots__ = ("_parameter_enum_", "_flat_values_", "_values_by_member_")
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self._flat_values_ == other._flat_values_
+
+    def __reduce__(self):
+        return create_settings_snapshot, (self._parameter_enum_, self._flat_values_)
+
+    @property
+    def _parameter_enum(self) -> Type[ParameterEnum]:
+        return self._parameter_enum_
+
+    def _get(self, path: str):
+        """ @return: the value of the parameter at the provided dotted path """
+        return self._flat_values_[path]
+
+    def _to_flat_dict(self) -> dict:
+        """ @return: a new flat dictionary mapping dotted parameter paths to values """
+        return dict(self._flat_values_)
+
+
+# generated snapshot classes, keyed by ParameterEnum class, then by group path
+_snapshot_class_cache = weakref.WeakKeyDictionary()
+
+
+def __generate_snapshot_classes(schema: ParameterSchema) -> Dict[str, type]:
+    snapshot_classes = {}
+    for group_path, member_names in schema.group_member_names.items():
+        class_name = schema.parameter_enum.__name__ + "".join(
+            "_" + part for part in group_path.split(".") if part) + "Snapshot"
+        if group_path == "":
+            base = RootSettingsSnapshot
+        else:
+            base = SettingsSnapshot
+        # root-level slots are inherited from RootSettingsSnapshot, declare only the members here
+        snapshot_classes[group_path] = type(class_name, (base,), {"__slots__": tuple(member_names)})
+    return snapshot_classes
+
+
+def __get_snapshot_classes(parameter_enum: Type[ParameterEnum]) -> Dict[str, type]:
+    snapshot_classes = _snapshot_class_cache.get(parameter_enum)
+    if snapshot_classes is None:
+        snapshot_classes = __generate_snapshot_classes(compile_schema(parameter_enum))
+        _snapshot_class_cache[parameter_enum] = snapshot_classes
+    return snapshot_classes
+
+
+def __build_group(schema: ParameterSchema, snapshot_classes: Dict[str, type], group_path: str, flat_values: dict,
+                  snapshot: Union[SettingsSnapshot, None] = None) -> SettingsSnapshot:
+    if snapshot is None:
+        snapshot = object.__new__(snapshot_classes[group_path])
+    prefix = group_path + "." if group_path else ""
+    for name in schema.group_member_names[group_path]:
+        path = prefix + name
+        if path in schema.group_member_names:
+            value = __build_group(schema, snapshot_classes, path, flat_values)
+        else:
+            value = flat_values[path]
+        object.__setattr__(snapshot, name, value)
+    return snapshot
+
+
+def create_settings_snapshot(parameter_enum: Type[ParameterEnum], flat_values: Union[dict, None] = None) \
+        -> RootSettingsSnapshot:
+    """
+    Create an immutable snapshot of parameter values.
+    @param parameter_enum: the (root) ParameterEnum class
+    @param flat_values: dictionary mapping dotted parameter paths to (fully-processed) values. Parameters missing from
+    the dictionary get their default values. If None, the values currently stored in parameter_enum are used instead.
+    @return: the snapshot
+    """
+    schema = compile_schema(parameter_enum)
+    if flat_values is None:
+        resolved_values = schema.generate_value_dict()
+    else:
+        resolved_values = schema.generate_defaults_dict()
+        for path in resolved_values.keys():
+            if path in flat_values:
+                resolved_values[path] = flat_values[path]
+    snapshot_classes = __get_snapshot_classes(parameter_enum)
+    snapshot = object.__new__(snapshot_classes[""])
+    object.__setattr__(snapshot, "_parameter_enum_", parameter_enum)
+    object.__setattr__(snapshot, "_flat_values_", resolved_values)
+    object.__setattr__(snapshot, "_values_by_member_",
+                       {entry.member: resolved_values[entry.path] for entry in schema.entries})
+    return __build_group(schema, snapshot_classes, "", resolved_values, snapshot)
+
+
+@contextlib.contextmanager
+def bind_settings(snapshot: RootSettingsSnapshot):
+    """
+    Within the context, make the .value of every ParameterEnum member covered by the snapshot resolve to the value
+    stored in the snapshot. The binding is local to the current thread or asynchronous task (via contextvars), so
+    different threads/tasks can work with different settings at the same time.
+    @param snapshot: the snapshot to bind
+    """
+    token = _bound_settings.set(snapshot)
+    try:
+        yield snapshot
+    finally:
+        _bound_settings.reset(token)
+
+
+def get_bound_settings() -> Union[RootSettingsSnapshot, None]:
+    """ @return: snapshot bound to the current thread / asynchronous task, or None if there isn't one """
+    return _bound_settings.get()
+
+
+def install_settings(snapshot: Union[RootSettingsSnapshot, None]) -> None:
+    """
+    Make the .value of every ParameterEnum member covered by the snapshot resolve to the value stored in the snapshot
+    process-wide, i.e. in all threads & tasks that don't have a snapshot bound via bind_settings. Since this swaps a
+    single reference, readers always see either all or none of the values from the snapshot.
+    @param snapshot: the snapshot to install, or None to uninstall the currently-installed snapshot
+    """
+    _set_installed_settings(snapshot)
+
+
+def get_installed_settings() -> Union[RootSettingsSnapshot, None]:
+    """ @return: snapshot installed for the whole process, or None if there isn't one """
+    return _param_enum_module._installed_settings
@@ -0,0 +1,177 @@
+#  ================================================================
+#  Created by Gregory Kramida on 10/17/26.
+#  Copyright (c) 2026 Gregory Kramida
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  ================================================================
+import collections
+import concurrent.futures
+import enum
+import itertools
+import os
+import random
+from typing import Type, Dict, Iterable, Iterator, List, Tuple, Union, Callable, Sequence
+
+from ext_argparse.argproc import load_settings_file, flatten_dict, unflatten_dict, write_file_atomically
+from ext_argparse.arrays import prepare_array_values_for_saving, load_array_values
+from ext_argparse.formats import get_settings_file_format
+from ext_argparse.param_enum import ParameterEnum
+from ext_argparse.schema import compile_schema
+
+sweep_modes = ("grid", "zip", "random")
+
+# values to sweep over, per dotted parameter path: a sequence of values (e.g. a list or a range) or, for random
+# sweeps, also a function drawing a value from the provided random number generator
+SweepValues = Dict[str, Union[Iterable, Callable[[random.Random], object]]]
+
+
+def __generate_sweep_points(sweep_values: SweepValues, mode: str, sample_count: Union[int, None],
+                            seed: Union[int, None]) -> Iterator[Tuple]:
+    if mode == "random":
+        generator = random.Random(seed)
+        samplers = []
+        for values in sweep_values.values():
+            if callable(values):
+                samplers.append(values)
+            else:
+                # bind the sequence as a default argument, since the lambda outlives the loop iteration
+                sequence = values if isinstance(values, Sequence) else list(values)
+                samplers.append(lambda random_generator, sequence=sequence: random_generator.choice(sequence))
+        for _ in range(sample_count):
+            yield tuple(sampler(generator) for sampler in samplers)
+        return
+
+    axes = [values if isinstance(values, Sequence) else list(values) for values in sweep_values.values()]
+    if mode == "grid":
+        yield from itertools.product(*axes)
+    else:
+        if len({len(axis) for axis in axes}) > 1:
+            raise ValueError("All value sequences of a 'zip' sweep have to be equally long, got lengths: " +
+                             str({path: len(axis) for path, axis in zip(sweep_values.keys(), axes)}))
+        yield from zip(*axes)
+
+
+def expand_sweep(parameter_enum: Type[ParameterEnum], sweep_values: SweepValues, mode: str = "grid",
+                 sample_count: Union[int, None] = None, seed: Union[int, None] = None,
+                 base_settings_file: Union[str, None] = None) -> Iterator[dict]:
+    """
+    Lazily generate the configurations of a parameter sweep, one at a time.
+    @param parameter_enum: the (root) ParameterEnum class holding program parameters
+    @param sweep_values: values to sweep over, keyed by dotted parameter path (see SweepValues)
+    @param mode: 'grid' for all combinations of values, 'zip' to combine the i-th values of all (equally long) value
+    sequences, or 'random' for sample_count random combinations
+    @param sample_count: number of configurations of a 'random' sweep
+    @param seed: seed for the random number generator of a 'random' sweep
+    @param base_settings_file: settings file holding values of parameters that aren't swept (defaults are used
+    otherwise)
+    @return: generator of flat dictionaries mapping dotted paths of all parameters to values (with enum names instead
+    of members & arrays for parameters with array storage), each checked & converted the same way values from
+    settings files are in process_settings_file
+    @raise SettingsValueError: if any of the values of a configuration don't fit their parameters
+    """
+    if mode not in sweep_modes:
+        raise ValueError(f"Unsupported sweep mode: {mode!r}. Supported modes are: {', '.join(sweep_modes):s}.")
+    if mode == "random" and (sample_count is None or sample_count < 0):
+        raise ValueError("A 'random' sweep requires a non-negative sample_count.")
+    schema = compile_schema(parameter_enum)
+    for path, values in sweep_values.items():
+        if path not in schema.entries_by_path:
+            raise ValueError(f"Cannot sweep over '{path:s}': no such parameter in {parameter_enum.__name__:s}.")
+        if callable(values) and mode != "random":
+            raise ValueError(f"Values for '{path:s}' can only be drawn by a function in a 'random' sweep.")
+
+    base_values = schema.generate_defaults_dict(convert_enums_to_strings=True)
+    if base_settings_file is not None:
+        settings = load_settings_file(base_settings_file)
+        if settings:
+            base_values.update({path: value for path, value in flatten_dict(settings).items() if path in base_values})
+    base_values = schema.convert_values(base_values, source=base_settings_file)
+    # read sidecar files the base settings file refers to, since references are relative to that file
+    base_values.update(load_array_values(schema, base_values, base_settings_file))
+
+    swept_paths = list(sweep_values.keys())
+    for index, point in enumerate(__generate_sweep_points(sweep_values, mode, sample_count, seed)):
+        point_values = schema.convert_values(dict(zip(swept_paths, point)), source=f"sweep configuration {index:d}")
+        values = dict(base_values)
+        values.update(point_values)
+        values.update(load_array_values(schema, point_values, None))
+        for entry in schema.enum_entries:
+            if isinstance(values[entry.path], enum.Enum):
+                values[entry.path] = values[entry.path].name
+        yield values
+
+
+def _write_sweep_chunk(parameter_enum: Type[ParameterEnum], chunk: List[Tuple[str, dict]]) -> List[str]:
+    schema = compile_schema(parameter_enum)
+    paths = []
+    for path, values in chunk:
+        values.update(prepare_array_values_for_saving(schema, values, path))
+        write_file_atomically(path, get_settings_file_format(path).dumps(unflatten_dict(values)))
+        paths.append(path)
+    return paths
+
+
+def write_sweep(parameter_enum: Type[ParameterEnum], sweep_values: SweepValues, output_directory: str,
+                mode: str = "grid", sample_count: Union[int, None] = None, seed: Union[int, None] = None,
+                base_settings_file: Union[str, None] = None, file_name_pattern: str = "sweep_{index:06d}.yaml",
+                workers: Union[int, None] = None, chunk_size: int = 64) -> List[str]:
+    """
+    Write the configurations of a parameter sweep (see expand_sweep) to settings files, optionally spreading the
+    work across a pool of processes. Configurations are generated lazily & only a bounded number of them is held in
+    memory at any time, so sweeps of any size can be written. Arrays at or above the sidecar threshold of their
+    parameters are written to sidecar files next to each settings file.
+    Note that, for process start methods other than 'fork', the ParameterEnum class needs to be importable by the
+    worker processes.
+    @param parameter_enum: the (root) ParameterEnum class holding program parameters
+    @param sweep_values: values to sweep over, keyed by dotted parameter path (see SweepValues)
+    @param output_directory: directory to write the settings files to (created if missing)
+    @param mode: sweep mode, see expand_sweep
+    @param sample_count: number of configurations of a 'random' sweep
+    @param seed: seed for the random number generator of a 'random' sweep
+    @param base_settings_file: settings file holding values of parameters that aren't swept
+    @param file_name_pattern: pattern for names of the settings files, formatted with the configuration index. The
+    extension determines the format (see get_settings_file_format).
+    @param workers: number of worker processes. If None or 1, files are written serially in the current process.
+    @param chunk_size: number of files to hand to a worker process at a time
+    @return: paths to the written settings files, in sweep order
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size has to be at least 1, got: " + str(chunk_size))
+    configurations = expand_sweep(parameter_enum, sweep_values, mode, sample_count, seed, base_settings_file)
+    os.makedirs(output_directory, exist_ok=True)
+    indexed_configurations = ((os.path.join(output_directory, file_name_pattern.format(index=index)), values)
+                              for index, values in enumerate(configurations))
+
+    def generate_chunks() -> Iterator[List[Tuple[str, dict]]]:
+        while True:
+            chunk = list(itertools.islice(indexed_configurations, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    written_paths = []
+    if workers is None or workers <= 1:
+        for chunk in generate_chunks():
+            written_paths.extend(_write_sweep_chunk(parameter_enum, chunk))
+        return written_paths
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        # keep a bounded number of chunks in flight, since submitting all of them up front would hold every
+        # configuration in memory
+        pending_futures = collections.deque()
+        for chunk in generate_chunks():
+            pending_futures.append(executor.submit(_write_sweep_chunk, parameter_enum, chunk))
+            if len(pending_futures) >= 2 * workers:
+                written_paths.extend(pending_futures.popleft().result())
+        while pending_futures:
+            written_paths.extend(pending_futures.popleft().result())
+    return written_paths
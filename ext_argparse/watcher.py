@@ -0,0 +1,265 @@
+#  ================================================================
+#  Created by Gregory Kramida on 10/17/26.
+#  Copyright (c) 2026 Gregory Kramida
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#  ================================================================
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Type, Callable, List, Union
+
+from ext_argparse.argproc import process_settings_file
+from ext_argparse.arrays import values_equal
+from ext_argparse.param_enum import ParameterEnum
+from ext_argparse.schema import compile_schema
+from ext_argparse.snapshot import RootSettingsSnapshot, create_settings_snapshot, install_settings, \
+    get_installed_settings
+
+# see inotify(7)
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_inotify_event_header = struct.Struct("iIII")
+
+
+class _InotifyFileMonitor(object):
+    """ Reports changes to a single file via Linux inotify, watching the parent directory to catch renames. """
+
+    def __init__(self, path: str):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.file_descriptor = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.file_descriptor < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.file_name = os.fsencode(os.path.basename(path))
+        directory = os.fsencode(os.path.dirname(os.path.abspath(path)))
+        watch_descriptor = libc.inotify_add_watch(self.file_descriptor, directory,
+                                                  _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE |
+                                                  _IN_DELETE)
+        if watch_descriptor < 0:
+            os.close(self.file_descriptor)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+
+    def wait_for_change(self, timeout: float) -> bool:
+        readable, _, _ = select.select([self.file_descriptor], [], [], timeout)
+        if not readable:
+            return False
+        try:
+            buffer = os.read(self.file_descriptor, 64 * 1024)
+        except BlockingIOError:
+            return False
+        changed = False
+        offset = 0
+        while offset + _inotify_event_header.size <= len(buffer):
+            _, _, _, name_length = _inotify_event_header.unpack_from(buffer, offset)
+            offset += _inotify_event_header.size
+            name = buffer[offset:offset + name_length].rstrip(b"\0")
+            offset += name_length
+            if name == self.file_name:
+                changed = True
+        return changed
+
+    def close(self):
+        os.close(self.file_descriptor)
+
+
+class _PollingFileMonitor(object):
+    """ Reports changes to a single file by periodically comparing its modification time & size. """
+
+    def __init__(self, path: str, poll_interval: float):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.last_stat = self.__stat()
+
+    def __stat(self):
+        try:
+            stat = os.stat(self.path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def wait_for_change(self, timeout: float) -> bool:
+        time.sleep(min(timeout, self.poll_interval))
+        stat = self.__stat()
+        if stat != self.last_stat:
+            self.last_stat = stat
+            return True
+        return False
+
+    def close(self):
+        pass
+
+
+class SettingsFileWatcher(object):
+    """
+    Watches a settings file & re-applies it whenever it changes, without restarting the program.
+
+    Changes are detected via inotify on Linux and via polling elsewhere (or when inotify is unavailable). Bursts of
+    changes (e.g. an editor writing the file in several steps) are debounced. On each reload, the file is processed as
+    by process_settings_file, the result is compared to the current values, and, if anything changed, a new settings
+    snapshot is published in a single step (see install_settings), so that readers of ParameterEnum .value never
+    observe a partially-applied update. Only the changed parameters are then written into the enum members, and the
+    registered callbacks are called with the dotted paths of the changed parameters.
+
+    Changes are detected by comparing the newly loaded file contents to the previously loaded ones. Parameters whose
+    values differed from the settings file when the watcher was created (e.g. ones overridden on the command line or
+    via environment variables) keep those values, even when the file changes them.
+    """
+
+    def __init__(self, parameter_enum: Type[ParameterEnum], settings_file: str, debounce_interval: float = 0.1,
+                 poll_interval: float = 0.5, use_inotify: Union[bool, None] = None):
+        """
+        @param parameter_enum: the (root) ParameterEnum class holding program parameters
+        @param settings_file: path to the settings file to watch
+        @param debounce_interval: how long the file has to stay unchanged before it is reloaded, in seconds
+        @param poll_interval: how often to check the file for changes when polling, in seconds
+        @param use_inotify: whether to use inotify. If None, inotify is used when running on Linux.
+        """
+        self.parameter_enum = parameter_enum
+        self.settings_file = settings_file
+        self.debounce_interval = debounce_interval
+        self.poll_interval = poll_interval
+        self.use_inotify = sys.platform.startswith("linux") if use_inotify is None else use_inotify
+        self.last_error: Union[Exception, None] = None
+        self.__callbacks: List[Callable[[List[str], RootSettingsSnapshot], None]] = []
+        self.__reload_lock = threading.Lock()
+        self.__stop_event = threading.Event()
+        self.__thread: Union[threading.Thread, None] = None
+        # values stored in the enum members, regardless of any installed settings snapshot
+        self.__settings = create_settings_snapshot(
+            parameter_enum, {entry.path: entry.member.argument for entry in compile_schema(parameter_enum).entries})
+        current_values = self.__settings._flat_values_
+        try:
+            self.__file_values = process_settings_file(parameter_enum, settings_file, as_snapshot=True)._flat_values_
+        except Exception:
+            # e.g. the file is malformed or temporarily missing, compare the first reload to the current values
+            self.__file_values = current_values
+        self.__overridden_paths = frozenset(
+            path for path, value in current_values.items()
+            if value is not None and not values_equal(value, self.__file_values[path])
+        )
+
+    @property
+    def settings(self) -> RootSettingsSnapshot:
+        """ @return: snapshot of the most recently applied settings """
+        return self.__settings
+
+    def add_callback(self, callback: Callable[[List[str], RootSettingsSnapshot], None]) -> None:
+        """
+        @param callback: function to call after each update with a list of dotted paths of parameters that
+        changed & the new settings snapshot
+        """
+        self.__callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[List[str], RootSettingsSnapshot], None]) -> None:
+        self.__callbacks.remove(callback)
+
+    def reload(self) -> List[str]:
+        """
+        Re-read the settings file & apply any changes right away.
+        @return: dotted paths of the parameters that changed
+        """
+        with self.__reload_lock:
+            new_file_values = process_settings_file(self.parameter_enum, self.settings_file,
+                                                    as_snapshot=True)._flat_values_
+            old_file_values = self.__file_values
+            self.__file_values = new_file_values
+            changed_paths = [path for path, value in new_file_values.items()
+                             if path not in self.__overridden_paths and not values_equal(old_file_values[path], value)]
+            if not changed_paths:
+                return changed_paths
+            new_values = self.__settings._to_flat_dict()
+            for path in changed_paths:
+                new_values[path] = new_file_values[path]
+            new_settings = create_settings_snapshot(self.parameter_enum, new_values)
+            self.__settings = new_settings
+
+            entries_by_path = compile_schema(self.parameter_enum).entries_by_path
+            if get_installed_settings() is not None:
+                # readers see the installed snapshot, which hides the enum members while they are updated
+                for path in changed_paths:
+                    entries_by_path[path].member.__dict__["argument"] = new_values[path]
+            else:
+                # publish all changes with a single assignment, then bring the enum members up to date behind the
+                # published snapshot; retracting it afterwards is unobservable, since the members then hold the same
+                # values
+                install_settings(new_settings)
+                for path in changed_paths:
+                    entries_by_path[path].member.__dict__["argument"] = new_values[path]
+                if get_installed_settings() is new_settings:
+                    install_settings(None)
+
+        for callback in list(self.__callbacks):
+            callback(changed_paths, new_settings)
+        return changed_paths
+
+    def __create_monitor(self):
+        if self.use_inotify:
+            try:
+                return _InotifyFileMonitor(self.settings_file)
+            except (OSError, AttributeError, TypeError):
+                pass
+        return _PollingFileMonitor(self.settings_file, self.poll_interval)
+
+    def __run(self, monitor):
+        try:
+            while not self.__stop_event.is_set():
+                if not monitor.wait_for_change(self.poll_interval):
+                    continue
+                # debounce: wait until the file stays unchanged for the whole debounce interval
+                while not self.__stop_event.is_set() and monitor.wait_for_change(self.debounce_interval):
+                    pass
+                if self.__stop_event.is_set():
+                    break
+                try:
+                    self.reload()
+                    self.last_error = None
+                except Exception as error:
+                    # e.g. the file is malformed or temporarily missing, keep the current settings
+                    self.last_error = error
+        finally:
+            monitor.close()
+
+    def start(self) -> "SettingsFileWatcher":
+        """ Start watching the settings file in a background (daemon) thread. """
+        if self.__thread is not None:
+            raise RuntimeError("The settings file watcher is already running.")
+        self.__stop_event.clear()
+        # create the monitor right away, so that no changes made after start() returns are missed
+        monitor = self.__create_monitor()
+        self.__thread = threading.Thread(target=self.__run, args=(monitor,), daemon=True,
+                                         name="SettingsFileWatcher")
+        self.__thread.start()
+        return self
+
+    def stop(self) -> None:
+        """ Stop watching the settings file. """
+        if self.__thread is None:
+            return
+        self.__stop_event.set()
+        self.__thread.join()
+        self.__thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,129 @@
+import array
+import os
+
+import pytest
+from ruamel.yaml import YAML
+
+from ext_argparse import process_arguments, process_settings_file, save_defaults, dump, Parameter, ParameterEnum, \
+    SettingsFileCache
+from ext_argparse.arrays import sidecar_reference_prefix, values_equal, read_sidecar_file, write_sidecar_file
+
+
+class CalibrationParameters(ParameterEnum):
+    offsets = Parameter(arg_type=float, default=[0.0, 0.5], nargs='+', arg_help="Offsets.", array_storage="array")
+    counts = Parameter(arg_type=int, default=[1, 2, 3], nargs='*', arg_help="Counts.", array_storage="array",
+                       sidecar_threshold=4)
+    labels = Parameter(arg_type=str, default=["a"], nargs='+', arg_help="Labels.")
+
+
+def test_array_storage_validation():
+    with pytest.raises(ValueError):
+        Parameter(arg_type=str, default=["a"], nargs='+', array_storage="array")
+    with pytest.raises(ValueError):
+        Parameter(arg_type=int, default=1, nargs='?', array_storage="array")
+    with pytest.raises(ValueError):
+        Parameter(arg_type=int, default=[1], nargs='+', array_storage="tensor")
+    with pytest.raises(ValueError):
+        Parameter(arg_type=int, default=[1], nargs='+', sidecar_threshold=10)
+
+
+def test_array_storage_from_command_line_and_settings_file(tmp_path):
+    settings_path = tmp_path / "calibration.yaml"
+    YAML(typ='safe').dump({"offsets": [1.5, 2.5, 3.5], "labels": ["x", "y"]}, settings_path)
+
+    process_arguments(CalibrationParameters, "Calibration.",
+                      argv=[f"--settings_file={settings_path}", "--counts", "4", "5"])
+    assert CalibrationParameters.offsets.value == array.array('d', [1.5, 2.5, 3.5])
+    assert CalibrationParameters.counts.value == array.array('q', [4, 5])
+    assert CalibrationParameters.labels.value == ["x", "y"]
+
+    snapshot = process_settings_file(CalibrationParameters, str(settings_path), as_snapshot=True)
+    assert snapshot.offsets == array.array('d', [1.5, 2.5, 3.5])
+    assert snapshot.counts == array.array('q', [1, 2, 3])
+
+    YAML(typ='safe').dump({"counts": [1.5]}, settings_path)
+    with pytest.raises(ValueError):
+        process_settings_file(CalibrationParameters, str(settings_path))
+
+
+def test_sidecar_files(tmp_path):
+    settings_path = tmp_path / "calibration.yaml"
+    process_arguments(CalibrationParameters, "Calibration.",
+                      argv=[f"--settings_file={settings_path}", "--save_settings", "--counts", "1", "2", "3", "4", "5",
+                            "--offsets", "0.25"])
+    saved = YAML(typ='safe').load(settings_path)
+    sidecar_name = "calibration.counts.i64"
+    assert saved["counts"] == sidecar_reference_prefix + sidecar_name
+    assert saved["offsets"] == [0.25]
+    assert os.path.getsize(tmp_path / sidecar_name) == 5 * 8
+
+    snapshot = process_settings_file(CalibrationParameters, str(settings_path), as_snapshot=True)
+    assert snapshot.counts == array.array('q', [1, 2, 3, 4, 5])
+    snapshot = process_arguments(CalibrationParameters, "Calibration.", argv=[f"--settings_file={settings_path}"],
+                                 as_snapshot=True)
+    assert snapshot.counts == array.array('q', [1, 2, 3, 4, 5])
+
+    # below the threshold, values are saved inline again
+    process_arguments(CalibrationParameters, "Calibration.",
+                      argv=[f"--settings_file={settings_path}", "--save_settings", "--counts", "7"])
+    assert YAML(typ='safe').load(settings_path)["counts"] == [7]
+
+
+def test_arrays_saved_as_lists(tmp_path):
+    defaults_path = tmp_path / "defaults.yaml"
+    save_defaults(CalibrationParameters, str(defaults_path))
+    assert YAML(typ='safe').load(defaults_path)["counts"] == [1, 2, 3]
+
+    process_arguments(CalibrationParameters, "Calibration.", argv=["--offsets", "2.0", "3.0"])
+    dump_path = tmp_path / "dump.yaml"
+    dump(CalibrationParameters, dump_path)
+    assert YAML(typ='safe').load(dump_path)["offsets"] == [2.0, 3.0]
+
+
+def test_numpy_storage(tmp_path):
+    numpy = pytest.importorskip("numpy")
+
+    class VectorParameters(ParameterEnum):
+        vector = Parameter(arg_type=float, default=[0.0], nargs='+', arg_help="Vector.", array_storage="numpy",
+                           sidecar_threshold=2)
+
+    settings_path = tmp_path / "vector.yaml"
+    process_arguments(VectorParameters, "Vector.",
+                      argv=[f"--settings_file={settings_path}", "--save_settings", "--vector", "1", "2", "3"])
+    assert isinstance(VectorParameters.vector.value, numpy.ndarray)
+    snapshot = process_settings_file(VectorParameters, str(settings_path), as_snapshot=True)
+    assert isinstance(snapshot.vector, numpy.memmap)
+    assert snapshot.vector.tolist() == [1.0, 2.0, 3.0]
+    assert values_equal(snapshot.vector, snapshot.vector.copy())
+
+
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_sidecar_files_in_included_settings(tmp_path, use_cache):
+    base_directory = tmp_path / "base"
+    base_directory.mkdir()
+    base_path = base_directory / "base.yaml"
+    process_arguments(CalibrationParameters, "Calibration.",
+                      argv=[f"--settings_file={base_path}", "--save_settings", "--counts", "1", "2", "3", "4"])
+    assert (base_directory / "base.counts.i64").exists()
+    top_path = tmp_path / "top.yaml"
+    YAML(typ='safe').dump({"include": "base/base.yaml", "offsets": [1.0]}, top_path)
+
+    # sidecar files are located relative to the file referring to them, not the top-level settings file
+    settings_cache = SettingsFileCache() if use_cache else None
+    for settings_files in (str(top_path), [str(base_path), str(top_path)]):
+        snapshot = process_settings_file(CalibrationParameters, settings_files, settings_cache=settings_cache,
+                                         as_snapshot=True)
+        assert snapshot.counts == array.array('q', [1, 2, 3, 4])
+        assert snapshot.offsets == array.array('d', [1.0])
+    snapshot = process_arguments(CalibrationParameters, "Calibration.", argv=[f"--settings_file={top_path}"],
+                                 settings_cache=settings_cache, as_snapshot=True)
+    assert snapshot.counts == array.array('q', [1, 2, 3, 4])
+
+
+def test_read_sidecar_file(tmp_path):
+    sidecar_path = tmp_path / "values.i64"
+    parameter = CalibrationParameters.counts.parameter
+    write_sidecar_file(sidecar_path, array.array('q', [5, -6, 7]), parameter)
+    assert read_sidecar_file(sidecar_path, parameter) == array.array('q', [5, -6, 7])
+    sidecar_path.write_bytes(b"")
+    assert read_sidecar_file(sidecar_path, parameter) == array.array('q')
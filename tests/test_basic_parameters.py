@@ -126,6 +126,15 @@ def test_shorthand_parameters(description_string):
     assert Parameters.maximum_chunk_size.value == 12
 
 
+def test_help_output(description_string, capsys):
+    for single_pass in (False, True):
+        with pytest.raises(SystemExit):
+            process_arguments(Parameters, description_string, argv=["--help"], single_pass=single_pass)
+        help_output = capsys.readouterr().out
+        assert "Convert telemetry to videos" in help_output
+        assert "Save (or update) setting file." in help_output
+
+
 @pytest.fixture
 def data_dir():
     return os.path.join(pathlib.Path(__file__).parent.resolve(), "test_data")
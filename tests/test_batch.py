@@ -0,0 +1,49 @@
+import os
+
+import pytest
+
+from ext_argparse import process_settings_files
+
+from tests.common import HouseParameters, HouseStyle
+
+
+@pytest.fixture
+def settings_files(tmp_path):
+    paths = []
+    for i_file in range(10):
+        path = str(tmp_path / f"settings_{i_file:d}.yaml")
+        with open(path, 'w') as file:
+            file.write(f"year_built: {1900 + i_file:d}\nstyle: RANCH\n")
+        paths.append(path)
+    # a missing & a malformed file
+    paths.insert(3, str(tmp_path / "missing.yaml"))
+    malformed_path = str(tmp_path / "malformed.yaml")
+    with open(malformed_path, 'w') as file:
+        file.write("style: NOT_A_STYLE\n")
+    paths.insert(7, malformed_path)
+    return paths
+
+
+def check_results(results, paths):
+    assert [result.path for result in results] == paths
+    assert [result.index for result in results] == list(range(len(paths)))
+    failed_paths = [result.path for result in results if not result.succeeded]
+    assert [os.path.basename(path) for path in failed_paths] == ["missing.yaml", "malformed.yaml"]
+    year_values = [result.settings.year_built for result in results if result.succeeded]
+    assert year_values == [1900 + i_file for i_file in range(10)]
+    assert all(result.settings.style == HouseStyle.RANCH for result in results if result.succeeded)
+
+
+def test_process_settings_files_serial(settings_files):
+    results = list(process_settings_files(HouseParameters, settings_files))
+    check_results(results, settings_files)
+
+
+def test_process_settings_files_in_order(settings_files):
+    results = list(process_settings_files(HouseParameters, settings_files, workers=2, chunk_size=3))
+    check_results(results, settings_files)
+
+
+def test_process_settings_files_as_completed(settings_files):
+    results = list(process_settings_files(HouseParameters, settings_files, workers=2, ordered=False, chunk_size=3))
+    check_results(sorted(results, key=lambda result: result.index), settings_files)
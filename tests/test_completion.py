@@ -0,0 +1,54 @@
+import shutil
+import subprocess
+
+import pytest
+
+from ext_argparse import generate_bash_completion, generate_zsh_completion, generate_completion_script
+
+from tests.common import HouseParameters
+from tests.test_basic_parameters import Parameters
+
+
+def test_bash_completion_contents():
+    script = generate_bash_completion(Parameters, "optimizer")
+    assert "complete -o default -F _optimizer_completion optimizer" in script
+    option_line = [line for line in script.splitlines() if "COMPREPLY=($(compgen -W \"--" in line][0]
+    option_strings = option_line.split('"')[1].split()
+    for option_string in ("--tikhonov_term_enabled", "-tte", "--no-tikhonov_term_enabled", "-n-tte", "--rate",
+                          "--settings_file", "-sf", "--save_settings"):
+        assert option_string in option_strings
+    assert "person_in_charge" not in script
+
+    script = generate_bash_completion(HouseParameters, "house")
+    assert "--roof.roof_material|-r.rm)" in script
+    assert "compgen -W \"CRAFTSMAN_BUNGALO CAPE_COD RANCH" in script
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="requires bash")
+def test_bash_completion_in_shell(tmp_path):
+    script_path = tmp_path / "house.bash"
+    script_path.write_text(generate_completion_script(HouseParameters, "house", shell="bash"))
+    commands = f"""
+    source {script_path}
+    COMP_WORDS=(house --sty); COMP_CWORD=1; _house_completion; echo "${{COMPREPLY[*]}}"
+    COMP_WORDS=(house --style = QU); COMP_CWORD=3; _house_completion; echo "${{COMPREPLY[*]}}"
+    COMP_WORDS=(house -r.rm S); COMP_CWORD=2; _house_completion; echo "${{COMPREPLY[*]}}"
+    """
+    output = subprocess.run(["bash", "-c", commands], capture_output=True, text=True, check=True).stdout
+    assert output.splitlines() == ["--style", "QUEEN_ANNE",
+                                   "SLATE SOLAR SYNTHETIC_BARREL SYNTHETIC_SLATE SYNTHETIC_CEDAR"]
+
+
+def test_zsh_completion_contents():
+    script = generate_zsh_completion(HouseParameters, "house")
+    assert script.startswith("#compdef house\n")
+    assert "'--style=[Style of da house.]:style:(CRAFTSMAN_BUNGALO CAPE_COD RANCH" in script
+    assert "'--settings_file=[" in script and ":settings_file:_files'" in script
+    assert "'--save_settings[Save (or update) setting file.]'" in script
+
+    script = generate_zsh_completion(Parameters, "optimizer")
+    assert "'--no-analyze_only[" in script
+    assert "'1:person_in_charge: '" in script
+
+    with pytest.raises(ValueError):
+        generate_completion_script(HouseParameters, "house", shell="fish")
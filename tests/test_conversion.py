@@ -0,0 +1,92 @@
+import pickle
+
+import pytest
+
+from ext_argparse import process_arguments, process_settings_file, dump, Parameter, ParameterEnum, SettingsValueError
+from ext_argparse.conversion import compile_converter
+
+from tests.common import HouseParameters, HouseStyle
+
+
+class ListParameters(ParameterEnum):
+    sizes = Parameter(arg_type=int, default=[1], nargs='+', arg_help="Sizes.")
+    pair = Parameter(arg_type=float, default=[0.0, 1.0], nargs=2, arg_help="Pair.")
+    label = Parameter(arg_type=str, default=None, arg_help="Label.")
+
+
+def test_compile_converter():
+    convert_int = compile_converter(HouseParameters.year_built.parameter)
+    assert convert_int("1999") == 1999
+    assert convert_int(1999.0) == 1999
+    with pytest.raises(ValueError):
+        convert_int(1999.5)
+    with pytest.raises(ValueError):
+        convert_int(True)
+
+    convert_enum = compile_converter(HouseParameters.style.parameter)
+    assert convert_enum("RANCH") == "RANCH"
+    assert convert_enum(HouseStyle.RANCH) is HouseStyle.RANCH
+    with pytest.raises(ValueError):
+        convert_enum("IGLOO")
+
+    convert_sizes = compile_converter(ListParameters.sizes.parameter)
+    assert convert_sizes(["1", 2]) == [1, 2]
+    assert convert_sizes(3) == [3]
+    with pytest.raises(ValueError):
+        convert_sizes([])
+    with pytest.raises(ValueError):
+        compile_converter(ListParameters.pair.parameter)([1.0])
+
+    convert_label = compile_converter(ListParameters.label.parameter)
+    assert convert_label(None) is None
+    assert convert_label(5) == "5"
+    assert convert_label(1.5) == "1.5"
+
+    # null is accepted for any parameter, as it was before values were converted
+    assert convert_int(None) is None
+    assert convert_enum(None) is None
+    assert convert_sizes(None) is None
+
+
+def test_settings_file_null_values(tmp_path):
+    settings_path = tmp_path / "settings.yaml"
+    settings_path.write_text("year_built: null\nstyle: null\n")
+    snapshot = process_settings_file(HouseParameters, str(settings_path), as_snapshot=True)
+    assert snapshot.year_built is None
+    assert snapshot.style is None
+    snapshot = process_arguments(HouseParameters, "Parameters of the house to repair.",
+                                 argv=[f"--settings_file={settings_path}"], as_snapshot=True)
+    assert snapshot.year_built is None
+
+    # a null enum value survives a round trip through dump
+    process_settings_file(HouseParameters, str(settings_path))
+    dumped_path = tmp_path / "dumped.yaml"
+    dump(HouseParameters, dumped_path)
+    process_arguments(HouseParameters, "Parameters of the house to repair.", argv=[])
+    snapshot = process_settings_file(HouseParameters, str(dumped_path), as_snapshot=True)
+    assert snapshot.style is None
+    assert snapshot.year_built is None
+
+
+def test_settings_file_values_converted(tmp_path):
+    settings_path = tmp_path / "settings.yaml"
+    settings_path.write_text("sturdiness: '4.5'\nyear_built: '1965'\nroof:\n    year_changed: 1995.0\n")
+    snapshot = process_settings_file(HouseParameters, str(settings_path), as_snapshot=True)
+    assert snapshot.sturdiness == 4.5
+    assert snapshot.year_built == 1965
+    assert isinstance(snapshot.roof.year_changed, int)
+
+
+def test_settings_file_errors_reported_together(tmp_path):
+    settings_path = tmp_path / "settings.yaml"
+    settings_path.write_text("sturdiness: very\nyear_built: [1965]\nroof:\n    roof_material: STRAW\nstyle: RANCH\n")
+    for process in (lambda: process_settings_file(HouseParameters, str(settings_path)),
+                    lambda: process_arguments(HouseParameters, "Parameters of the house to repair.",
+                                              argv=[f"--settings_file={settings_path}"])):
+        with pytest.raises(SettingsValueError) as error_info:
+            process()
+        assert [path for path, _ in error_info.value.errors] == ["sturdiness", "year_built", "roof.roof_material"]
+        assert str(settings_path) in str(error_info.value)
+
+    unpickled_error = pickle.loads(pickle.dumps(error_info.value))
+    assert unpickled_error.errors == error_info.value.errors
@@ -0,0 +1,63 @@
+import os
+
+import pytest
+
+from ext_argparse import process_arguments, process_settings_file, read_environment_values, \
+    environment_variable_name, Parameter, ParameterEnum
+
+from tests.common import HouseParameters, HouseStyle, RoofMaterial, test_data_dir
+
+
+class ListParameters(ParameterEnum):
+    sizes = Parameter(arg_type=int, default=[1], nargs='+', arg_help="Sizes.")
+    verbose = Parameter(arg_type='bool_flag', default=False, action='store_true', arg_help="Verbosity.")
+
+
+def test_environment_variable_name():
+    assert environment_variable_name("roof.year_changed", "HOUSE") == "HOUSE_ROOF__YEAR_CHANGED"
+    assert environment_variable_name("sturdiness", "") == "STURDINESS"
+
+
+def test_read_environment_values():
+    environment = {
+        "HOUSE_STURDINESS": "2.5",
+        "HOUSE_ROOF__ROOF_MATERIAL": "METAL",
+        "HOUSE_UNKNOWN": "1",
+        "OTHER_YEAR_BUILT": "1990",
+    }
+    values = read_environment_values(HouseParameters, "HOUSE", environment)
+    assert values == {"sturdiness": 2.5, "roof.roof_material": "METAL"}
+
+    values = read_environment_values(ListParameters, "", {"SIZES": "3 4  5", "VERBOSE": "yes"})
+    assert values == {"sizes": [3, 4, 5], "verbose": True}
+
+    with pytest.raises(ValueError):
+        read_environment_values(HouseParameters, "HOUSE", {"HOUSE_STYLE": "IGLOO"})
+    with pytest.raises(ValueError):
+        read_environment_values(HouseParameters, "HOUSE", {"HOUSE_YEAR_BUILT": "last year"})
+    with pytest.raises(ValueError):
+        read_environment_values(ListParameters, "", {"VERBOSE": "maybe"})
+
+
+def test_environment_between_settings_file_and_command_line(test_data_dir, monkeypatch):
+    settings_path = os.path.join(test_data_dir, "enum_settings2.yaml")
+    monkeypatch.setenv("HOUSE_YEAR_BUILT", "1977")
+    monkeypatch.setenv("HOUSE_STURDINESS", "9.5")
+    monkeypatch.setenv("HOUSE_ROOF__ROOF_MATERIAL", "CLAY")
+    snapshot = process_arguments(HouseParameters, "Parameters of the house to repair.",
+                                 argv=[f"--settings_file={settings_path}", "--sturdiness=3.0"],
+                                 as_snapshot=True, env_prefix="HOUSE")
+    assert snapshot.sturdiness == 3.0
+    assert snapshot.year_built == 1977
+    assert snapshot.roof.year_changed == 1995
+    assert snapshot.roof.roof_material == RoofMaterial.CLAY
+    assert snapshot.style == HouseStyle.QUEEN_ANNE
+
+    # environment is ignored unless a prefix is given
+    snapshot = process_arguments(HouseParameters, "Parameters of the house to repair.", argv=[], as_snapshot=True)
+    assert snapshot.year_built == 2000
+
+    snapshot = process_settings_file(HouseParameters, settings_path, as_snapshot=True, env_prefix="HOUSE")
+    assert snapshot.year_built == 1977
+    assert snapshot.sturdiness == 9.5
+    assert snapshot.roof.roof_material == RoofMaterial.CLAY
@@ -0,0 +1,80 @@
+import os
+
+import pytest
+
+from ext_argparse import process_arguments, Parameter, ParameterEnum
+from ext_argparse.argproc import ArgumentProcessor
+from ext_argparse.fast_parser import get_fast_parser
+
+from tests.common import HouseParameters, test_data_dir
+from tests.test_basic_parameters import Parameters
+from tests.test_nested_parameters import BaseLevelParams
+
+
+class ListParameters(ParameterEnum):
+    sizes = Parameter(arg_type=int, default=[1], nargs='+', arg_help="Sizes.")
+    names = Parameter(arg_type=str, default=None, nargs='*', arg_help="Names.")
+    label = Parameter(arg_type=str, default="unlabeled", arg_help="Label.")
+    threshold = Parameter(arg_type=float, default="0.5", arg_help="Threshold, with a string default.")
+    verbose = Parameter(arg_type='bool_flag', default=False, action='store_true', arg_help="Verbosity.")
+    inputs = Parameter(arg_type=str, default=None, nargs='*', positional=True, arg_help="Input files.")
+
+
+def parse_with_argparse(parameter_enum, argv):
+    processor = ArgumentProcessor(parameter_enum)
+    defaults = processor.generate_defaults_dict()
+    return processor.generate_single_pass_parser(defaults).parse_args(argv)
+
+
+def parse_fast(parameter_enum, argv):
+    defaults = ArgumentProcessor(parameter_enum).generate_defaults_dict()
+    return get_fast_parser(parameter_enum).parse_args(argv, defaults)
+
+
+@pytest.mark.parametrize("parameter_enum, argv", [
+    (Parameters, []),
+    (Parameters, ["Greg"]),
+    (Parameters, ["--rate", "0.5", "Greg", "--no-analyze_only", "-tte"]),
+    (Parameters, ["-op=output/lo", "--maximum_chunk_size=12", "Greg", "--output_path"]),
+    (Parameters, ["--settings_file", "settings.yaml", "-ss", "Greg"]),
+    (BaseLevelParams, ["--group_a.int_param=3", "-ga.fp", "2.5", "--group_d.group_c.path_param", "a/b"]),
+    (HouseParameters, ["--style", "RANCH", "-r.rm=CLAY", "-stu", "1"]),
+    (ListParameters, []),
+    (ListParameters, ["--sizes", "1", "2", "3", "--names", "--label=x"]),
+    (ListParameters, ["a.txt", "b.txt", "--names", "x", "y", "--verbose", "--no-verbose", "--threshold=2"]),
+    (ListParameters, ["--sizes=4", "--label", "", "a.txt"]),
+])
+def test_fast_parser_matches_argparse(parameter_enum, argv):
+    expected_namespace = parse_with_argparse(parameter_enum, argv)
+    namespace = parse_fast(parameter_enum, argv)
+    assert namespace == expected_namespace
+    assert list(vars(namespace).items()) == list(vars(expected_namespace).items())
+
+
+@pytest.mark.parametrize("parameter_enum, argv", [
+    (Parameters, ["Greg", "--help"]),
+    (Parameters, ["Greg", "--ra=0.5"]),  # abbreviation
+    (Parameters, ["Greg", "--rate=fast"]),  # invalid value
+    (Parameters, ["Greg", "--", "-x"]),
+    (Parameters, ["Greg", "--rate", "-0.5"]),
+    (Parameters, ["Greg", "--rate", "0.5", "Gandalf"]),  # several chunks of positionals
+    (Parameters, ["Greg", "--analyze_only=yes"]),
+    (ListParameters, ["--sizes"]),
+])
+def test_fast_parser_falls_back(parameter_enum, argv):
+    assert parse_fast(parameter_enum, argv) is None
+
+
+def test_process_arguments_fast_parse(test_data_dir):
+    settings_path = os.path.join(test_data_dir, "nested_settings.yaml")
+    argv = [f"--settings_file={settings_path}", "--group_d.group_a.float_param=0.5", "--int_param", "4"]
+    expected_snapshot = process_arguments(BaseLevelParams, "Test parameter parser", argv=argv, as_snapshot=True)
+    snapshot = process_arguments(BaseLevelParams, "Test parameter parser", argv=argv, as_snapshot=True,
+                                 fast_parse=True)
+    assert snapshot == expected_snapshot
+    assert snapshot.group_d.group_c.path_param == test_data_dir
+
+    # falls back to argparse for abbreviated options
+    snapshot = process_arguments(BaseLevelParams, "Test parameter parser", argv=argv + ["--string_p=Ankara"],
+                                 as_snapshot=True, fast_parse=True)
+    assert snapshot.string_param == "Ankara"
@@ -0,0 +1,72 @@
+import array
+import typing
+
+import pytest
+
+from ext_argparse import Parameter, ParameterEnum, create_settings_snapshot, compute_settings_fingerprint, \
+    canonicalize_settings
+
+from tests.common import HouseParameters, HouseStyle, RoofMaterial
+
+
+class OutputSettings(ParameterEnum):
+    directory = Parameter(arg_type=str, default="/tmp/output", arg_help="Output directory.",
+                          setting_file_location=True)
+    scales = Parameter(arg_type=float, default=[1.0, 0.5], nargs='+', arg_help="Scales.")
+
+
+class PipelineParameters(ParameterEnum):
+    iterations = Parameter(arg_type=int, default=10, arg_help="Iterations.")
+    verbose = Parameter(action='store_true', default=False, arg_help="Verbose output.", console_only=True)
+    output: typing.Type[OutputSettings] = OutputSettings
+
+
+def test_canonical_encoding():
+    snapshot = create_settings_snapshot(HouseParameters, {"sturdiness": 0.1 + 0.2, "style": HouseStyle.RANCH})
+    assert canonicalize_settings(snapshot).split("\n") == [
+        "roof.roof_material=\"SLATE\"", "roof.year_changed=2010", "sturdiness=0.30000000000000004",
+        "style=\"RANCH\"", "year_built=2000"
+    ]
+
+    # arrays & lists of the same numbers, as well as enum members & their names, are encoded the same way
+    list_snapshot = create_settings_snapshot(PipelineParameters, {"output.scales": [2.0, 3.0]})
+    array_snapshot = create_settings_snapshot(PipelineParameters, {"output.scales": array.array('d', [2.0, 3.0])})
+    assert canonicalize_settings(list_snapshot) == canonicalize_settings(array_snapshot)
+    assert compute_settings_fingerprint(list_snapshot) == compute_settings_fingerprint(array_snapshot)
+    assert canonicalize_settings(snapshot) == \
+        canonicalize_settings(create_settings_snapshot(HouseParameters, {"sturdiness": 0.1 + 0.2, "style": "RANCH"}))
+    assert canonicalize_settings(list_snapshot, exclude_console_only=True, exclude_setting_file_locations=True,
+                                 excluded_paths=["output.scales"]) == "iterations=10"
+
+
+def test_fingerprint_exclusions_and_groups():
+    snapshot = create_settings_snapshot(PipelineParameters, {})
+    fingerprint = compute_settings_fingerprint(snapshot)
+    assert len(fingerprint.hexdigest) == 64
+    assert fingerprint == compute_settings_fingerprint(create_settings_snapshot(PipelineParameters, {}))
+
+    moved = create_settings_snapshot(PipelineParameters, {"output.directory": "/elsewhere", "verbose": True})
+    assert compute_settings_fingerprint(moved) != fingerprint
+    assert compute_settings_fingerprint(moved, exclude_console_only=True, exclude_setting_file_locations=True) == \
+        compute_settings_fingerprint(snapshot, exclude_console_only=True, exclude_setting_file_locations=True)
+
+    changed_root = compute_settings_fingerprint(create_settings_snapshot(PipelineParameters, {"iterations": 11}))
+    assert changed_root.group_hexdigest("output") == fingerprint.group_hexdigest("output")
+    assert changed_root.group_hexdigest("") != fingerprint.group_hexdigest("")
+    with pytest.raises(KeyError):
+        fingerprint.group_hexdigest("no_such_group")
+
+
+def test_incremental_update():
+    snapshot = create_settings_snapshot(HouseParameters, {})
+    fingerprint = compute_settings_fingerprint(snapshot)
+    changed_values = {"roof.roof_material": RoofMaterial.METAL, "year_built": 1950}
+    changed_snapshot = create_settings_snapshot(HouseParameters, changed_values)
+
+    updated = fingerprint.update(changed_snapshot, changed_values.keys())
+    assert updated == compute_settings_fingerprint(changed_snapshot)
+    assert updated.group_hexdigest("roof") == compute_settings_fingerprint(changed_snapshot).group_hexdigest("roof")
+    assert updated != fingerprint
+    assert fingerprint.update({"year_built": 1950}, ["year_built"]).group_hexdigest("roof") == \
+        fingerprint.group_hexdigest("roof")
+    assert fingerprint.update(snapshot, []) is fingerprint
@@ -0,0 +1,163 @@
+import json
+
+import pytest
+
+from ext_argparse import process_arguments, process_settings_file, save_defaults, get_settings_file_format, \
+    Parameter, ParameterEnum
+from ext_argparse.formats import JsonSettingsFileFormat, TomlSettingsFileFormat, MarshalSettingsFileFormat, \
+    YamlSettingsFileFormat, SettingsFileFormat
+
+from ext_argparse.argproc import flatten_dict
+
+from tests.common import HouseParameters, HouseStyle, RoofMaterial
+from tests.test_nested_parameters import BaseLevelParams
+
+
+def test_format_selected_by_extension():
+    assert isinstance(get_settings_file_format("settings.json"), JsonSettingsFileFormat)
+    assert isinstance(get_settings_file_format("settings.TOML"), TomlSettingsFileFormat)
+    assert isinstance(get_settings_file_format("settings.marshal"), MarshalSettingsFileFormat)
+    assert isinstance(get_settings_file_format("settings.yml"), YamlSettingsFileFormat)
+    assert isinstance(get_settings_file_format("settings"), YamlSettingsFileFormat)
+
+
+@pytest.mark.parametrize("extension", [".json", ".toml", ".marshal", ".msgpack"])
+def test_settings_file_round_trip(extension, tmp_path):
+    if extension == ".toml":
+        try:
+            import tomllib  # noqa: F401
+        except ImportError:
+            pytest.importorskip("tomli")
+    elif extension == ".msgpack":
+        pytest.importorskip("msgpack")
+    settings_path = str(tmp_path / ("settings" + extension))
+    save_defaults(HouseParameters, settings_path)
+    process_arguments(HouseParameters, "Parameters of the house to repair.",
+                      argv=[f"--settings_file={settings_path}", "--save_settings", "--style=PRAIRIE",
+                            "--roof.roof_material=CLAY", "--sturdiness=2.5"])
+    process_arguments(HouseParameters, "Parameters of the house to repair.", argv=[])
+    process_settings_file(HouseParameters, settings_path)
+    assert HouseParameters.style.value == HouseStyle.PRAIRIE
+    assert HouseParameters.roof.roof_material.value == RoofMaterial.CLAY
+    assert HouseParameters.sturdiness.value == 2.5
+    assert HouseParameters.year_built.value == 2000
+
+
+def test_json_settings_file(tmp_path):
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text(json.dumps({"int_param": 3, "group_b": {"float_param": 2.5}}))
+    snapshot = process_settings_file(BaseLevelParams, str(settings_path), as_snapshot=True)
+    assert snapshot.int_param == 3
+    assert snapshot.group_b.float_param == 2.5
+    assert snapshot.group_a.float_param == 0.1
+
+
+def test_toml_writer_orders_tables_after_values():
+    contents = TomlSettingsFileFormat().dumps({"group": {"value": "a \"b\""}, "count": 3, "missing": None,
+                                               "ratio": float("inf"), "sizes": [1, 2]})
+    assert contents == 'count = 3\nratio = inf\nsizes = [1, 2]\n\n[group]\nvalue = "a \\"b\\""\n'
+
+
+class OptionalParameters(ParameterEnum):
+    output_path = Parameter(arg_type=str, default=None, arg_help="Output path.")
+    count = Parameter(arg_type=int, default=3, arg_help="Count.")
+
+
+def test_toml_leaves_out_none_values(tmp_path):
+    pytest.importorskip("tomli")
+    settings_path = tmp_path / "settings.toml"
+    save_defaults(OptionalParameters, str(settings_path))
+    assert settings_path.read_text() == "count = 3\n"
+    assert process_settings_file(OptionalParameters, str(settings_path), as_snapshot=True).output_path is None
+
+    # None values of parameters with other defaults can't be stored, they are read back as the defaults
+    settings_path.write_text(TomlSettingsFileFormat().dumps({"output_path": "out", "count": None}))
+    snapshot = process_settings_file(OptionalParameters, str(settings_path), as_snapshot=True)
+    assert snapshot.output_path == "out"
+    assert snapshot.count == 3
+
+
+def test_settings_file_format_is_abstract():
+    class IncompleteFormat(SettingsFileFormat):
+        def load(self, settings_file, round_trip=False):
+            return {}
+
+    with pytest.raises(TypeError):
+        IncompleteFormat()
+
+
+FILTERED_YAML = """\
+sturdiness: 2.5
+calibration:
+    table: [[1, 2], [3, 4]]
+    nested: {deeper: [{a: 1}, {b: 2}]}
+roof:
+    year_changed: 1999
+    unknown_entry: [1, 2, 3]
+year_built: {unexpected: mapping}
+style: PRAIRIE
+"""
+
+
+def test_yaml_load_filtered(tmp_path):
+    settings_path = tmp_path / "settings.yaml"
+    settings_path.write_text(FILTERED_YAML)
+    leaf_paths = {"sturdiness", "year_built", "style", "roof.year_changed", "roof.roof_material"}
+    group_paths = {"roof"}
+    expected_values = {"sturdiness": 2.5, "roof.year_changed": 1999, "style": "PRAIRIE"}
+    assert YamlSettingsFileFormat().load_filtered(settings_path, leaf_paths, group_paths) == expected_values
+
+    # the generic implementation (loading the whole file) yields the same result
+    json_path = tmp_path / "settings.json"
+    json_path.write_text(json.dumps(YamlSettingsFileFormat().load(settings_path)))
+    assert JsonSettingsFileFormat().load_filtered(json_path, leaf_paths, group_paths) == expected_values
+
+    # aliases are handled by falling back to loading the whole file
+    settings_path.write_text("base: &base 3.5\nsturdiness: *base\n")
+    assert YamlSettingsFileFormat().load_filtered(settings_path, leaf_paths, group_paths) == {"sturdiness": 3.5}
+    settings_path.write_text("")
+    assert YamlSettingsFileFormat().load_filtered(settings_path, leaf_paths, group_paths) == {}
+
+
+@pytest.mark.parametrize("contents", [
+    "base: &base {year_changed: 1, roof_material: METAL}\nroof: *base\n",
+    "base: &base 1999\nroof:\n    year_changed: *base\n",
+])
+def test_yaml_load_filtered_aliases(tmp_path, contents):
+    settings_path = tmp_path / "settings.yaml"
+    settings_path.write_text(contents)
+    leaf_paths = {"roof.year_changed", "roof.roof_material"}
+    full_values = {key: value for key, value in flatten_dict(YamlSettingsFileFormat().load(settings_path)).items()
+                   if key in leaf_paths}
+    assert YamlSettingsFileFormat().load_filtered(settings_path, leaf_paths, {"roof"}) == full_values
+
+
+@pytest.mark.parametrize("contents", [
+    "sturdiness: 1.0\nsturdiness: 2.0\n",
+    "roof:\n    year_changed: 1\n    'year_changed': 2\n",
+    "unknown: {a: 1, b: [{c: 1, c: 2}]}\nsturdiness: 1.0\n",
+    "sturdiness: {a: 1, a: 2}\n",
+    "sturdiness: 1.0\n---\nsturdiness: 2.0\n",
+    "unknown: {~: 1, null: 2}\nsturdiness: 1.0\n",
+    "unknown: {1: a, 0x1: b}\nsturdiness: 1.0\n",
+    "unknown: {1: a, true: b}\nsturdiness: 1.0\n",
+    "unknown: {a: 1, !!str a: 2}\nsturdiness: 1.0\n",
+    "unknown: {!custom a: 1}\nsturdiness: 1.0\n",
+])
+def test_yaml_load_filtered_rejects_what_full_load_rejects(tmp_path, contents):
+    settings_path = tmp_path / "settings.yaml"
+    settings_path.write_text(contents)
+    with pytest.raises(Exception) as full_load_error:
+        YamlSettingsFileFormat().load(settings_path)
+    with pytest.raises(type(full_load_error.value)):
+        YamlSettingsFileFormat().load_filtered(settings_path, {"sturdiness", "roof.year_changed"}, {"roof"})
+
+
+def test_process_settings_file_skips_unknown_entries(tmp_path):
+    settings_path = tmp_path / "settings.yaml"
+    settings_path.write_text(FILTERED_YAML.replace("year_built: {unexpected: mapping}\n", ""))
+    snapshot = process_settings_file(HouseParameters, str(settings_path), as_snapshot=True)
+    assert snapshot.sturdiness == 2.5
+    assert snapshot.roof.year_changed == 1999
+    assert snapshot.style == HouseStyle.PRAIRIE
+    assert snapshot.year_built == 2000
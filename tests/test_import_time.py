@@ -0,0 +1,67 @@
+import os
+import pathlib
+import subprocess
+import sys
+import time
+
+# modules that account for most of the import time & that a plain `import ext_argparse` must not load
+HEAVY_MODULES = ("argparse", "ruamel.yaml", "textwrap", "json", "hashlib", "concurrent.futures", "ext_argparse.argproc",
+                 "ext_argparse.schema", "ext_argparse.settings_cache", "ext_argparse.formats")
+
+# generous upper bound on how much longer than a bare interpreter start-up a plain `import ext_argparse` may take
+# (it's ~20 ms on a typical machine without ruamel.yaml & argparse, versus ~100 ms with them), compared as the best of
+# several runs, so that the check doesn't flake on loaded machines
+IMPORT_TIME_BUDGET_SECONDS = 0.25
+IMPORT_TIME_RUN_COUNT = 5
+
+REPOSITORY_ROOT = str(pathlib.Path(__file__).parent.parent.resolve())
+
+
+def run_in_fresh_interpreter(code: str) -> str:
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = REPOSITORY_ROOT + os.pathsep + environment.get("PYTHONPATH", "")
+    return subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True,
+                          env=environment, cwd=REPOSITORY_ROOT).stdout
+
+
+def measure_best_run_time(code: str) -> float:
+    best_time = float("inf")
+    for _ in range(IMPORT_TIME_RUN_COUNT):
+        start = time.perf_counter()
+        run_in_fresh_interpreter(code)
+        best_time = min(best_time, time.perf_counter() - start)
+    return best_time
+
+
+def test_import_does_not_load_heavy_modules():
+    output = run_in_fresh_interpreter(
+        "import sys\n"
+        "from ext_argparse import ParameterEnum, Parameter\n"
+        "class Parameters(ParameterEnum):\n"
+        "    height = Parameter(default=1.12, arg_type=float)\n"
+        "print(' '.join(name for name in ('argparse', 'ruamel.yaml', 'ext_argparse.argproc') if name in sys.modules))\n"
+    )
+    assert output.strip() == ""
+
+
+def test_lazy_attributes_resolve():
+    output = run_in_fresh_interpreter(
+        "import ext_argparse\n"
+        "from ext_argparse.argproc import process_arguments\n"
+        "print(ext_argparse.process_arguments is process_arguments)\n"
+    )
+    assert output.strip() == "True"
+
+
+def test_plain_import_loads_no_heavy_modules():
+    output = run_in_fresh_interpreter(
+        "import sys\n"
+        "import ext_argparse\n"
+        f"print(' '.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))\n"
+    )
+    assert output.strip() == ""
+
+
+def test_import_time_budget():
+    import_time = measure_best_run_time("import ext_argparse") - measure_best_run_time("pass")
+    assert import_time < IMPORT_TIME_BUDGET_SECONDS
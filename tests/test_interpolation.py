@@ -0,0 +1,115 @@
+import os
+
+import pytest
+from ruamel.yaml import YAML
+
+from ext_argparse import process_arguments, process_settings_file, Parameter, ParameterEnum
+from ext_argparse.interpolation import resolve_interpolations, compile_template, InterpolationError
+from ext_argparse.schema import compile_schema
+
+
+class OutputParameters(ParameterEnum):
+    root = Parameter(arg_type=str, default="/data", arg_help="Root directory.", setting_file_location=True)
+    name = Parameter(arg_type=str, default="experiment", arg_help="Experiment name.")
+    directory = Parameter(arg_type=str, default="${output.root}/${output.name}", arg_help="Output directory.")
+
+
+class ExperimentParameters(ParameterEnum):
+    output = OutputParameters
+    seed = Parameter(arg_type=int, default=7, arg_help="Random seed.")
+    log_seed = Parameter(arg_type=int, default="${seed}", arg_help="Seed for the log.")
+    label = Parameter(arg_type=str, default="run_${seed}", arg_help="Run label.")
+    inputs = Parameter(arg_type=str, default=["${output.directory}/a"], nargs='+', arg_help="Inputs.")
+
+
+def test_compile_template():
+    template = compile_template("${a.b}/x_${env:HOME}$${literal}")
+    assert len(template.parts) == 4
+    assert template.parts[3] == "${literal}"
+    assert not template.is_single_reference
+    assert compile_template("${a.b}").is_single_reference
+    assert compile_template("${a.b}") is compile_template("${a.b}")
+
+
+def test_resolve_interpolations():
+    schema = compile_schema(ExperimentParameters)
+    values = schema.generate_defaults_dict()
+    resolved = resolve_interpolations(schema, values)
+    assert resolved == {"output.directory": "/data/experiment", "log_seed": 7, "label": "run_7",
+                        "inputs": ["/data/experiment/a"]}
+
+    values["output.name"] = "${env:EXPERIMENT_NAME}"
+    values["output.root"] = Parameter.setting_file_location_wildcard
+    resolved = resolve_interpolations(schema, values, "/settings/experiment.yaml", {"EXPERIMENT_NAME": "e1"})
+    assert resolved["output.directory"] == "/settings/e1"
+    assert resolved["output.root"] == "/settings"
+
+    # without a settings file, the legacy wildcard is left as is
+    values["output.name"] = "e2"
+    resolved = resolve_interpolations(schema, values)
+    assert resolved["output.directory"] == Parameter.setting_file_location_wildcard + "/e2"
+    with pytest.raises(InterpolationError):
+        resolve_interpolations(schema, dict(values, label="${settings_file_location}"))
+
+
+def test_resolve_interpolations_errors():
+    schema = compile_schema(ExperimentParameters)
+    values = schema.generate_defaults_dict()
+    with pytest.raises(InterpolationError, match="output.name -> output.directory -> output.name"):
+        resolve_interpolations(schema, dict(values, **{"output.name": "${output.directory}"}))
+    with pytest.raises(InterpolationError, match="not set"):
+        resolve_interpolations(schema, dict(values, label="${env:UNSET_VARIABLE}"), environment={})
+    with pytest.raises(ValueError, match="log_seed"):
+        resolve_interpolations(schema, dict(values, log_seed="${label}"))
+
+
+class CommandParameters(ParameterEnum):
+    command = Parameter(arg_type=str, default="echo ${HOME}", arg_help="Command to run.")
+    log = Parameter(arg_type=str, default="${command} > ${LOG_FILE}", arg_help="Logged command.")
+
+
+def test_unknown_references_kept_literally(tmp_path):
+    # values that used ${...} before references were supported keep their meaning
+    snapshot = process_arguments(CommandParameters, "Runs a command.", argv=[], as_snapshot=True)
+    assert snapshot.command == "echo ${HOME}"
+    assert snapshot.log == "echo ${HOME} > ${LOG_FILE}"
+
+    settings_path = tmp_path / "command.yaml"
+    settings_path.write_text("command: ls ${PWD} $${HOME}\n")
+    snapshot = process_settings_file(CommandParameters, str(settings_path), as_snapshot=True)
+    assert snapshot.command == "ls ${PWD} ${HOME}"
+    assert snapshot.log == "ls ${PWD} ${HOME} > ${LOG_FILE}"
+
+
+def test_interpolation_consistent_between_processing_functions(tmp_path):
+    settings_path = tmp_path / "experiment.yaml"
+    YAML(typ='safe').dump({"output": {"root": Parameter.setting_file_location_wildcard, "name": "from_file"},
+                           "seed": 11, "log_seed": "${seed}"}, settings_path)
+    settings_directory = os.path.dirname(str(settings_path))
+
+    snapshot = process_settings_file(ExperimentParameters, str(settings_path), as_snapshot=True)
+    assert snapshot.output.directory == settings_directory + "/from_file"
+    assert snapshot.log_seed == 11
+
+    snapshot_from_arguments = process_arguments(ExperimentParameters, "Experiment.",
+                                                argv=[f"--settings_file={settings_path}"], as_snapshot=True)
+    assert snapshot_from_arguments == snapshot
+
+    # references in the settings file follow values from the command line
+    snapshot = process_arguments(ExperimentParameters, "Experiment.",
+                                 argv=[f"--settings_file={settings_path}", "--seed=3", "--output.name=cli"],
+                                 as_snapshot=True)
+    assert snapshot.log_seed == 3
+    assert snapshot.label == "run_3"
+    assert snapshot.output.directory == settings_directory + "/cli"
+
+
+def test_save_settings_keeps_references(tmp_path):
+    settings_path = tmp_path / "experiment.yaml"
+    process_arguments(ExperimentParameters, "Experiment.",
+                      argv=[f"--settings_file={settings_path}", "--save_settings", "--seed=5"])
+    assert ExperimentParameters.log_seed.value == 5
+    assert ExperimentParameters.output.directory.value == "/data/experiment"
+    saved = YAML(typ='safe').load(settings_path)
+    assert saved["log_seed"] == "${seed}"
+    assert saved["output"]["directory"] == "${output.root}/${output.name}"
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import pytest
+from ruamel.yaml import YAML
+
+from ext_argparse import process_settings_file, process_arguments, SettingsFileCache
+
+from tests.common import HouseParameters, HouseStyle, RoofMaterial
+
+
+def write_settings(path, settings):
+    YAML(typ='safe').dump(settings, Path(path))
+    return str(path)
+
+
+@pytest.fixture
+def layer_files(tmp_path):
+    base_path = write_settings(tmp_path / "base.yaml", {"year_built": 1950, "sturdiness": 2.0, "style": "RANCH",
+                                                        "roof": {"year_changed": 1990, "roof_material": "SLATE"}})
+    site_path = write_settings(tmp_path / "site.yaml", {"sturdiness": 3.0, "roof": {"roof_material": "METAL"}})
+    experiment_path = write_settings(tmp_path / "experiment.yaml", {"style": "TUDOR_REVIVAL"})
+    return base_path, site_path, experiment_path
+
+
+def test_settings_layer_list(layer_files):
+    snapshot = process_settings_file(HouseParameters, list(layer_files), as_snapshot=True)
+    assert snapshot.year_built == 1950
+    assert snapshot.sturdiness == 3.0
+    assert snapshot.style == HouseStyle.TUDOR_REVIVAL
+    assert snapshot.roof.year_changed == 1990
+    assert snapshot.roof.roof_material == RoofMaterial.METAL
+
+
+def test_include_directive(layer_files, tmp_path):
+    base_path, site_path, experiment_path = layer_files
+    write_settings(site_path, {"include": "base.yaml", "sturdiness": 3.0, "roof": {"roof_material": "METAL"}})
+    top_path = write_settings(tmp_path / "top.yaml", {"include": ["site.yaml", "experiment.yaml"],
+                                                      "year_built": 2001})
+    snapshot = process_settings_file(HouseParameters, top_path, as_snapshot=True)
+    assert snapshot.year_built == 2001
+    assert snapshot.sturdiness == 3.0
+    assert snapshot.style == HouseStyle.TUDOR_REVIVAL
+    assert snapshot.roof.roof_material == RoofMaterial.METAL
+
+    snapshot_from_arguments = process_arguments(HouseParameters, "Parameters of the house to repair.",
+                                                argv=[f"--settings_file={top_path}"], as_snapshot=True)
+    assert snapshot_from_arguments == snapshot
+
+    write_settings(base_path, {"include": "top.yaml"})
+    with pytest.raises(ValueError, match="include each other"):
+        process_settings_file(HouseParameters, top_path, as_snapshot=True)
+    write_settings(base_path, {"include": "missing.yaml"})
+    with pytest.raises(ValueError, match="not found"):
+        process_settings_file(HouseParameters, top_path, as_snapshot=True)
+
+
+def test_settings_layer_cache(layer_files):
+    base_path, site_path, experiment_path = layer_files
+    cache = SettingsFileCache()
+    process_settings_file(HouseParameters, list(layer_files), settings_cache=cache)
+    assert cache.miss_count == 3
+
+    write_settings(experiment_path, {"style": "CAPE_COD", "year_built": 1999})
+    snapshot = process_settings_file(HouseParameters, list(layer_files), settings_cache=cache, as_snapshot=True)
+    # only the top layer is parsed again & merged onto the cached merge of the lower layers
+    assert cache.miss_count == 4
+    assert cache.merged_prefix_hit_count == 1
+    assert snapshot.style == HouseStyle.CAPE_COD
+    assert snapshot.year_built == 1999
+    assert snapshot.sturdiness == 3.0
+
+    process_settings_file(HouseParameters, list(layer_files), settings_cache=cache)
+    assert cache.miss_count == 4
+    assert cache.merged_prefix_hit_count == 2
@@ -153,3 +153,31 @@ def test_nested_parameter_save_load():
         f"--settings_file={output_settings_path}"
     ])
     assert BaseLevelParams.int_param.value == 1
+
+
+def test_single_pass_nested_parameters():
+    test_data_dir = os.path.join(pathlib.Path(__file__).parent.resolve(), "test_data")
+    settings_path = os.path.join(test_data_dir, "nested_settings.yaml")
+    two_pass_args = process_arguments(BaseLevelParams, "Test parameter parser", argv=[
+        f"--settings_file={settings_path}",
+        "-gd.ga.fp=0.5",
+        "--group_c.string_param=Byzantium"
+    ])
+    single_pass_args = process_arguments(BaseLevelParams, "Test parameter parser", argv=[
+        "-sf", settings_path,
+        "-gd.ga.fp=0.5",
+        "--group_c.string_param=Byzantium"
+    ], single_pass=True)
+    assert vars(two_pass_args) == vars(single_pass_args)
+    assert BaseLevelParams.int_param.value == 1
+    assert BaseLevelParams.group_d.group_a.float_param.value == 0.5
+    assert BaseLevelParams.group_c.string_param.value == "Byzantium"
+    assert BaseLevelParams.group_d.group_c.path_param.value == test_data_dir
+
+    # abbreviated settings file option is missed by the pre-scan, but still handled
+    abbreviated_args = process_arguments(BaseLevelParams, "Test parameter parser", argv=[
+        f"--settings={settings_path}",
+        "-gd.ga.fp=0.5",
+        "--group_c.string_param=Byzantium"
+    ], single_pass=True)
+    assert vars(abbreviated_args) == vars(single_pass_args)
@@ -0,0 +1,33 @@
+import pytest
+
+from ext_argparse import Parameter
+
+from tests.common import RoofMaterial
+
+
+def test_parameter_has_no_instance_dict():
+    parameter = Parameter(arg_type=int, default=3)
+    assert not hasattr(parameter, "__dict__")
+    with pytest.raises(AttributeError):
+        parameter.unknown_attribute = 5
+
+
+def test_parameter_help():
+    assert Parameter(arg_type=int, arg_help="Plain.").help == "Plain."
+    assert Parameter(arg_type=str, arg_help="A path.", setting_file_location=True).help.startswith(
+        "A path.| If set to '!settings_file_location'")
+    enum_parameter = Parameter(arg_type=RoofMaterial, default=RoofMaterial.SLATE, arg_help="Material.")
+    assert enum_parameter.raw_help == "Material."
+    assert enum_parameter.help.startswith("Material.| Can be set to one of: ['SLATE', 'METAL', ")
+    enum_parameter.help = "Custom."
+    assert enum_parameter.help == "Custom."
+
+
+def test_parameter_help_comment_memoized():
+    parameter = Parameter(arg_type=int, arg_help="A rather long description that will need to be wrapped.")
+    help_comment = parameter.get_help_comment(20)
+    assert help_comment == "A rather long\ndescription that\nwill need to be\nwrapped."
+    assert parameter.get_help_comment(20) is help_comment
+    assert parameter.get_help_comment(None) == parameter.help
+    parameter.help = "Short."
+    assert parameter.get_help_comment(20) == "Short."
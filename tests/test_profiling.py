@@ -0,0 +1,72 @@
+import os
+import shutil
+
+from ext_argparse import process_arguments, process_settings_file, ProcessingStats, add_stats_callback, \
+    remove_stats_callback, SettingsFileCache
+from ext_argparse.profiling import start_recording, null_recorder
+
+from tests.common import HouseParameters, test_data_dir
+
+
+def test_process_settings_file_stats(test_data_dir):
+    settings_path = os.path.join(test_data_dir, "enum_settings2.yaml")
+    stats = ProcessingStats()
+    process_settings_file(HouseParameters, settings_path, stats=stats)
+    assert stats.operation == "process_settings_file"
+    assert list(stats.phase_durations.keys()) == ["schema", "settings_load", "interpolation", "store_values"]
+    assert all(duration >= 0.0 for duration in stats.phase_durations.values())
+    assert stats.total_duration == sum(stats.phase_durations.values())
+    assert stats.parameter_count == 5
+    assert stats.loaded_key_count > 0
+    assert stats.bytes_read == os.path.getsize(settings_path)
+    assert stats.bytes_written == 0
+
+    # files served from the cache aren't read
+    cache = SettingsFileCache()
+    process_settings_file(HouseParameters, settings_path, settings_cache=cache)
+    stats = ProcessingStats()
+    process_settings_file(HouseParameters, settings_path, settings_cache=cache, stats=stats)
+    assert stats.bytes_read == 0
+    assert stats.loaded_key_count > 0
+
+
+def test_process_arguments_stats(test_data_dir, tmp_path):
+    settings_path = str(tmp_path / "settings.yaml")
+    shutil.copy(os.path.join(test_data_dir, "enum_settings2.yaml"), settings_path)
+    original_size = os.path.getsize(settings_path)
+    stats = ProcessingStats()
+    process_arguments(HouseParameters, "Parameters of the house to repair.",
+                      argv=[f"--settings_file={settings_path}", "--save_settings", "--year_built=1911"], stats=stats)
+    assert stats.operation == "process_arguments"
+    assert {"schema", "parser_build", "parse", "settings_load", "interpolation", "store_values", "save"} \
+        == set(stats.phase_durations.keys())
+    assert stats.bytes_read == original_size
+    assert stats.bytes_written == os.path.getsize(settings_path)
+
+
+def test_stats_callback(test_data_dir):
+    settings_path = os.path.join(test_data_dir, "enum_settings2.yaml")
+    received_stats = []
+    add_stats_callback(received_stats.append)
+    try:
+        process_settings_file(HouseParameters, settings_path)
+        process_arguments(HouseParameters, "Parameters of the house to repair.", argv=[], single_pass=True)
+    finally:
+        remove_stats_callback(received_stats.append)
+    assert [stats.operation for stats in received_stats] == ["process_settings_file", "process_arguments"]
+    assert start_recording("process_settings_file", None) is null_recorder
+
+
+def test_single_pass_fallback_stats(test_data_dir):
+    default_settings_path = os.path.join(test_data_dir, "enum_settings.yaml")
+    settings_path = os.path.join(test_data_dir, "enum_settings2.yaml")
+    stats = ProcessingStats()
+    # the abbreviated settings file option is missed by the pre-scan, so processing is redone in two passes
+    process_arguments(HouseParameters, "Parameters of the house to repair.",
+                      default_settings_file=default_settings_path, argv=[f"--settings={settings_path}"],
+                      single_pass=True, stats=stats)
+    assert HouseParameters.year_built.value == 1965
+    assert list(stats.phase_durations.keys())[0] == "single_pass_fallback"
+    assert stats.phase_durations["single_pass_fallback"] > 0.0
+    assert stats.bytes_read == os.path.getsize(settings_path)
+    assert stats.loaded_key_count == 4
@@ -0,0 +1,89 @@
+import os
+import shutil
+import stat
+
+from ext_argparse import process_arguments, process_settings_file, save_defaults
+
+from tests.common import HouseParameters, HouseStyle, test_data_dir
+
+
+def read_lines(path):
+    with open(path, 'r') as file:
+        return file.readlines()
+
+
+def test_save_settings_without_changes_skips_write(test_data_dir, tmp_path):
+    settings_path = str(tmp_path / "settings.yaml")
+    shutil.copy(os.path.join(test_data_dir, "enum_settings2.yaml"), settings_path)
+    inode_before = os.stat(settings_path).st_ino
+    mtime_before = os.stat(settings_path).st_mtime_ns
+
+    process_arguments(HouseParameters, "Parameters of the house to repair.",
+                      argv=[f"--settings_file={settings_path}", "--save_settings", "--year_built=1965"])
+
+    assert os.stat(settings_path).st_ino == inode_before
+    assert os.stat(settings_path).st_mtime_ns == mtime_before
+
+
+def test_save_settings_changes_only_altered_values(test_data_dir, tmp_path):
+    settings_path = str(tmp_path / "settings.yaml")
+    shutil.copy(os.path.join(test_data_dir, "enum_settings2.yaml"), settings_path)
+    lines_before = read_lines(settings_path)
+
+    process_arguments(HouseParameters, "Parameters of the house to repair.",
+                      argv=[f"--settings_file={settings_path}", "--save_settings", "--style=RANCH"])
+
+    lines_after = read_lines(settings_path)
+    changed_lines = [(before, after) for before, after in zip(lines_before, lines_after) if before != after]
+    assert len(lines_before) == len(lines_after)
+    assert changed_lines == [("style: QUEEN_ANNE\n", "style: RANCH\n")]
+    # no temporary files are left behind
+    assert os.listdir(str(tmp_path)) == ["settings.yaml"]
+
+
+def test_save_settings_to_new_file(tmp_path):
+    settings_path = str(tmp_path / "new_settings.yaml")
+    process_arguments(HouseParameters, "Parameters of the house to repair.",
+                      argv=[f"--settings_file={settings_path}", "--save_settings", "--style=PRAIRIE"])
+    process_arguments(HouseParameters, "Parameters of the house to repair.", argv=[])
+    process_settings_file(HouseParameters, settings_path)
+    assert HouseParameters.style.value == HouseStyle.PRAIRIE
+    assert HouseParameters.year_built.value == 2000
+
+
+def test_new_files_get_default_permissions(tmp_path):
+    umask = os.umask(0o022)
+    try:
+        settings_path = str(tmp_path / "new_settings.yaml")
+        process_arguments(HouseParameters, "Parameters of the house to repair.",
+                          argv=[f"--settings_file={settings_path}", "--save_settings"])
+        assert stat.S_IMODE(os.stat(settings_path).st_mode) == 0o644
+        defaults_path = str(tmp_path / "defaults.yaml")
+        save_defaults(HouseParameters, defaults_path)
+        assert stat.S_IMODE(os.stat(defaults_path).st_mode) == 0o644
+
+        # existing files keep their permissions
+        os.chmod(settings_path, 0o600)
+        process_arguments(HouseParameters, "Parameters of the house to repair.",
+                          argv=[f"--settings_file={settings_path}", "--save_settings", "--year_built=1950"])
+        assert stat.S_IMODE(os.stat(settings_path).st_mode) == 0o600
+    finally:
+        os.umask(umask)
+
+
+def test_save_settings_through_symbolic_link(tmp_path):
+    target_directory = tmp_path / "shared"
+    target_directory.mkdir()
+    target_path = target_directory / "settings.yaml"
+    target_path.write_text("year_built: 1970\n")
+    link_path = tmp_path / "settings.yaml"
+    os.symlink(str(target_path), str(link_path))
+
+    process_arguments(HouseParameters, "Parameters of the house to repair.",
+                      argv=[f"--settings_file={link_path}", "--save_settings", "--year_built=1980"])
+    process_arguments(HouseParameters, "Parameters of the house to repair.", argv=[])
+    # the link is kept & the file it points to is updated
+    assert os.path.islink(str(link_path))
+    assert sorted(os.listdir(str(target_directory))) == ["settings.yaml"]
+    process_settings_file(HouseParameters, str(target_path))
+    assert HouseParameters.year_built.value == 1980
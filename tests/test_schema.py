@@ -0,0 +1,40 @@
+from ext_argparse.schema import compile_schema
+
+from tests.common import HouseParameters, HouseStyle, RoofMaterial
+from tests.test_nested_parameters import BaseLevelParams
+
+
+def test_schema_is_compiled_once_per_class():
+    assert compile_schema(HouseParameters) is compile_schema(HouseParameters)
+    assert compile_schema(HouseParameters.roof) is not compile_schema(HouseParameters)
+
+
+def test_schema_entries():
+    schema = compile_schema(HouseParameters)
+    assert [entry.path for entry in schema.entries] == \
+           ["sturdiness", "year_built", "roof.year_changed", "roof.roof_material", "style"]
+    assert schema.group_paths == ["roof"]
+    assert schema.entries_by_path["roof.roof_material"].member is HouseParameters.roof.roof_material
+    assert [entry.path for entry in schema.enum_entries] == ["roof.roof_material", "style"]
+    assert schema.entries_by_path["sturdiness"].shorthand == "stu"
+    assert schema.entries_by_path["roof.year_changed"].shorthand == "r.yc"
+
+
+def test_schema_defaults():
+    schema = compile_schema(HouseParameters)
+    assert schema.generate_defaults_dict() == {
+        "sturdiness": 5.0,
+        "year_built": 2000,
+        "roof.year_changed": 2010,
+        "roof.roof_material": RoofMaterial.SLATE,
+        "style": HouseStyle.CRAFTSMAN_BUNGALO
+    }
+    assert schema.generate_defaults_dict(convert_enums_to_strings=True)["style"] == "CRAFTSMAN_BUNGALO"
+    # returned dictionaries must be independent copies
+    schema.generate_defaults_dict()["sturdiness"] = 1.0
+    assert schema.generate_defaults_dict()["sturdiness"] == 5.0
+
+
+def test_schema_setting_file_location_paths():
+    schema = compile_schema(BaseLevelParams)
+    assert schema.setting_file_location_paths == {"group_d.group_c.path_param"}
@@ -0,0 +1,110 @@
+import marshal
+import os
+import pickle
+import shutil
+
+from ext_argparse import process_settings_file, process_arguments, SettingsFileCache
+
+from tests.common import HouseParameters, HouseStyle, test_data_dir
+
+
+def test_settings_cache_hits_and_misses(test_data_dir, tmp_path):
+    settings_path = str(tmp_path / "settings.yaml")
+    shutil.copy(os.path.join(test_data_dir, "enum_settings2.yaml"), settings_path)
+    cache = SettingsFileCache()
+
+    values = process_settings_file(HouseParameters, settings_path, settings_cache=cache)
+    assert (cache.hit_count, cache.miss_count) == (0, 1)
+    assert values["roof"]["year_changed"] == 1995
+    assert HouseParameters.style.value == HouseStyle.QUEEN_ANNE
+
+    process_settings_file(HouseParameters, settings_path, settings_cache=cache)
+    process_arguments(HouseParameters, "Parameters of the house to repair.",
+                      argv=[f"--settings_file={settings_path}"], settings_cache=cache)
+    assert (cache.hit_count, cache.miss_count) == (2, 1)
+    assert HouseParameters.year_built.value == 1965
+
+    # modifying the file invalidates the cached entry
+    with open(settings_path, 'r') as file:
+        contents = file.read()
+    with open(settings_path, 'w') as file:
+        file.write(contents.replace("sturdiness: 4.5", "sturdiness: 7.25"))
+    process_settings_file(HouseParameters, settings_path, settings_cache=cache)
+    assert (cache.hit_count, cache.miss_count) == (2, 2)
+    assert HouseParameters.sturdiness.value == 7.25
+
+
+def test_settings_cache_eviction(test_data_dir):
+    cache = SettingsFileCache(max_entry_count=1)
+    first_path = os.path.join(test_data_dir, "enum_settings2.yaml")
+    second_path = os.path.join(test_data_dir, "nested_settings.yaml")
+
+    def loader(path):
+        return {"path": path}
+
+    cache.load(first_path, loader)
+    cache.load(second_path, loader)
+    assert len(cache) == 1
+    assert cache.load(first_path, loader) == {"path": first_path}
+    assert (cache.hit_count, cache.miss_count) == (0, 3)
+
+
+def test_settings_cache_content_hash(test_data_dir, tmp_path):
+    settings_path = str(tmp_path / "settings.yaml")
+    shutil.copy(os.path.join(test_data_dir, "enum_settings2.yaml"), settings_path)
+    cache = SettingsFileCache(verify_content_hash=True)
+    process_settings_file(HouseParameters, settings_path, settings_cache=cache)
+    stat = os.stat(settings_path)
+
+    # same size & modification time, different contents
+    with open(settings_path, 'r') as file:
+        contents = file.read()
+    with open(settings_path, 'w') as file:
+        file.write(contents.replace("1965", "1966"))
+    os.utime(settings_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    process_settings_file(HouseParameters, settings_path, settings_cache=cache)
+    assert (cache.hit_count, cache.miss_count) == (0, 2)
+    assert HouseParameters.year_built.value == 1966
+
+
+def test_settings_cache_directory(test_data_dir, tmp_path):
+    settings_path = os.path.join(test_data_dir, "enum_settings2.yaml")
+    cache_directory = str(tmp_path / "cache")
+
+    first_cache = SettingsFileCache(cache_directory=cache_directory)
+    first_values = process_settings_file(HouseParameters, settings_path, settings_cache=first_cache)
+    assert first_cache.miss_count == 1
+
+    # a fresh cache (e.g. in another process) reuses the persisted result
+    second_cache = SettingsFileCache(cache_directory=cache_directory)
+    second_values = process_settings_file(HouseParameters, settings_path, settings_cache=second_cache)
+    assert (second_cache.disk_hit_count, second_cache.miss_count) == (1, 0)
+    assert first_values == second_values
+
+
+class _Exploit(object):
+    def __reduce__(self):
+        return exec, ("raise RuntimeError('pickle payload executed')",)
+
+
+def test_settings_cache_directory_rejects_foreign_files(test_data_dir, tmp_path):
+    settings_path = os.path.join(test_data_dir, "enum_settings2.yaml")
+    cache_directory = tmp_path / "cache"
+    process_settings_file(HouseParameters, settings_path,
+                          settings_cache=SettingsFileCache(cache_directory=str(cache_directory)))
+    key = os.path.abspath(settings_path)
+    stat = os.stat(settings_path)
+    for cache_file_path in cache_directory.iterdir():
+        # neither pickles nor marshalled code objects written by someone else are used
+        cache_file_path.write_bytes(pickle.dumps(_Exploit()))
+        cache = SettingsFileCache(cache_directory=str(cache_directory))
+        process_settings_file(HouseParameters, settings_path, settings_cache=cache)
+        assert (cache.disk_hit_count, cache.miss_count) == (0, 1)
+
+        cache_file_path.write_bytes(marshal.dumps((key, stat.st_mtime_ns, stat.st_size, None,
+                                                   {"year_built": _Exploit.__reduce__.__code__})))
+        cache = SettingsFileCache(cache_directory=str(cache_directory))
+        process_settings_file(HouseParameters, settings_path, settings_cache=cache)
+        assert (cache.disk_hit_count, cache.miss_count) == (0, 1)
+        assert HouseParameters.year_built.value == 1965
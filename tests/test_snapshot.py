@@ -0,0 +1,107 @@
+import os
+import pickle
+import threading
+
+import pytest
+
+from ext_argparse import process_arguments, process_settings_file, bind_settings, get_bound_settings, \
+    create_settings_snapshot, SettingsSnapshot
+
+from tests.common import HouseParameters, HouseStyle, RoofMaterial, test_data_dir
+from tests.test_nested_parameters import BaseLevelParams
+
+
+def test_snapshot_from_settings_file(test_data_dir):
+    process_arguments(HouseParameters, "Parameters of the house to repair.", argv=[])
+    settings_path = os.path.join(test_data_dir, "enum_settings2.yaml")
+    snapshot = process_settings_file(HouseParameters, settings_path, as_snapshot=True)
+
+    assert isinstance(snapshot, SettingsSnapshot)
+    assert snapshot.sturdiness == 4.5
+    assert snapshot.year_built == 1965
+    assert snapshot.roof.year_changed == 1995
+    assert snapshot.roof.roof_material == RoofMaterial.SLATE
+    assert snapshot.style == HouseStyle.QUEEN_ANNE
+    assert snapshot._get("roof.year_changed") == 1995
+    assert snapshot._to_dict()["roof"] == {"year_changed": 1995, "roof_material": RoofMaterial.SLATE}
+
+    # values stored in the enum itself are left untouched
+    assert HouseParameters.year_built.value == 2000
+
+
+def test_snapshot_from_arguments(test_data_dir):
+    settings_path = os.path.join(test_data_dir, "nested_settings.yaml")
+    process_arguments(BaseLevelParams, "Test parameter parser", argv=[])
+    snapshot = process_arguments(BaseLevelParams, "Test parameter parser", argv=[
+        f"--settings_file={settings_path}",
+        "--group_d.group_a.float_param=0.5"
+    ], as_snapshot=True)
+    assert snapshot.int_param == 1
+    assert snapshot.group_d.group_a.float_param == 0.5
+    assert snapshot.group_d.group_c.path_param == test_data_dir
+    assert BaseLevelParams.int_param.value == 8
+
+
+def test_snapshot_is_immutable():
+    snapshot = create_settings_snapshot(HouseParameters, {"sturdiness": 1.0})
+    assert snapshot.sturdiness == 1.0
+    assert snapshot.year_built == 2000
+    with pytest.raises(AttributeError):
+        snapshot.sturdiness = 2.0
+    with pytest.raises(AttributeError):
+        snapshot.roof.year_changed = 2.0
+    with pytest.raises(AttributeError):
+        snapshot.new_attribute = 2.0
+
+
+def test_snapshot_pickling():
+    snapshot = create_settings_snapshot(HouseParameters, {"style": HouseStyle.RANCH})
+    unpickled_snapshot = pickle.loads(pickle.dumps(snapshot))
+    assert unpickled_snapshot == snapshot
+    assert unpickled_snapshot.style == HouseStyle.RANCH
+
+
+def test_bind_settings():
+    process_arguments(HouseParameters, "Parameters of the house to repair.", argv=[])
+    snapshot = create_settings_snapshot(HouseParameters, {"year_built": 1900, "roof.year_changed": 1950})
+    assert get_bound_settings() is None
+    with bind_settings(snapshot):
+        assert get_bound_settings() is snapshot
+        assert HouseParameters.year_built.value == 1900
+        assert HouseParameters.roof.year_changed.value == 1950
+    assert get_bound_settings() is None
+    assert HouseParameters.year_built.value == 2000
+
+
+def test_bind_settings_per_thread():
+    process_arguments(HouseParameters, "Parameters of the house to repair.", argv=[])
+    snapshots = [create_settings_snapshot(HouseParameters, {"year_built": 1900 + i_thread}) for i_thread in range(8)]
+    barrier = threading.Barrier(len(snapshots))
+    observed_values = [None] * len(snapshots)
+
+    def work(i_thread):
+        with bind_settings(snapshots[i_thread]):
+            barrier.wait()
+            observed_values[i_thread] = HouseParameters.year_built.value
+
+    threads = [threading.Thread(target=work, args=(i_thread,)) for i_thread in range(len(snapshots))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert observed_values == [1900 + i_thread for i_thread in range(len(snapshots))]
+    assert HouseParameters.year_built.value == 2000
+
+
+def test_process_arguments_with_bound_settings():
+    process_arguments(HouseParameters, "Parameters of the house to repair.", argv=[])
+    snapshot = create_settings_snapshot(HouseParameters, {"year_built": 1900, "style": HouseStyle.PRAIRIE})
+    with bind_settings(snapshot):
+        process_arguments(HouseParameters, "Parameters of the house to repair.", argv=["--style=RANCH"])
+        # the bound snapshot still takes precedence, but the parsed arguments are stored as fully processed values
+        assert HouseParameters.style.value == HouseStyle.PRAIRIE
+        assert HouseParameters.style.argument == HouseStyle.RANCH
+        assert create_settings_snapshot(HouseParameters).year_built == 2000
+    assert HouseParameters.style.value == HouseStyle.RANCH
+    process_arguments(HouseParameters, "Parameters of the house to repair.", argv=[])
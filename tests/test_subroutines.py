@@ -1,4 +1,10 @@
-from ext_argparse.argproc import unflatten_dict, flatten_dict
+import os
+
+from ruamel.yaml.comments import CommentedMap
+
+from ext_argparse.argproc import unflatten_dict, flatten_dict, ArgumentProcessor, load_settings_file, \
+    iter_flatten_dict, unflatten_items
+from tests.common import test_data_dir
 
 
 def test_unflatten_dict():
@@ -63,3 +69,37 @@ def test_flatten_dict():
     }
 
     assert flat_dict == ground_truth
+
+
+def test_prescan_settings_file_arguments():
+    assert ArgumentProcessor.prescan_settings_file_arguments([]) == (None, False)
+    assert ArgumentProcessor.prescan_settings_file_arguments(["--settings_file=a.yaml", "-ss"]) == ("a.yaml", True)
+    assert ArgumentProcessor.prescan_settings_file_arguments(["-x=1", "-sf", "b.yaml"]) == ("b.yaml", False)
+    assert ArgumentProcessor.prescan_settings_file_arguments(["-sf", "--save_settings"]) == (None, True)
+    assert ArgumentProcessor.prescan_settings_file_arguments(["--", "--settings_file=a.yaml"]) == (None, False)
+
+
+def test_is_help_requested():
+    assert ArgumentProcessor.is_help_requested(["--int_param=3", "-h"])
+    assert ArgumentProcessor.is_help_requested(["--hel"])
+    # combined single-character flags may include -h
+    assert ArgumentProcessor.is_help_requested(["-vh"])
+    assert ArgumentProcessor.is_help_requested(["-hb"])
+    assert not ArgumentProcessor.is_help_requested(["--height=3", "-b", "-1"])
+    assert not ArgumentProcessor.is_help_requested(["--", "--help"])
+
+
+def test_load_settings_file(test_data_dir):
+    settings_path = os.path.join(test_data_dir, "enum_settings2.yaml")
+    fast_settings = load_settings_file(settings_path)
+    round_trip_settings = load_settings_file(settings_path, round_trip=True)
+    assert type(fast_settings) == dict
+    assert isinstance(round_trip_settings, CommentedMap)
+    assert fast_settings == round_trip_settings
+
+
+def test_flatten_unflatten_streaming():
+    nested = {"a": {"b": {"c": 1, "d": [2, 3]}, "e": "f"}, "g": None, "h": {}}
+    flat_items = list(iter_flatten_dict(nested))
+    assert flat_items == [("a.b.c", 1), ("a.b.d", [2, 3]), ("a.e", "f"), ("g", None)]
+    assert unflatten_items(item for item in flat_items) == {"a": {"b": {"c": 1, "d": [2, 3]}, "e": "f"}, "g": None}
@@ -0,0 +1,86 @@
+import array
+import itertools
+import os
+import types
+
+import pytest
+
+from ext_argparse import expand_sweep, write_sweep, process_arguments, process_settings_file, SettingsValueError, \
+    Parameter, ParameterEnum
+
+from tests.common import HouseParameters, HouseStyle, RoofMaterial
+
+
+def test_grid_sweep():
+    configurations = expand_sweep(HouseParameters, {"year_built": range(1900, 1903),
+                                                    "roof.roof_material": ["METAL", RoofMaterial.CLAY]})
+    assert isinstance(configurations, types.GeneratorType)
+    configurations = list(configurations)
+    assert len(configurations) == 6
+    assert [(values["year_built"], values["roof.roof_material"]) for values in configurations] == \
+        list(itertools.product(range(1900, 1903), ["METAL", "CLAY"]))
+    assert all(values["sturdiness"] == 5.0 and values["style"] == "CRAFTSMAN_BUNGALO" for values in configurations)
+
+
+def test_zip_and_random_sweeps():
+    configurations = list(expand_sweep(HouseParameters, {"year_built": [1900, 1950], "sturdiness": ["1.5", 2]},
+                                       mode="zip"))
+    assert [(values["year_built"], values["sturdiness"]) for values in configurations] == [(1900, 1.5), (1950, 2.0)]
+    with pytest.raises(ValueError):
+        list(expand_sweep(HouseParameters, {"year_built": [1900, 1950], "sturdiness": [1.0]}, mode="zip"))
+
+    sweep_values = {"year_built": lambda generator: generator.randint(1800, 2000), "style": ["RANCH", "TOWNHOUSE"]}
+    configurations = list(expand_sweep(HouseParameters, sweep_values, mode="random", sample_count=20, seed=7))
+    assert len(configurations) == 20
+    assert all(1800 <= values["year_built"] <= 2000 for values in configurations)
+    assert {values["style"] for values in configurations} <= {"RANCH", "TOWNHOUSE"}
+    assert configurations == list(expand_sweep(HouseParameters, sweep_values, mode="random", sample_count=20, seed=7))
+
+
+def test_sweep_validation(tmp_path):
+    with pytest.raises(ValueError):
+        expand_sweep(HouseParameters, {"no_such_parameter": [1]}).__next__()
+    with pytest.raises(ValueError):
+        expand_sweep(HouseParameters, {"year_built": [1]}, mode="random").__next__()
+    with pytest.raises(SettingsValueError):
+        list(expand_sweep(HouseParameters, {"style": ["RANCH", "NOT_A_STYLE"]}))
+
+    base_path = tmp_path / "base.yaml"
+    base_path.write_text("sturdiness: 8.5\nunrelated: 1\n")
+    configurations = list(expand_sweep(HouseParameters, {"year_built": [1900]}, base_settings_file=str(base_path)))
+    assert configurations == [{"sturdiness": 8.5, "year_built": 1900, "roof.year_changed": 2010,
+                               "roof.roof_material": "SLATE", "style": "CRAFTSMAN_BUNGALO"}]
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_write_sweep(tmp_path, workers):
+    paths = write_sweep(HouseParameters, {"year_built": range(1900, 1910), "style": ["RANCH", "PRAIRIE"]},
+                        str(tmp_path / "sweep"), workers=workers, chunk_size=3)
+    assert paths == [os.path.join(str(tmp_path / "sweep"), f"sweep_{index:06d}.yaml") for index in range(20)]
+    snapshot = process_settings_file(HouseParameters, paths[-1], as_snapshot=True)
+    assert snapshot.year_built == 1909
+    assert snapshot.style == HouseStyle.PRAIRIE
+    assert snapshot.roof.roof_material == RoofMaterial.SLATE
+
+
+class SignalParameters(ParameterEnum):
+    gain = Parameter(arg_type=float, default=1.0, arg_help="Gain.")
+    samples = Parameter(arg_type=int, default=[0], nargs='+', arg_help="Samples.", array_storage="array",
+                        sidecar_threshold=3)
+
+
+def test_write_sweep_with_sidecar_files(tmp_path):
+    base_path = tmp_path / "base.yaml"
+    process_arguments(SignalParameters, "Signal.",
+                      argv=[f"--settings_file={base_path}", "--save_settings", "--samples", "1", "2", "3", "4"])
+    assert (tmp_path / "base.samples.i64").exists()
+
+    output_directory = tmp_path / "sweep"
+    paths = write_sweep(SignalParameters, {"gain": [0.5, 2.0]}, str(output_directory),
+                        base_settings_file=str(base_path))
+    assert len(paths) == 2
+    for gain, path in zip([0.5, 2.0], paths):
+        snapshot = process_settings_file(SignalParameters, path, as_snapshot=True)
+        assert snapshot.gain == gain
+        assert snapshot.samples == array.array('q', [1, 2, 3, 4])
+    assert os.path.exists(output_directory / "sweep_000000.samples.i64")
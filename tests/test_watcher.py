@@ -0,0 +1,91 @@
+import os
+import queue
+import shutil
+
+import pytest
+
+from ext_argparse import process_arguments, create_settings_snapshot, install_settings, \
+    get_installed_settings, SettingsFileWatcher
+
+from tests.common import HouseParameters, HouseStyle, test_data_dir
+
+
+@pytest.fixture
+def settings_path(test_data_dir, tmp_path):
+    path = str(tmp_path / "settings.yaml")
+    shutil.copy(os.path.join(test_data_dir, "enum_settings2.yaml"), path)
+    process_arguments(HouseParameters, "Parameters of the house to repair.", argv=[f"--settings_file={path}"])
+    yield path
+    process_arguments(HouseParameters, "Parameters of the house to repair.", argv=[])
+
+
+def replace_in_file(path: str, old: str, new: str):
+    with open(path, 'r') as file:
+        contents = file.read()
+    # write via a temporary file & rename, like many editors do
+    with open(path + ".tmp", 'w') as file:
+        file.write(contents.replace(old, new))
+    os.replace(path + ".tmp", path)
+
+
+def test_reload(settings_path):
+    watcher = SettingsFileWatcher(HouseParameters, settings_path)
+    changes = []
+    watcher.add_callback(lambda changed_paths, settings: changes.append((changed_paths, settings)))
+
+    assert watcher.reload() == []
+    replace_in_file(settings_path, "style: QUEEN_ANNE", "style: RANCH")
+    replace_in_file(settings_path, "year_changed: 1995", "year_changed: 2001")
+    assert watcher.reload() == ["roof.year_changed", "style"]
+
+    assert HouseParameters.style.value == HouseStyle.RANCH
+    assert HouseParameters.roof.year_changed.value == 2001
+    assert HouseParameters.year_built.value == 1965
+    assert watcher.settings.style == HouseStyle.RANCH
+    assert len(changes) == 1
+    assert changes[0][0] == ["roof.year_changed", "style"]
+    assert changes[0][1] is watcher.settings
+
+
+def test_reload_preserves_installed_settings(settings_path):
+    installed_settings = create_settings_snapshot(HouseParameters, {"year_built": 1800})
+    install_settings(installed_settings)
+    try:
+        watcher = SettingsFileWatcher(HouseParameters, settings_path)
+        replace_in_file(settings_path, "year_built: 1965", "year_built: 1970")
+        watcher.reload()
+        assert HouseParameters.year_built.value == 1800
+    finally:
+        install_settings(None)
+    assert HouseParameters.year_built.value == 1970
+
+
+def test_reload_keeps_overrides(settings_path):
+    process_arguments(HouseParameters, "Parameters of the house to repair.",
+                      argv=[f"--settings_file={settings_path}", "--year_built=1800"])
+    watcher = SettingsFileWatcher(HouseParameters, settings_path)
+    assert watcher.reload() == []
+    replace_in_file(settings_path, "year_built: 1965", "year_built: 1970")
+    replace_in_file(settings_path, "style: QUEEN_ANNE", "style: RANCH")
+    assert watcher.reload() == ["style"]
+    assert HouseParameters.year_built.value == 1800
+    assert HouseParameters.style.value == HouseStyle.RANCH
+    assert get_installed_settings() is None
+
+
+@pytest.mark.parametrize("use_inotify", [False, True])
+def test_watch(settings_path, use_inotify):
+    changes = queue.Queue()
+    with SettingsFileWatcher(HouseParameters, settings_path, debounce_interval=0.05, poll_interval=0.05,
+                             use_inotify=use_inotify) as watcher:
+        watcher.add_callback(lambda changed_paths, settings: changes.put(changed_paths))
+        replace_in_file(settings_path, "sturdiness: 4.5", "sturdiness: 9.5")
+        assert changes.get(timeout=5.0) == ["sturdiness"]
+        assert HouseParameters.sturdiness.value == 9.5
+
+        # malformed files are skipped, and the last good settings are retained
+        replace_in_file(settings_path, "style: QUEEN_ANNE", "style: [")
+        replace_in_file(settings_path, "style: [", "style: TOWNHOUSE")
+        assert changes.get(timeout=5.0) == ["style"]
+        assert HouseParameters.style.value == HouseStyle.TOWNHOUSE
+        assert HouseParameters.sturdiness.value == 9.5